@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Fleet Audit Benchmark
+
+Generates a synthetic fleet of python, nodejs and astro projects shaped
+after standards/project-structure.yaml and measures how fast the
+validators audit it: audits/sec, p50/p99 per-project latency, peak RSS
+and read/write syscalls per project (from /proc/self/io) in three modes:
+
+    single  in-process audit_one() with freshly loaded validators, no cache
+    fleet   audit_fleet()-style process pool, no cache
+    warm    in-process audits against a pre-populated AuditCache
+
+Results are written as JSON and can be compared against a stored
+baseline; a regression beyond --tolerance exits non-zero.
+
+Usage:
+    python3 benchmarks/fleet_bench.py --projects 1000
+    python3 benchmarks/fleet_bench.py --projects 10000 --output bench.json
+    python3 benchmarks/fleet_bench.py --baseline bench.json
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "validators"))
+
+from fleet_auditor import audit_one, discover_projects, load_validators  # noqa: E402
+
+SHAPES = ("python", "nodejs", "astro")
+MODES = ("single", "fleet", "warm")
+
+# Metrics where larger numbers are better; everything else regresses upward
+HIGHER_IS_BETTER = {"audits_per_sec"}
+
+PYPROJECT = """[project]
+name = "{name}"
+version = "0.1.0"
+description = "Synthetic benchmark project"
+dependencies = ["requests>=2.31"]
+
+[build-system]
+requires = ["hatchling"]
+build-backend = "hatchling.build"
+"""
+
+UV_LOCK = """version = 1
+revision = 2
+requires-python = ">=3.11"
+
+[[package]]
+name = "{name}"
+version = "0.1.0"
+source = {{ editable = "." }}
+dependencies = [
+    {{ name = "requests" }},
+]
+
+[package.metadata]
+requires-dist = [{{ name = "requests", specifier = ">=2.31" }}]
+
+[[package]]
+name = "requests"
+version = "2.32.3"
+source = {{ registry = "https://pypi.org/simple" }}
+"""
+
+AGENTS_MD_HEAD = """# {name} - Agent Instructions
+
+## UV-First Development Requirements
+> **MANDATORY**: This project is **UV-ONLY**.
+
+```bash
+uv pip install package-name
+uv run python -m {name}
+```
+
+## Project Overview
+"""
+
+
+# ---------------------------------------------------------------------------
+# Fleet generation
+# ---------------------------------------------------------------------------
+
+def agents_md(name: str, size: int, rng: random.Random) -> str:
+    """AGENTS.md padded with plausible prose to roughly `size` bytes"""
+    words = ("project", "build", "deploy", "uv", "run", "module", "config", "test",
+             "release", "branch", "workflow", "documentation", "source", "cache")
+    text = [AGENTS_MD_HEAD.format(name=name)]
+    length = len(text[0])
+    while length < size:
+        line = " ".join(rng.choice(words) for _ in range(12)) + ".\n"
+        text.append(line)
+        length += len(line)
+    return "".join(text)
+
+
+def write_project(path: Path, shape: str, agents_size: int, rng: random.Random):
+    """Create one project; about one in five has a standards violation"""
+    name = path.name
+    path.mkdir(parents=True)
+    (path / ".git").mkdir()
+    (path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+    (path / "src").mkdir()
+    (path / "README.md").write_text(f"# {name}\n\nSynthetic benchmark project.\n")
+    (path / "AGENTS.md").write_text(agents_md(name, agents_size, rng))
+    (path / ".gitignore").write_text(".venv/\n*.egg-info/\n__pycache__/\nnode_modules/\n")
+
+    if shape == "python":
+        (path / "pyproject.toml").write_text(PYPROJECT.format(name=name))
+        (path / ".venv").mkdir()
+        (path / "uv.lock").write_text(UV_LOCK.format(name=name))
+    else:
+        dependencies = {"astro": "^4.0.0"} if shape == "astro" else {"express": "^4.19.0"}
+        (path / "package.json").write_text(json.dumps({"name": name, "dependencies": dependencies}))
+        if shape == "astro":
+            (path / "astro.config.mjs").write_text("export default {};\n")
+
+    if rng.random() < 0.2:
+        violation = rng.choice(("requirements.txt", "setup.py", "README.md"))
+        if violation == "README.md":
+            (path / violation).unlink()
+        else:
+            (path / violation).write_text("")
+
+
+def generate_fleet(root: Path, count: int, agents_size: int = 4096, depth: int = 1,
+                   seed: int = 0) -> Path:
+    """Write `count` projects under root, nested `depth` group directories deep"""
+    rng = random.Random(seed)
+    per_group = 100
+    for index in range(count):
+        groups = [f"group-{(index // per_group ** (level + 1)) % per_group:02d}"
+                  for level in range(depth)]
+        project = root.joinpath(*groups, f"project-{index:05d}")
+        write_project(project, SHAPES[index % len(SHAPES)], agents_size, rng)
+    return root
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+def io_syscalls() -> int:
+    """read + write syscalls made by this process so far (Linux only)"""
+    try:
+        with open("/proc/self/io") as f:
+            counters = dict(line.split(":") for line in f.read().splitlines())
+        return int(counters["syscr"]) + int(counters["syscw"])
+    except (OSError, KeyError, ValueError):
+        return 0
+
+
+def peak_rss_kb(children: bool = False) -> int:
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    return resource.getrusage(who).ru_maxrss
+
+
+def percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(latencies_ms, syscalls, elapsed_s, rss_kb):
+    return {
+        "projects": len(latencies_ms),
+        "audits_per_sec": len(latencies_ms) / elapsed_s if elapsed_s else 0.0,
+        "p50_ms": statistics.median(latencies_ms) if latencies_ms else 0.0,
+        "p99_ms": percentile(latencies_ms, 0.99),
+        "peak_rss_kb": rss_kb,
+        "syscalls_per_project": syscalls / len(latencies_ms) if latencies_ms else 0.0,
+    }
+
+
+def timed_audits(projects, validators):
+    """Audit projects in-process, returning per-project latency and syscalls"""
+    latencies = []
+    syscalls_before = io_syscalls()
+    started = time.perf_counter()
+    for project in projects:
+        project_started = time.perf_counter()
+        audit_one(str(project), validators)
+        latencies.append((time.perf_counter() - project_started) * 1000)
+    elapsed = time.perf_counter() - started
+    return latencies, io_syscalls() - syscalls_before, elapsed
+
+
+def bench_single(projects):
+    latencies, syscalls, elapsed = timed_audits(projects, load_validators())
+    return summarize(latencies, syscalls, elapsed, peak_rss_kb())
+
+
+_worker_validators = None
+
+
+def _init_worker():
+    global _worker_validators
+    _worker_validators = load_validators()
+
+
+def _timed_worker_audit(project):
+    before = io_syscalls()
+    started = time.perf_counter()
+    audit_one(project, _worker_validators)
+    return (time.perf_counter() - started) * 1000, io_syscalls() - before
+
+
+def bench_fleet(projects, workers):
+    latencies = []
+    syscalls = 0
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = [pool.submit(_timed_worker_audit, str(project)) for project in projects]
+        for future in as_completed(futures):
+            latency, calls = future.result()
+            latencies.append(latency)
+            syscalls += calls
+    elapsed = time.perf_counter() - started
+    return summarize(latencies, syscalls, elapsed, peak_rss_kb(children=True))
+
+
+def bench_warm(projects, cache_dir: Path):
+    cache_path = cache_dir / "bench-cache.sqlite3"
+    # First pass populates the cache; only the second pass is measured
+    timed_audits(projects, load_validators(cache_path=cache_path))
+    latencies, syscalls, elapsed = timed_audits(projects, load_validators(cache_path=cache_path))
+    return summarize(latencies, syscalls, elapsed, peak_rss_kb())
+
+
+# ---------------------------------------------------------------------------
+# Baseline comparison
+# ---------------------------------------------------------------------------
+
+def compare(report, baseline, tolerance: float):
+    """Metrics that regressed by more than `tolerance` (a fraction)"""
+    regressions = []
+    for mode, metrics in report["results"].items():
+        previous = baseline.get("results", {}).get(mode)
+        if not previous:
+            continue
+        for metric, value in metrics.items():
+            old = previous.get(metric)
+            if metric == "projects" or not old:
+                continue
+            change = (value - old) / old
+            if metric in HIGHER_IS_BETTER:
+                change = -change
+            if change > tolerance:
+                regressions.append({"mode": mode, "metric": metric,
+                                    "baseline": old, "current": value,
+                                    "change_pct": change * 100})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark validators against a synthetic fleet")
+    parser.add_argument("--projects", type=int, default=1000,
+                        help="Projects in the generated fleet (e.g. 10, 1000, 10000)")
+    parser.add_argument("--agents-size", type=int, default=4096,
+                        help="Approximate AGENTS.md size in bytes")
+    parser.add_argument("--depth", type=int, default=1, help="Group directories above each project")
+    parser.add_argument("--sample", type=int, default=500,
+                        help="Projects audited in the in-process modes")
+    parser.add_argument("--workers", "-j", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes for the fleet mode")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--fleet-dir", help="Reuse or create the fleet here instead of a temp dir")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", "-o", help="Write the JSON report to this file")
+    parser.add_argument("--baseline", help="Compare against a previous JSON report")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed regression as a fraction (default: 0.2)")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="start-fleet-bench-"))
+    try:
+        if args.fleet_dir and Path(args.fleet_dir).is_dir():
+            fleet = Path(args.fleet_dir)
+        else:
+            fleet = Path(args.fleet_dir) if args.fleet_dir else workdir / "fleet"
+            started = time.perf_counter()
+            generate_fleet(fleet, args.projects, args.agents_size, args.depth, args.seed)
+            print(f"Generated {args.projects} projects in {time.perf_counter() - started:.1f}s",
+                  file=sys.stderr)
+
+        projects = discover_projects(fleet, args.depth + 1)
+        sample = projects[:args.sample]
+
+        # Keep the user's audit and toolchain caches out of the measurement
+        os.environ["XDG_CACHE_HOME"] = str(workdir / "xdg-cache")
+
+        results = {}
+        if "single" in args.modes:
+            results["single"] = bench_single(sample)
+        if "fleet" in args.modes:
+            results["fleet"] = bench_fleet(projects, args.workers)
+        if "warm" in args.modes:
+            results["warm"] = bench_warm(sample, workdir)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "config": {
+            "projects": len(projects),
+            "agents_size": args.agents_size,
+            "depth": args.depth,
+            "sample": len(sample),
+            "workers": args.workers,
+            "python": sys.version.split()[0],
+        },
+        "results": results,
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        report["regressions"] = regressions
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    print(output)
+
+    if regressions:
+        for entry in regressions:
+            print(f"⚠️ {entry['mode']} {entry['metric']}: {entry['baseline']:.2f} -> "
+                  f"{entry['current']:.2f} ({entry['change_pct']:+.0f}%)", file=sys.stderr)
+        sys.exit(1)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Audit History Benchmark
+
+Fills an audit history store with a synthetic fleet whose check results
+flip over time (millions of outcome rows) and times each `start report`
+query against it. Exits non-zero when a report exceeds its budget.
+
+Usage:
+    python3 benchmarks/history_bench.py
+    python3 benchmarks/history_bench.py --projects 10000 --changes 500
+    python3 benchmarks/history_bench.py --db /tmp/history.sqlite3 --json
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "validators"))
+
+from audit_history import FAILED, PASSED, AuditHistory  # noqa: E402
+
+REPORT_BUDGET_MS = 1000.0
+
+WEEK = 7 * 86400
+
+
+def populate(history: AuditHistory, projects: int, rules: int, changes: int,
+             seed: int = 0) -> int:
+    """Write a history where each project flips one rule per audit; returns the last timestamp"""
+    rng = random.Random(seed)
+    conn = history._conn
+    start = 1_700_000_000
+    conn.executemany("INSERT INTO rules (id, validator, rule_id, path, ordinal) "
+                     "VALUES (?, 'structure', ?, 'README.md', 0)",
+                     [(rule, f"structure.synthetic.{rule}") for rule in range(rules)])
+
+    last = start
+    for project in range(projects):
+        ts = start
+        statuses = [PASSED] * rules
+        outcomes = [(project, rule, ts, PASSED) for rule in range(rules)]
+        scores = [(project, ts, rules, rules, 1)]
+        for _ in range(changes):
+            ts += 3600 * rng.randint(1, 6)
+            rule = rng.randrange(rules)
+            statuses[rule] = FAILED if statuses[rule] == PASSED else PASSED
+            outcomes.append((project, rule, ts, statuses[rule]))
+            score = statuses.count(PASSED)
+            scores.append((project, ts, score, rules, int(score == rules)))
+        conn.execute("INSERT INTO projects (id, path, last_seen) VALUES (?, ?, ?)",
+                     (project, f"/srv/project-{project}", ts))
+        conn.executemany("INSERT INTO outcomes VALUES (?, ?, ?, ?)", outcomes)
+        conn.executemany("INSERT INTO scores VALUES (?, ?, ?, ?, ?)", scores)
+        conn.executemany("INSERT INTO current (project, rule, status, since) VALUES (?, ?, ?, ?)",
+                         [(project, rule, status, ts) for rule, status in enumerate(statuses)])
+        last = max(last, ts)
+    history.commit()
+    return last
+
+
+def timed(query, runs: int):
+    best = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        rows = query()
+        elapsed = (time.perf_counter() - started) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return {"rows": len(rows), "best_ms": best}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark audit history reports")
+    parser.add_argument("--projects", type=int, default=2000)
+    parser.add_argument("--rules", type=int, default=60)
+    parser.add_argument("--changes", type=int, default=1000, help="Status changes per project")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per report (best is kept)")
+    parser.add_argument("--db", help="Store to reuse or create (default: a temp file)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    workdir = None
+    if args.db:
+        path = Path(args.db)
+    else:
+        workdir = tempfile.TemporaryDirectory(prefix="start-history-bench-")
+        path = Path(workdir.name) / "history.sqlite3"
+
+    fresh = not path.exists()
+    history = AuditHistory(path)
+    if fresh:
+        started = time.perf_counter()
+        last = populate(history, args.projects, args.rules, args.changes, args.seed)
+        print(f"Populated in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    else:
+        last = history._conn.execute("SELECT MAX(ts) FROM scores").fetchone()[0]
+
+    outcomes = history._conn.execute("SELECT COUNT(*) FROM outcomes").fetchone()[0]
+    reports = {
+        "regressions": timed(lambda: history.regressions(last - WEEK), args.runs),
+        "rules": timed(history.pass_rates, args.runs),
+        "rules_since": timed(lambda: history.pass_rates(last - WEEK), args.runs),
+        "trend": timed(lambda: history.trend("/srv/project-0"), args.runs),
+    }
+    history.close()
+    if workdir is not None:
+        workdir.cleanup()
+
+    over_budget = [name for name, report in reports.items()
+                   if report["best_ms"] > REPORT_BUDGET_MS]
+    if args.json:
+        print(json.dumps({"outcome_rows": outcomes, "budget_ms": REPORT_BUDGET_MS,
+                          "reports": reports, "over_budget": over_budget}, indent=2))
+    else:
+        print(f"{outcomes:,} outcome rows")
+        for name, report in reports.items():
+            marker = "❌" if name in over_budget else "✅"
+            print(f"{marker} {name:<12} {report['best_ms']:8.1f} ms  ({report['rows']} rows)")
+
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Scaffold Benchmark
+
+Generates a synthetic template (many text files with placeholders plus
+verbatim text and binary assets) and measures how fast `start bootstrap`
+materialises it in four modes:
+
+    naive   shutil.copytree() then read/replace/write every text file
+    cold    scaffold.bootstrap() parsing the template, no manifest cache
+    cached  scaffold.bootstrap() with a warm manifest cache
+    batch   one --count N run writing every project on one thread pool
+
+Each mode reports projects/sec, files/sec and p50/p99 time per project;
+results can be compared against a stored baseline like fleet_bench.py.
+
+Usage:
+    python3 benchmarks/scaffold_bench.py
+    python3 benchmarks/scaffold_bench.py --files 5000 --binary-size 262144
+    python3 benchmarks/scaffold_bench.py --output scaffold.json
+    python3 benchmarks/scaffold_bench.py --baseline scaffold.json
+"""
+
+import argparse
+import json
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "cli"))
+
+from scaffold import bootstrap, project_values  # noqa: E402
+
+MODES = ("naive", "cold", "cached", "batch")
+
+# Metrics where larger numbers are better; everything else regresses upward
+HIGHER_IS_BETTER = {"projects_per_sec", "files_per_sec"}
+COUNT_METRICS = {"files_rendered", "files_reflinked", "files_copied", "files_linked"}
+
+TEXT_FILE = """\"\"\"{{{{name}}}} module {index} - {{{{description}}}}\"\"\"
+
+AUTHOR = "{{{{author}}}} <{{{{email}}}}>"
+PACKAGE = "{{{{package}}}}"
+"""
+
+
+# ---------------------------------------------------------------------------
+# Template generation
+# ---------------------------------------------------------------------------
+
+def generate_template(root: Path, files: int, binary_size: int, seed: int = 0) -> int:
+    """Write a template of `files` files: 60% rendered, 30% static text, 10% binary"""
+    rng = random.Random(seed)
+    package = root / "src" / "{{package}}"
+    package.mkdir(parents=True)
+    (root / "static").mkdir()
+    (root / "assets").mkdir()
+    for index in range(files):
+        kind = index % 10
+        if kind < 6:
+            (package / f"module_{index:05d}.py").write_text(TEXT_FILE.format(index=index))
+        elif kind < 9:
+            (root / "static" / f"doc_{index:05d}.md").write_text(
+                f"# Document {index}\n\n" + "Static prose without placeholders.\n" * 20)
+        else:
+            (root / "assets" / f"blob_{index:05d}.bin").write_bytes(rng.randbytes(binary_size))
+    return files
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+def percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(latencies_ms, files: int, elapsed_s: float):
+    projects = len(latencies_ms)
+    return {
+        "projects": projects,
+        "projects_per_sec": projects / elapsed_s if elapsed_s else 0.0,
+        "files_per_sec": projects * files / elapsed_s if elapsed_s else 0.0,
+        "p50_ms": statistics.median(latencies_ms) if latencies_ms else 0.0,
+        "p99_ms": percentile(latencies_ms, 0.99),
+    }
+
+
+def naive_scaffold(template: Path, target: Path, values):
+    """The straightforward implementation, for comparison"""
+    shutil.copytree(template, target)
+    for path in sorted(target.rglob("*"), reverse=True):
+        if "{{" in path.name:
+            rendered = path.name
+            for key, value in values.items():
+                rendered = rendered.replace("{{" + key + "}}", value)
+            path = path.rename(path.with_name(rendered))
+        if path.is_file():
+            try:
+                text = path.read_text()
+            except UnicodeDecodeError:
+                continue
+            for key, value in values.items():
+                text = text.replace("{{" + key + "}}", value)
+            path.write_text(text)
+
+
+def timed_projects(count: int, out: Path, scaffold):
+    latencies = []
+    started = time.perf_counter()
+    for index in range(count):
+        project_started = time.perf_counter()
+        scaffold(out / f"project-{index}", f"project-{index}")
+        latencies.append((time.perf_counter() - project_started) * 1000)
+    return latencies, time.perf_counter() - started
+
+
+def bench_naive(template: Path, out: Path, count: int, files: int):
+    latencies, elapsed = timed_projects(
+        count, out, lambda target, name: naive_scaffold(template, target, project_values(name)))
+    return summarize(latencies, files, elapsed)
+
+
+def bench_bootstrap(template: Path, out: Path, count: int, files: int, workers: int,
+                    cache_dir=None):
+    def scaffold(target, name):
+        bootstrap(template, target.parent, name, workers=workers, cache_dir=cache_dir)
+    latencies, elapsed = timed_projects(count, out, scaffold)
+    return summarize(latencies, files, elapsed)
+
+
+def bench_batch(template: Path, out: Path, count: int, files: int, workers: int, cache_dir):
+    started = time.perf_counter()
+    result = bootstrap(template, out, "project", count, workers=workers, cache_dir=cache_dir)
+    elapsed = time.perf_counter() - started
+    report = summarize([elapsed * 1000 / count] * count, files, elapsed)
+    report.update({f"files_{method}": n for method, n in result["files"].items()})
+    return report
+
+
+# ---------------------------------------------------------------------------
+# Baseline comparison
+# ---------------------------------------------------------------------------
+
+def compare(report, baseline, tolerance: float):
+    """Metrics that regressed by more than `tolerance` (a fraction)"""
+    regressions = []
+    for mode, metrics in report["results"].items():
+        previous = baseline.get("results", {}).get(mode)
+        if not previous:
+            continue
+        for metric, value in metrics.items():
+            old = previous.get(metric)
+            # Counts, not timings
+            if metric == "projects" or metric in COUNT_METRICS or not old:
+                continue
+            change = (value - old) / old
+            if metric in HIGHER_IS_BETTER:
+                change = -change
+            if change > tolerance:
+                regressions.append({"mode": mode, "metric": metric,
+                                    "baseline": old, "current": value,
+                                    "change_pct": change * 100})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark template scaffolding")
+    parser.add_argument("--files", type=int, default=1000, help="Files in the generated template")
+    parser.add_argument("--binary-size", type=int, default=65536,
+                        help="Size of each binary asset in bytes")
+    parser.add_argument("--projects", type=int, default=20,
+                        help="Projects created per mode")
+    parser.add_argument("--workers", "-j", type=int, default=8, help="Writer threads")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--dir", help="Scratch directory (default: a temp dir; must be on "
+                                      "the filesystem under test for reflinks)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", "-o", help="Write the JSON report to this file")
+    parser.add_argument("--baseline", help="Compare against a previous JSON report")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed regression as a fraction (default: 0.2)")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="start-scaffold-bench-", dir=args.dir))
+    try:
+        template = workdir / "template"
+        started = time.perf_counter()
+        generate_template(template, args.files, args.binary_size, args.seed)
+        print(f"Generated a {args.files}-file template in {time.perf_counter() - started:.1f}s",
+              file=sys.stderr)
+        cache_dir = workdir / "manifests"
+
+        results = {}
+        for mode in args.modes:
+            out = workdir / mode
+            if mode == "naive":
+                results[mode] = bench_naive(template, out, args.projects, args.files)
+            elif mode == "cold":
+                results[mode] = bench_bootstrap(template, out, args.projects, args.files,
+                                                args.workers)
+            elif mode == "cached":
+                # Populate the manifest cache outside the measurement
+                bootstrap(template, workdir / "warmup", "warmup", cache_dir=cache_dir)
+                results[mode] = bench_bootstrap(template, out, args.projects, args.files,
+                                                args.workers, cache_dir)
+            else:
+                results[mode] = bench_batch(template, out, args.projects, args.files,
+                                            args.workers, cache_dir)
+            shutil.rmtree(out, ignore_errors=True)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "config": {
+            "files": args.files,
+            "binary_size": args.binary_size,
+            "projects": args.projects,
+            "workers": args.workers,
+            "python": sys.version.split()[0],
+        },
+        "results": results,
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        report["regressions"] = regressions
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    print(output)
+
+    if regressions:
+        for entry in regressions:
+            print(f"⚠️ {entry['mode']} {entry['metric']}: {entry['baseline']:.2f} -> "
+                  f"{entry['current']:.2f} ({entry['change_pct']:+.0f}%)", file=sys.stderr)
+        sys.exit(1)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+CLI Startup Benchmark
+
+Measures cold wall-clock time of `start` subcommands by launching a fresh
+interpreter for each run, and uses `python -X importtime` to list the
+slowest imports each subcommand pulls in.
+
+Usage:
+    python3 benchmarks/startup_bench.py
+    python3 benchmarks/startup_bench.py --runs 50 --json
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+START = Path(__file__).resolve().parent.parent / "cli" / "start.py"
+
+COMMANDS = {
+    "interpreter": [sys.executable, "-c", "pass"],
+    "status": [sys.executable, str(START), "status"],
+    "templates list": [sys.executable, str(START), "templates", "list"],
+    "help": [sys.executable, str(START), "--help"],
+}
+
+# Target from the startup budget for prompts and git hooks
+STATUS_BUDGET_MS = 30.0
+
+
+def time_command(argv, runs):
+    """Wall time in milliseconds for each of `runs` cold launches"""
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def import_profile(argv, top):
+    """Slowest cumulative imports reported by -X importtime"""
+    result = subprocess.run([argv[0], "-X", "importtime"] + argv[1:],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # "import time:   self_us |  cumulative_us | module"
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        imports.append({"module": name.strip(), "self_us": int(self_us),
+                        "cumulative_us": int(cumulative_us)})
+    imports.sort(key=lambda entry: entry["cumulative_us"], reverse=True)
+    return imports[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark `start` CLI startup time")
+    parser.add_argument("--runs", type=int, default=20, help="Cold launches per command")
+    parser.add_argument("--top", type=int, default=8, help="Imports listed per command")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    report = {}
+    for name, argv in COMMANDS.items():
+        samples = time_command(argv, args.runs)
+        report[name] = {
+            "median_ms": statistics.median(samples),
+            "min_ms": min(samples),
+            "max_ms": max(samples),
+            "imports": import_profile(argv, args.top) if name != "interpreter" else [],
+        }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for name, stats in report.items():
+            print(f"{name:16} median {stats['median_ms']:6.1f} ms  "
+                  f"(min {stats['min_ms']:.1f}, max {stats['max_ms']:.1f})")
+            for entry in stats["imports"]:
+                print(f"    {entry['cumulative_us'] / 1000:6.1f} ms  {entry['module']}")
+
+    status_ms = report["status"]["median_ms"]
+    if status_ms > STATUS_BUDGET_MS:
+        print(f"\n⚠️ start status took {status_ms:.1f} ms (budget {STATUS_BUDGET_MS:.0f} ms)")
+        sys.exit(1)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
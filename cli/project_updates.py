@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Project Repository Update Checker
+
+Python implementation of `check_projects` from scripts/system-update.sh.
+Every git repository directly under the apps directory is fetched and
+inspected on an asyncio subprocess pool with bounded concurrency and a
+per-repository timeout, and results are reported as they arrive.
+"""
+
+import asyncio
+import os
+from pathlib import Path
+from typing import AsyncIterator, Callable, Dict, List, Any
+
+DEFAULT_APPS_DIR = Path.home() / "Apps"
+DEFAULT_CONCURRENCY = 16
+DEFAULT_TIMEOUT = 60.0
+
+# Never block on credential prompts while running unattended
+GIT_ENV = dict(os.environ, GIT_TERMINAL_PROMPT="0")
+
+
+def find_repositories(apps_dir: Path) -> List[Path]:
+    """Git repositories directly under apps_dir, like `for dir in */`.
+
+    As in the shell version, a repository needs a .git directory; linked
+    worktrees and submodules (a .git file) are not checked.
+    """
+    repos = []
+    with os.scandir(apps_dir) as entries:
+        for entry in entries:
+            if (entry.is_dir() and not entry.name.startswith(".")
+                    and os.path.isdir(os.path.join(entry.path, ".git"))):
+                repos.append(Path(entry.path))
+    return sorted(repos)
+
+
+async def _git(repo: Path, *args: str) -> tuple:
+    """Run a git command in repo, returning (returncode, stdout)"""
+    proc = await asyncio.create_subprocess_exec(
+        "git", *args,
+        cwd=str(repo),
+        env=GIT_ENV,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    try:
+        stdout, _ = await proc.communicate()
+    except asyncio.CancelledError:
+        # Timed out: do not leave a stray git fetch behind
+        proc.kill()
+        await proc.wait()
+        raise
+    return proc.returncode, stdout.decode(errors="replace").strip()
+
+
+async def _inspect(repo: Path) -> Dict[str, Any]:
+    result = {"name": repo.name, "path": str(repo)}
+
+    code, _ = await _git(repo, "fetch", "--all", "--quiet")
+    if code != 0:
+        result["status"] = "fetch_failed"
+        return result
+
+    _, branch = await _git(repo, "branch", "--show-current")
+    behind = 0
+    if branch:
+        code, count = await _git(repo, "rev-list", "--count", f"HEAD..origin/{branch}")
+        if code == 0 and count.isdigit():
+            behind = int(count)
+
+    _, porcelain = await _git(repo, "status", "--porcelain")
+    uncommitted = len(porcelain.splitlines())
+
+    result.update(branch=branch, behind=behind, uncommitted=uncommitted)
+    if behind > 0:
+        result["status"] = "updates"
+    elif uncommitted > 0:
+        result["status"] = "uncommitted"
+    else:
+        result["status"] = "up_to_date"
+    return result
+
+
+async def _check_one(repo: Path, semaphore: asyncio.Semaphore, timeout: float) -> Dict[str, Any]:
+    async with semaphore:
+        try:
+            return await asyncio.wait_for(_inspect(repo), timeout)
+        except asyncio.TimeoutError:
+            return {"name": repo.name, "path": str(repo), "status": "timeout"}
+        except OSError as e:
+            return {"name": repo.name, "path": str(repo), "status": "error", "error": str(e)}
+
+
+async def check_repositories(repos: List[Path], concurrency: int = DEFAULT_CONCURRENCY,
+                             timeout: float = DEFAULT_TIMEOUT) -> AsyncIterator[Dict[str, Any]]:
+    """Inspect repositories concurrently, yielding each result as it completes"""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    tasks = [asyncio.ensure_future(_check_one(repo, semaphore, timeout)) for repo in repos]
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            yield await next_result
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def check_projects(apps_dir: Path, report: Callable[[Dict[str, Any]], None],
+                   concurrency: int = DEFAULT_CONCURRENCY,
+                   timeout: float = DEFAULT_TIMEOUT) -> List[Dict[str, Any]]:
+    """Check every repository under apps_dir, calling report() per result"""
+    repos = find_repositories(apps_dir)
+
+    async def run():
+        results = []
+        async for result in check_repositories(repos, concurrency, timeout):
+            report(result)
+            results.append(result)
+        return results
+
+    return asyncio.run(run())
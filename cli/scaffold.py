@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Template Scaffolding
+
+Materialises a template directory as one or more new projects. Each
+template is parsed once into a manifest of directories, text files split
+into literal and {{placeholder}} segments, and files copied verbatim.
+Manifests are cached under ~/.cache/start/templates and reused until a
+template file changes. Verbatim files are cloned with a reflink where the
+filesystem supports it and copied in the kernel with copy_file_range()
+otherwise (or hardlinked on request), and every file of every project in
+a batch is written on one thread pool.
+"""
+
+import errno
+import fcntl
+import hashlib
+import json
+import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+PLACEHOLDER = re.compile(r"\{\{\s*([a-z_]+)\s*\}\}")
+PLACEHOLDERS = ("name", "package", "author", "email", "description")
+
+PROJECT_NAME = re.compile(r"^[A-Za-z][A-Za-z0-9._-]*$")
+
+# Values are pasted into TOML and Python string literals unescaped
+UNSAFE_VALUE = re.compile(r'["\\\x00-\x1f\x7f]')
+
+DEFAULT_WORKERS = 8
+
+# Bumped whenever the manifest layout changes
+MANIFEST_FORMAT = "1"
+
+# Larger files are always copied verbatim, never scanned for placeholders
+MAX_RENDERED_SIZE = 1 << 20
+
+# ioctl(2) request cloning one file's extents into another (btrfs, XFS)
+FICLONE = 0x40049409
+
+# copy_file_range() errors that mean "not here, use a plain copy"
+COPY_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM}
+
+Manifest = List[Dict[str, Any]]
+
+
+class TemplateError(ValueError):
+    """A template or project could not be materialised"""
+
+
+def default_manifest_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return Path(base) / "start" / "templates"
+
+
+def project_values(name: str, author: Optional[str] = None, email: Optional[str] = None,
+                   description: Optional[str] = None) -> Dict[str, str]:
+    """Placeholder values for one project, defaulting from the git environment"""
+    if not PROJECT_NAME.match(name):
+        raise TemplateError(f"Invalid project name: {name!r}")
+    values = {
+        "name": name,
+        "package": re.sub(r"[^0-9a-z]+", "_", name.lower()).strip("_"),
+        "author": author or os.environ.get("GIT_AUTHOR_NAME") or "Your Name",
+        "email": email or os.environ.get("GIT_AUTHOR_EMAIL") or "your.email@example.com",
+        "description": description or f"The {name} project",
+    }
+    for key in ("author", "email", "description"):
+        if UNSAFE_VALUE.search(values[key]):
+            raise TemplateError(f"Invalid {key}: {values[key]!r} "
+                                f"(quotes, backslashes and line breaks are not allowed)")
+    return values
+
+
+def _segments(text: str, where: str) -> List[str]:
+    """Split text into [literal, placeholder, literal, ...]"""
+    segments = PLACEHOLDER.split(text)
+    unknown = sorted(set(segments[1::2]) - set(PLACEHOLDERS))
+    if unknown:
+        raise TemplateError(f"Unknown placeholder(s) in {where}: {', '.join(unknown)}")
+    return segments
+
+
+def _render(segments: List[str], values: Dict[str, str]) -> str:
+    return "".join(values[part] if index % 2 else part for index, part in enumerate(segments))
+
+
+def _scan_template(template_dir: Path) -> List[Tuple[str, bool, int, int, int]]:
+    """(relative path, is_dir, mode, size, mtime_ns) for every template entry, sorted"""
+    entries = []
+    pending = [""]
+    while pending:
+        relative_dir = pending.pop()
+        with os.scandir(template_dir / relative_dir if relative_dir else template_dir) as listing:
+            for entry in listing:
+                path = f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+                st = entry.stat(follow_symlinks=False)
+                is_dir = entry.is_dir(follow_symlinks=False)
+                entries.append((path, is_dir, st.st_mode & 0o7777, st.st_size, st.st_mtime_ns))
+                if is_dir:
+                    pending.append(path)
+    entries.sort()
+    return entries
+
+
+def parse_template(template_dir: Path, entries=None) -> Manifest:
+    """Build a template's manifest, reading every file once"""
+    template_dir = Path(template_dir)
+    manifest = []
+    for path, is_dir, mode, size, _ in entries or _scan_template(template_dir):
+        item = {"path": _segments(path, path), "mode": mode}
+        if is_dir:
+            item["type"] = "dir"
+        else:
+            item["type"] = "copy"
+            item["source"] = path
+            if size <= MAX_RENDERED_SIZE:
+                data = (template_dir / path).read_bytes()
+                try:
+                    text = data.decode("utf-8") if b"\0" not in data else None
+                except UnicodeDecodeError:
+                    text = None
+                # Files without placeholders are copied rather than rendered
+                if text is not None and PLACEHOLDER.search(text):
+                    item["type"] = "text"
+                    item["segments"] = _segments(text, path)
+        manifest.append(item)
+    return manifest
+
+
+def load_manifest(template_dir: Path, cache_dir: Optional[Path] = None) -> Manifest:
+    """A template's manifest, from the on-disk cache while the template is unchanged.
+
+    cache_dir=None parses the template without touching the cache.
+    """
+    template_dir = Path(template_dir).resolve()
+    if not template_dir.is_dir():
+        raise TemplateError(f"Template not found: {template_dir}")
+
+    entries = _scan_template(template_dir)
+    if cache_dir is None:
+        return parse_template(template_dir, entries)
+
+    signature = hashlib.sha256(json.dumps([MANIFEST_FORMAT, entries]).encode()).hexdigest()
+    key = hashlib.sha256(str(template_dir).encode()).hexdigest()[:16]
+    cache_file = Path(cache_dir) / f"{template_dir.name}-{key}.json"
+    try:
+        with open(cache_file) as f:
+            cached = json.load(f)
+        if cached.get("signature") == signature:
+            return cached["manifest"]
+    except (OSError, ValueError):
+        pass
+
+    manifest = parse_template(template_dir, entries)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temporary = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(temporary, "w") as f:
+            json.dump({"signature": signature, "manifest": manifest}, f)
+        os.replace(temporary, cache_file)
+    except OSError:
+        # A read-only cache only costs the next run a re-parse
+        pass
+    return manifest
+
+
+def clone_file(source: str, target: str, mode: int, link: bool = False) -> str:
+    """Copy one file as cheaply as the filesystem allows, returning the method used"""
+    if link:
+        try:
+            os.link(source, target)
+            return "linked"
+        except OSError:
+            pass
+
+    with open(source, "rb") as src:
+        fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode & 0o777)
+        with open(fd, "wb") as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                return "reflinked"
+            except OSError:
+                pass
+
+            if hasattr(os, "copy_file_range"):
+                remaining = os.fstat(src.fileno()).st_size
+                try:
+                    while remaining > 0:
+                        copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                    if remaining == 0:
+                        return "copied"
+                except OSError as e:
+                    if e.errno not in COPY_FALLBACK_ERRNOS:
+                        raise
+
+            # Start over with a userspace copy
+            src.seek(0)
+            dst.seek(0)
+            dst.truncate()
+            shutil.copyfileobj(src, dst, 1 << 20)
+            return "copied"
+
+
+def _write_rendered(target: str, mode: int, content: str) -> str:
+    fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode & 0o777)
+    with open(fd, "w", encoding="utf-8", newline="") as f:
+        f.write(content)
+    return "rendered"
+
+
+def materialize(template_dir: Path, manifest: Manifest,
+                projects: Iterable[Tuple[Path, Dict[str, str]]],
+                workers: int = DEFAULT_WORKERS, link: bool = False) -> Dict[str, int]:
+    """Write the template into each (target directory, values) pair.
+
+    Targets must not exist yet or be empty. Returns how many files were
+    rendered, reflinked, copied and linked.
+    """
+    template_dir = Path(template_dir).resolve()
+    projects = list(projects)
+
+    # Every target is checked before any is created, so a taken name late in
+    # a batch leaves no half-built projects behind
+    for target, _ in projects:
+        target = Path(target)
+        if target.exists() and (not target.is_dir() or any(target.iterdir())):
+            raise TemplateError(f"Target already exists and is not empty: {target}")
+
+    # Directories first, serially, so the file writes below never race on them
+    jobs = []
+    for target, values in projects:
+        target = Path(target)
+        target.mkdir(parents=True, exist_ok=True)
+        for item in manifest:
+            path = str(target / _render(item["path"], values))
+            if item["type"] == "dir":
+                os.mkdir(path, item["mode"] & 0o777 or 0o755)
+            elif item["type"] == "text":
+                jobs.append((_write_rendered, path, item["mode"], _render(item["segments"], values)))
+            else:
+                jobs.append((clone_file, str(template_dir / item["source"]), path, item["mode"], link))
+
+    counts = dict.fromkeys(("rendered", "reflinked", "copied", "linked"), 0)
+    if len(jobs) < 2 or workers <= 1:
+        methods = [job[0](*job[1:]) for job in jobs]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            methods = list(pool.map(lambda job: job[0](*job[1:]), jobs))
+    for method in methods:
+        counts[method] += 1
+    return counts
+
+
+def bootstrap(template_dir: Path, output_dir: Path, name: str, count: int = 1,
+              author: Optional[str] = None, email: Optional[str] = None,
+              description: Optional[str] = None, workers: int = DEFAULT_WORKERS,
+              link: bool = False, cache_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """Create `name` (or name-1 .. name-N when count > 1) under output_dir"""
+    if count < 1:
+        raise TemplateError("--count must be at least 1")
+    names = [name] if count == 1 else [f"{name}-{index}" for index in range(1, count + 1)]
+    projects = [(Path(output_dir) / project_name,
+                 project_values(project_name, author, email, description))
+                for project_name in names]
+
+    manifest = load_manifest(template_dir, cache_dir)
+    counts = materialize(template_dir, manifest, projects, workers, link)
+    return {"projects": [str(target) for target, _ in projects], "files": counts}
@@ -6,11 +6,8 @@ A unified command-line interface for managing project quality, standards,
 and development environment consistency across all your projects.
 """
 
-import argparse
 import sys
 import os
-import subprocess
-from pathlib import Path
 
 # Colors for output
 class Colors:
@@ -39,10 +36,19 @@ def print_header(message):
 
 def get_start_root():
     """Get the root directory of the start project"""
+    from pathlib import Path
     return Path(__file__).parent.parent
 
+def add_validators_path():
+    """Make the validators/ modules importable"""
+    validators_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  "validators")
+    if validators_dir not in sys.path:
+        sys.path.append(validators_dir)
+
 def run_command(command, cwd=None, capture_output=False):
     """Run a shell command"""
+    import subprocess
     try:
         if capture_output:
             result = subprocess.run(command, shell=True, cwd=cwd, 
@@ -54,8 +60,53 @@ def run_command(command, cwd=None, capture_output=False):
     except Exception as e:
         return "", str(e), 1
 
+def print_project_update(result):
+    """Print the status of one repository checked by `system projects`"""
+    name = result['name']
+    status = result['status']
+    if status == "updates":
+        print_warning(f"  {name} has {result['behind']} new commit(s) available")
+    elif status == "uncommitted":
+        print_warning(f"  {name} has {result['uncommitted']} uncommitted changes")
+    elif status == "up_to_date":
+        print(f"  ✅ {name} up to date", flush=True)
+    elif status == "timeout":
+        print_error(f"  {name} timed out")
+    elif status == "fetch_failed":
+        print_warning(f"  {name} could not be fetched")
+    else:
+        print_error(f"  {name}: {result.get('error', status)}")
+    sys.stdout.flush()
+
+def cmd_system_projects(args):
+    """Check project repositories for updates with a bounded asyncio pool"""
+    from pathlib import Path
+    from project_updates import check_projects
+    
+    print_header("Project Check")
+    apps_dir = Path(args.apps_dir).expanduser()
+    if not apps_dir.is_dir():
+        print_warning(f"Apps directory not found at {apps_dir}")
+        return 1
+    
+    print_status(f"Checking project repositories in {apps_dir} "
+                 f"(concurrency {args.concurrency}, timeout {args.timeout:g}s)...")
+    results = check_projects(apps_dir, print_project_update,
+                             concurrency=args.concurrency, timeout=args.timeout)
+    
+    with_updates = sum(1 for r in results if r['status'] == "updates")
+    if with_updates:
+        print_warning(f"{with_updates} project(s) have updates available")
+        print("  Run individual 'git pull' commands to update projects")
+    else:
+        print_success("All projects are up to date")
+    return 0
+
 def cmd_system(args):
     """System management commands"""
+    if args.system_command == "projects":
+        return cmd_system_projects(args)
+    
     start_root = get_start_root()
     script_path = start_root / "scripts" / "system-update.sh"
     
@@ -71,23 +122,20 @@ def cmd_system(args):
         print_header("System Check")
         _, _, code = run_command(f"{script_path} check")
         return code
-    elif args.system_command == "projects":
-        print_header("Project Check")
-        _, _, code = run_command(f"{script_path} projects")
-        return code
     else:
         print_error(f"Unknown system command: {args.system_command}")
         return 1
 
 def cmd_templates(args):
     """Template management commands"""
-    start_root = get_start_root()
-    templates_dir = start_root / "templates"
+    templates_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                 "templates")
     
     if args.template_command == "list":
         print_header("Available Project Templates")
-        if templates_dir.exists():
-            templates = [d.name for d in templates_dir.iterdir() if d.is_dir()]
+        if os.path.isdir(templates_dir):
+            with os.scandir(templates_dir) as entries:
+                templates = [entry.name for entry in entries if entry.is_dir()]
             if templates:
                 for template in templates:
                     print(f"  📋 {template}")
@@ -100,93 +148,717 @@ def cmd_templates(args):
         print_warning(f"Template command '{args.template_command}' not implemented yet")
         return 0
 
+def print_fleet_result(result):
+    """Print a one-line summary for a project audited in fleet mode"""
+    status = "✅" if result['meets_standards'] else "❌"
+    if 'error' in result:
+        print(f"{status} {result['project_path']} - {result['error']}", flush=True)
+        return
+
+    structure = result['structure']
+    if 'error' in structure:
+        print(f"{status} {result['project_path']} - {structure['error']}", flush=True)
+        return
+
+    line = (f"{status} {result['project_path']} [{structure['project_type']}] "
+            f"structure {structure['percentage']:.1f}%")
+    if 'uv' in result:
+        line += f", UV {result['uv'].get('percentage', 0):.1f}%"
+    print(line, flush=True)
+
+def start_profiler(args):
+    """Enable profiling for --profile, returning the Profiler or None"""
+    if not args.profile:
+        return None
+    import profiling
+    return profiling.enable()
+
+def collect_profiles(results, profiler):
+    """Merge the span statistics fleet workers attach to each result"""
+    for result in results:
+        profile = result.pop('profile', None)
+        if profile and profiler is not None:
+            profiler.merge(profile)
+        yield result
+
+def record_history(results, args):
+    """Append results to the audit history for --record, passing them through"""
+    if not args.record:
+        yield from results
+        return
+    from audit_history import AuditHistory
+    history = AuditHistory()
+    try:
+        for result in results:
+            history.record(result)
+            yield result
+    finally:
+        history.close()
+
+def print_profile(profiler, output_format):
+    """Report --profile statistics in the requested output format"""
+    if output_format == 'ndjson':
+        from audit_output import write_ndjson
+        write_ndjson(dict(record='profile', **row) for row in profiler.report())
+        return
+    print()
+    print_header("Audit Profile (inclusive wall time, slowest first)")
+    for line in profiler.format_table():
+        print(line)
+
+def cmd_audit_fleet(args):
+    """Audit every project under a root directory in parallel"""
+    import time
+    from pathlib import Path
+
+    root = Path(args.root)
+    if not root.is_dir():
+        print_error(f"Root directory does not exist: {args.root}")
+        return 1
+
+    add_validators_path()
+    from fleet_auditor import discover_projects, audit_fleet
+    from audit_cache import default_cache_path
+
+    projects = discover_projects(root, args.depth)
+    cache_path = None if args.no_cache else default_cache_path()
+    profiler = start_profiler(args)
+    results = record_history(collect_profiles(
+        audit_fleet(projects, args.workers, cache_path=cache_path, profile=args.profile),
+        profiler), args)
+
+    if args.format != 'text':
+        from audit_output import audit_records, write_json, write_ndjson
+        if args.format == 'ndjson':
+            failing = 0
+            for result in results:
+                write_ndjson(audit_records(result))
+                failing += not result['meets_standards']
+            if profiler is not None:
+                print_profile(profiler, args.format)
+        else:
+            results = list(results)
+            if profiler is not None:
+                write_json({'results': results, 'profile': profiler.report()})
+            else:
+                write_json(results)
+            failing = sum(not result['meets_standards'] for result in results)
+        return 1 if failing else 0
+
+    print_header(f"Auditing Projects Under: {args.root}")
+    if not projects:
+        print_warning("No projects found")
+        return 0
+
+    print_status(f"Found {len(projects)} project(s)")
+    started = time.monotonic()
+    passing = 0
+    for result in results:
+        print_fleet_result(result)
+        if result['meets_standards']:
+            passing += 1
+
+    elapsed = time.monotonic() - started
+    if profiler is not None:
+        print_profile(profiler, args.format)
+    print()
+    print(f"Audited {len(projects)} project(s) in {elapsed:.2f}s")
+    if passing == len(projects):
+        print_success(f"🎉 All {passing} projects meet quality standards!")
+        return 0
+    else:
+        print_warning(f"⚠️ {len(projects) - passing} of {len(projects)} project(s) need improvement")
+        return 1
+
+def print_workspace_result(result):
+    """Print a one-line summary for a workspace package, then its failed checks"""
+    from check_results import render_checks
+
+    print_fleet_result(dict(result, project_path=result.get('package', '(workspace root)')))
+    for validator in ('structure', 'uv'):
+        checks = result.get(validator, {}).get('checks')
+        if checks:
+            for check in render_checks(checks, passed=False):
+                print(f"    {check}")
+
+def cmd_audit_workspace(args):
+    """Audit every package of a monorepo and roll up a workspace score"""
+    import time
+    from pathlib import Path
+
+    root = Path(args.workspace)
+    if not root.is_dir():
+        print_error(f"Workspace directory does not exist: {args.workspace}")
+        return 1
+
+    add_validators_path()
+    from workspace_auditor import audit_workspace
+    from audit_cache import default_cache_path
+
+    if args.format == 'text':
+        print_header(f"Auditing Workspace: {args.workspace}")
+    cache_path = None if args.no_cache else default_cache_path()
+    profiler = start_profiler(args)
+    started = time.monotonic()
+    result = audit_workspace(root, args.workers, cache_path=cache_path, profile=args.profile)
+    elapsed = time.monotonic() - started
+    result['packages'] = list(collect_profiles(result['packages'], profiler))
+    # Packages only: a root-level package shares its path with the root result
+    list(record_history(result['packages'], args))
+    exit_code = 0 if result['meets_standards'] else 1
+
+    if args.format == 'ndjson':
+        from audit_output import workspace_records, write_ndjson
+        write_ndjson(workspace_records(result))
+        if profiler is not None:
+            print_profile(profiler, args.format)
+        return exit_code
+    if args.format == 'json':
+        from audit_output import write_json
+        if profiler is not None:
+            result = dict(result, profile=profiler.report())
+        write_json(result)
+        return exit_code
+
+    packages = result['packages']
+    print_status(f"Found {len(packages)} package(s)")
+    for package in [result['root']] + packages:
+        print_workspace_result(package)
+
+    if profiler is not None:
+        print_profile(profiler, args.format)
+    print()
+    print(f"Audited {len(packages)} package(s) in {elapsed:.2f}s")
+    print(f"Workspace Score: {result['score']}/{result['total']} ({result['percentage']:.1f}%)")
+    print(f"Quality Level: {result['quality_level']}")
+    if result['meets_standards']:
+        print_success("🎉 Workspace meets all quality standards!")
+    else:
+        failing = sum(not package['meets_standards'] for package in [result['root']] + packages)
+        print_warning(f"⚠️ {failing} workspace part(s) need improvement")
+    return exit_code
+
+def print_audit_report(result):
+    """Print a single-project audit result, returning the exit code"""
+    from check_results import ERROR, WARNING, render_checks
+
+    structure = result['structure']
+    print(f"Project Type: {structure['project_type']}")
+    print(f"Structure Score: {structure['score']}/{structure['total']} ({structure['percentage']:.1f}%)")
+    if structure.get('warnings'):
+        print(f"Warnings: {structure['warnings']} (not scored)")
+    print(f"Quality Level: {structure['quality_level']}")
+    print()
+    
+    for check in render_checks(structure['checks'], passed=True):
+        print(check)
+    
+    for check in render_checks(structure['checks'], passed=False):
+        print(check)
+    
+    # UV compliance check for Python projects  
+    if 'uv' in result:
+        uv_result = result['uv']
+        print("\n" + "="*50)
+        print_header("UV-First Python Compliance Check")
+        
+        print(f"UV Compliance: {'✅ YES' if uv_result['uv_compliant'] else '❌ NO'}")
+        print(f"UV Score: {uv_result['score']}/{uv_result['total']} ({uv_result['percentage']:.1f}%)")
+        if uv_result.get('warnings'):
+            print(f"Warnings: {uv_result['warnings']} (not scored)")
+        print(f"Compliance Level: {uv_result['compliance_level']}")
+        print()
+        
+        uv_issues = render_checks(uv_result['checks'], passed=False, severity=ERROR)
+        if uv_issues:
+            print("❌ UV Compliance Issues:")
+            for issue in uv_issues:
+                print(f"  {issue}")
+        uv_warnings = render_checks(uv_result['checks'], passed=False, severity=WARNING)
+        if uv_warnings:
+            print("⚠️ UV Compliance Warnings (not scored):")
+            for warning in uv_warnings:
+                print(f"  {warning}")
+        
+        # Overall compliance
+        if not uv_result['uv_compliant']:
+            print_error("⚠️ Python project MUST be UV-compliant")
+            return 1
+        else:
+            print_success("✅ Python project is UV-compliant")
+    
+    # Overall result
+    if result['meets_standards']:
+        print_success("🎉 Project meets all quality standards!")
+        return 0
+    else:
+        print_warning("⚠️ Project needs improvement to meet quality standards")
+        return 1
+
+def cmd_audit_refs(args):
+    """Audit a project as committed at one or more revisions, without a checkout"""
+    import time
+
+    if not os.path.isdir(args.project):
+        print_error(f"Project path does not exist: {args.project}")
+        return 1
+
+    add_validators_path()
+    from fleet_auditor import load_validators
+    from audit_cache import default_cache_path
+    from git_metadata import GitError
+    from ref_snapshot import audit_revisions
+
+    cache_path = None if args.no_cache else default_cache_path()
+    profiler = start_profiler(args)
+    started = time.monotonic()
+    try:
+        results = audit_revisions(args.project, args.ref, load_validators(cache_path=cache_path))
+    except GitError as e:
+        print_error(str(e))
+        return 1
+    elapsed = time.monotonic() - started
+    failing = sum(not result['meets_standards'] for result in results)
+
+    if args.format != 'text':
+        from audit_output import audit_records, write_json, write_ndjson
+        if args.format == 'ndjson':
+            for result in results:
+                write_ndjson(audit_records(result))
+            if profiler is not None:
+                print_profile(profiler, args.format)
+        elif profiler is not None:
+            write_json({'results': results, 'profile': profiler.report()})
+        else:
+            write_json(results[0] if len(results) == 1 else results)
+        return 1 if failing else 0
+
+    if len(results) == 1:
+        result = results[0]
+        print_header(f"Auditing Project: {args.project} at {result['ref']}")
+        if 'error' in result:
+            print_error(result['error'])
+            return 1
+        print(f"Commit: {result['commit']}")
+        exit_code = print_audit_report(result)
+        if profiler is not None:
+            print_profile(profiler, args.format)
+        return exit_code
+
+    print_header(f"Auditing Project: {args.project} at {len(results)} revision(s)")
+    for result in results:
+        label = result['ref'] + (f" ({result['commit'][:12]})" if 'commit' in result else "")
+        print_fleet_result(dict(result, project_path=label))
+    if profiler is not None:
+        print_profile(profiler, args.format)
+    print()
+    print(f"Audited {len(results)} revision(s) in {elapsed:.2f}s")
+    if failing:
+        print_warning(f"⚠️ {failing} of {len(results)} revision(s) need improvement")
+        return 1
+    print_success(f"🎉 All {len(results)} revisions meet quality standards!")
+    return 0
+
 def cmd_audit(args):
     """Project audit commands"""
+    if args.staged:
+        if not args.project or args.ref:
+            print_error("--staged audits one working tree; use it with --project and without --ref")
+            return 1
+        if args.no_cache:
+            print_error("--staged keeps its last result in the audit cache; drop --no-cache")
+            return 1
+    if args.ref:
+        if not args.project:
+            print_error("--ref audits one project; use it with --project")
+            return 1
+        if args.record:
+            print_error("--record keeps the history of working trees; it cannot be used with --ref")
+            return 1
+        return cmd_audit_refs(args)
+    if args.root:
+        return cmd_audit_fleet(args)
+    if args.workspace:
+        return cmd_audit_workspace(args)
     if args.project:
-        print_header(f"Auditing Project: {args.project}")
-        project_path = Path(args.project)
+        if args.format == 'text':
+            print_header(f"Auditing Project: {args.project}")
         
-        if not project_path.exists():
+        if not os.path.isdir(args.project):
             print_error(f"Project path does not exist: {args.project}")
             return 1
         
         # Import validators
-        sys.path.append(str(get_start_root() / "validators"))
-        from structure_validator import ProjectValidator
-        
-        # Check if it's a Python project for UV validation
-        is_python_project = (project_path / "pyproject.toml").exists() or \
-                           (project_path / "setup.py").exists() or \
-                           (project_path / "requirements.txt").exists()
+        add_validators_path()
         
-        # Basic structure audit
-        validator = ProjectValidator()
-        result = validator.audit_project(args.project)
+        profiler = start_profiler(args)
         
-        print(f"Project Type: {result['project_type']}")
-        print(f"Structure Score: {result['score']}/{result['total']} ({result['percentage']:.1f}%)")
-        print(f"Quality Level: {result['quality_level']}")
-        print()
-        
-        if result['passed']:
-            for check in result['passed']:
-                print(check)
+        # A running `start daemon` answers from warm validators and results
+        result = None
+        if not args.no_daemon and profiler is None and not args.staged:
+            from daemon_client import audit
+            result = audit(args.project)
         
-        if result['failed']:
-            for check in result['failed']:
-                print(check)
+        # In-process audits stream NDJSON check records as each check finishes
+        on_check = None
+        if args.format == 'ndjson' and result is None:
+            from audit_output import stream_checks
+            on_check = stream_checks(args.project)
         
-        # UV compliance check for Python projects  
-        if is_python_project:
-            print("\n" + "="*50)
-            print_header("UV-First Python Compliance Check")
+        if args.staged:
+            from fleet_auditor import load_validators
+            from audit_cache import default_cache_path
+            from git_metadata import GitError
+            from incremental_audit import audit_staged
             
             try:
-                from uv_validator import UVValidator
-                uv_validator = UVValidator()
-                uv_result = uv_validator.validate_uv_compliance(args.project)
-                
-                print(f"UV Compliance: {'✅ YES' if uv_result['uv_compliant'] else '❌ NO'}")
-                print(f"UV Score: {uv_result['score']}/{uv_result['total']} ({uv_result['percentage']:.1f}%)")
-                print(f"Compliance Level: {uv_result['compliance_level']}")
-                print()
-                
-                if uv_result['failed']:
-                    print("❌ UV Compliance Issues:")
-                    for issue in uv_result['failed']:
-                        print(f"  {issue}")
-                
-                # Overall compliance
-                if not uv_result['uv_compliant']:
-                    print_error("⚠️ Python project MUST be UV-compliant")
-                    return 1
-                else:
-                    print_success("✅ Python project is UV-compliant")
-                    
-            except ImportError as e:
-                print_error(f"UV validator not available: {e}")
+                result = audit_staged(args.project, load_validators(cache_path=default_cache_path()),
+                                      on_check)
+            except GitError as e:
+                print_error(str(e))
                 return 1
+            if args.format == 'text':
+                incremental = result['incremental']
+                if incremental['full']:
+                    print_status(f"Full audit: {incremental['reason']}")
+                else:
+                    print_status(f"{len(incremental['changed'])} changed path(s); "
+                                 f"re-ran {len(incremental['rerun'])} check(s), "
+                                 f"the rest are from the last audit")
+        elif result is None:
+            from fleet_auditor import audit_one, load_validators
+            from audit_cache import default_cache_path
+            
+            cache_path = None if args.no_cache else default_cache_path()
+            result = audit_one(args.project, load_validators(cache_path=cache_path),
+                               on_check=on_check)
         
-        # Overall result
-        if result['percentage'] >= 75 and (not is_python_project or uv_result.get('uv_compliant', False)):
-            print_success("🎉 Project meets all quality standards!")
-            return 0
+        list(record_history([result], args))
+        
+        if args.format == 'text':
+            exit_code = print_audit_report(result)
+            if profiler is not None:
+                print_profile(profiler, args.format)
+            return exit_code
+        
+        from audit_output import audit_records, write_json, write_ndjson
+        if args.format == 'ndjson':
+            write_ndjson(audit_records(result, checks=on_check is None))
+            if profiler is not None:
+                print_profile(profiler, args.format)
         else:
-            print_warning("⚠️ Project needs improvement to meet quality standards")
-            return 1
+            if profiler is not None:
+                result = dict(result, profile=profiler.report())
+            write_json(result)
+        return 0 if result['meets_standards'] else 1
     else:
         print_error("Project path required for audit")
         return 1
 
+def cmd_daemon(args):
+    """Run the long-lived audit daemon"""
+    add_validators_path()
+    from daemon_client import default_socket_path, request
+    
+    socket_path = args.socket or default_socket_path()
+    if args.daemon_command == 'status':
+        response = request({"op": "ping"}, socket_path)
+        if response is None:
+            print_warning(f"No daemon listening on {socket_path}")
+            return 1
+        print_success(f"✅ Daemon running (pid {response['pid']}) on {socket_path}")
+        print(f"Projects cached: {response['projects']}")
+        stats = response['stats']
+        print(f"Hits: {stats['hits']}, misses: {stats['misses']}, invalidations: {stats['invalidations']}")
+        return 0
+    if args.daemon_command == 'stop':
+        if request({"op": "shutdown"}, socket_path) is None:
+            print_warning(f"No daemon listening on {socket_path}")
+            return 1
+        print_success("✅ Daemon stopped")
+        return 0
+    
+    from audit_daemon import serve
+    print_status(f"Audit daemon listening on {socket_path}")
+    serve(socket_path, args.poll_interval, args.poll)
+    return 0
+
+def format_timestamp(ts):
+    import time
+    return time.strftime('%Y-%m-%d %H:%M', time.localtime(ts))
+
+def rule_label(rule):
+    """rule_id and path of a history rule, with #n for repeated checks"""
+    label = f"{rule['validator']}: {rule['rule_id']} {rule['path']}".rstrip()
+    return label + (f" #{rule['ordinal'] + 1}" if rule['ordinal'] else "")
+
+def cmd_report(args):
+    """Trend and regression reports from the audit history"""
+    add_validators_path()
+    from audit_history import AuditHistory, default_history_path, parse_since
+    from audit_output import write_json, write_ndjson
+
+    path = args.history or default_history_path()
+    if not os.path.exists(path):
+        print_error(f"No audit history at {path}; run `start audit --record` first")
+        return 1
+    try:
+        since = parse_since(args.since) if args.since else None
+    except ValueError as e:
+        print_error(str(e))
+        return 1
+    history = AuditHistory(path)
+
+    if args.report_command == 'regressions':
+        since = since if since is not None else parse_since('7d')
+        rows = history.regressions(since)
+        title = f"Projects Regressed Since {format_timestamp(since)}"
+    elif args.report_command == 'rules':
+        rows = history.pass_rates(since)
+        title = "Fleet-wide Pass Rate per Rule (worst first)"
+    else:
+        if not args.project:
+            print_error("--project is required for `start report trend`")
+            return 1
+        rows = history.trend(args.project)
+        if since is not None:
+            rows = [row for row in rows if row['ts'] >= since]
+        title = f"Score Trend: {args.project}"
+    history.close()
+
+    if args.format == 'json':
+        write_json(rows)
+        return 0
+    if args.format == 'ndjson':
+        record = args.report_command.rstrip('s')
+        write_ndjson(dict(record=record, **row) for row in rows)
+        return 0
+
+    print_header(title)
+    if not rows:
+        print_status("Nothing to report")
+        return 0
+    if args.report_command == 'regressions':
+        for row in rows:
+            before, now = row['before'], row['now']
+            print(f"❌ {row['project']}: {before['percentage']:.1f}% → {now['percentage']:.1f}%"
+                  f" ({before['score']}/{before['total']} → {now['score']}/{now['total']})")
+            for failure in row['new_failures']:
+                print(f"    {rule_label(failure)} (was {failure['was']}, failing since "
+                      f"{format_timestamp(failure['failing_since'])})")
+    elif args.report_command == 'rules':
+        for row in rows:
+            print(f"{row['pass_rate']:6.1f}%  {row['passed']:>5}/{row['projects']:<5}  {rule_label(row)}")
+    else:
+        for row in rows:
+            status = "✅" if row['meets_standards'] else "❌"
+            print(f"{format_timestamp(row['ts'])}  {status} {row['score']}/{row['total']} "
+                  f"({row['percentage']:.1f}%)")
+    return 0
+
 def cmd_bootstrap(args):
-    """Bootstrap new project from template"""
-    print_warning("Bootstrap command not implemented yet in Phase 001")
-    print_status("This will be available in Phase 002 with spec-kit integration")
+    """Bootstrap new project(s) from a template"""
+    import time
+    from pathlib import Path
+    from scaffold import TemplateError, bootstrap, default_manifest_dir
+
+    if not args.name:
+        print_error("Project name required: start bootstrap --name my-app")
+        return 1
+
+    template_dir = get_start_root() / "templates" / args.template
+    print_header(f"Bootstrapping from Template: {args.template}")
+    started = time.monotonic()
+    try:
+        result = bootstrap(template_dir, Path(args.output), args.name, args.count,
+                           author=args.author, email=args.email,
+                           description=args.description, workers=args.workers,
+                           link=args.link,
+                           cache_dir=None if args.no_cache else default_manifest_dir())
+    except (TemplateError, OSError) as e:
+        print_error(str(e))
+        return 1
+    elapsed = time.monotonic() - started
+
+    projects = result['projects']
+    if len(projects) == 1:
+        print_success(f"Created {projects[0]}")
+    else:
+        print_success(f"Created {len(projects)} projects under {args.output}")
+    files = result['files']
+    print_status(f"{sum(files.values())} file(s) in {elapsed:.2f}s: "
+                 + ", ".join(f"{count} {method}" for method, count in files.items() if count))
     return 0
 
+def print_plan(plan):
+    """Print a project's remediation plan as a unified diff plus manual follow-ups"""
+    changes = plan.file_changes
+    if not changes and not plan.manual:
+        return
+    print_header(plan.project_path)
+    for change in changes:
+        sys.stdout.writelines(change.diff())
+    for rule_id, path, hint in plan.manual:
+        print(f"⚠️ manual: {f'{rule_id} {path}'.rstrip()} - {hint}")
+    print()
+
+def cmd_standards_apply(args):
+    """Plan and apply fixes for failed checks across one project or a fleet"""
+    import time
+    from pathlib import Path
+
+    add_validators_path()
+    from fleet_auditor import audit_fleet, audit_one, discover_projects, load_validators
+    from audit_cache import default_cache_path
+    from remediation import DEFAULT_WORKERS, apply_plans, plan_project, reaudit
+
+    target = args.root or args.project
+    if not os.path.isdir(target):
+        print_error(f"Directory does not exist: {target}")
+        return 1
+
+    started = time.monotonic()
+    cache_path = None if args.no_cache else default_cache_path()
+    validators = load_validators(cache_path=cache_path)
+    if args.root:
+        projects = discover_projects(Path(args.root), args.depth)
+        results = audit_fleet(projects, args.workers, cache_path=cache_path)
+    else:
+        results = [audit_one(args.project, validators)]
+    standards = validators[1].uv_requirements
+    plans = sorted((plan_project(result, standards) for result in results),
+                   key=lambda plan: plan.project_path)
+    planned = [plan for plan in plans if plan.file_changes]
+    files = sum(len(plan.file_changes) for plan in planned)
+    manual = sum(len(plan.manual) for plan in plans)
+
+    if args.dry_run:
+        if args.format == 'json':
+            from audit_output import write_json
+            write_json([dict(plan.to_dict(), diff="".join(
+                line for change in plan.file_changes for line in change.diff()))
+                for plan in plans if plan.file_changes or plan.manual])
+            return 0
+        for plan in plans:
+            print_plan(plan)
+        print_status(f"Plan: {files} file change(s) in {len(planned)} of {len(plans)} "
+                     f"project(s); {manual} failure(s) need a manual fix")
+        return 0
+
+    applied = apply_plans(planned, args.workers or DEFAULT_WORKERS)
+    reports = []
+    for plan in planned:
+        outcomes = applied.get(plan.project_path, {})
+        written = [path for path, outcome in outcomes.items() if outcome in ('written', 'deleted')]
+        report = reaudit(plan, written, validators)
+        report.update(project_path=plan.project_path, files=outcomes)
+        reports.append(report)
+    elapsed = time.monotonic() - started
+
+    if args.format == 'json':
+        from audit_output import write_json
+        write_json({'projects': reports, 'manual': [
+            dict(project_path=plan.project_path, rule_id=rule_id, path=path, hint=hint)
+            for plan in plans for rule_id, path, hint in plan.manual]})
+    else:
+        print_header(f"Applying Standards: {target}")
+        for report in reports:
+            problems = {path: outcome for path, outcome in report['files'].items()
+                        if outcome not in ('written', 'deleted')}
+            status = "❌" if problems or report['failing'] else "✅"
+            print(f"{status} {report['project_path']}: {len(report['files']) - len(problems)} "
+                  f"file(s) changed, {len(report['fixed'])} check(s) fixed")
+            for path, outcome in sorted(problems.items()):
+                print(f"    {path}: {outcome}")
+            for validator, rule_id, path in report['failing']:
+                print(f"    still failing: {rule_id} {path}".rstrip())
+        print()
+        print(f"Applied {files} file change(s) to {len(planned)} project(s) in {elapsed:.2f}s")
+        if manual:
+            print_warning(f"⚠️ {manual} failure(s) need a manual fix "
+                          f"(see `start standards apply --dry-run`)")
+
+    failed = any(report['failing'] or any(outcome not in ('written', 'deleted')
+                                          for outcome in report['files'].values())
+                 for report in reports)
+    return 1 if failed else 0
+
+def cmd_standards_sync(args):
+    """Render agents-md.template into AGENTS.md across one project or a fleet"""
+    import difflib
+    import time
+    from pathlib import Path
+
+    add_validators_path()
+    from fleet_auditor import discover_projects
+    from audit_cache import AuditCache, default_cache_path
+    from uv_validator import UVValidator
+    from agents_sync import AgentsTemplate, TemplateError, sync_projects
+    from remediation import DEFAULT_WORKERS
+
+    target = args.root or args.project
+    if not os.path.isdir(target):
+        print_error(f"Directory does not exist: {target}")
+        return 1
+
+    started = time.monotonic()
+    uv_validator = UVValidator()
+    try:
+        template = AgentsTemplate.load(uv_validator.standards_dir, uv_validator.uv_requirements)
+    except TemplateError as e:
+        print_error(str(e))
+        return 1
+
+    if args.root:
+        projects = [str(project) for project in discover_projects(Path(args.root), args.depth)]
+    else:
+        projects = [os.path.abspath(args.project)]
+    cache = None if args.no_cache else AuditCache(default_cache_path())
+    results = sync_projects(projects, template, cache, args.dry_run,
+                            args.workers or DEFAULT_WORKERS)
+    elapsed = time.monotonic() - started
+    if cache is not None:
+        cache.close()
+
+    changed = [result for result in results if result['action'] != 'unchanged']
+    conflicts = [result for result in changed if result.get('outcome') == 'conflict']
+    if args.format == 'json':
+        from audit_output import write_json
+        write_json([{key: value for key, value in result.items() if key not in ('before', 'after')}
+                    for result in results])
+        return 1 if conflicts else 0
+
+    if args.dry_run:
+        for result in changed:
+            print_header(result['project_path'])
+            before = (result['before'] or '').splitlines(keepends=True)
+            sys.stdout.writelines(difflib.unified_diff(
+                before, result['after'].splitlines(keepends=True),
+                '/dev/null' if result['before'] is None else 'a/AGENTS.md', 'b/AGENTS.md'))
+            print()
+    else:
+        for result in changed:
+            status = "❌" if result in conflicts else "✅"
+            outcome = "changed since it was read; skipped" if result in conflicts else (
+                "created" if result['action'] == 'create' else "updated")
+            print(f"{status} {result['project_path']}/AGENTS.md {outcome}")
+
+    cached = sum(1 for result in results if result.get('cached'))
+    verb = "would change" if args.dry_run else "written"
+    print_status(f"{len(changed) - len(conflicts)} {verb}, "
+                 f"{len(results) - len(changed)} unchanged ({cached} from cache) "
+                 f"in {elapsed:.2f}s")
+    if conflicts:
+        print_error(f"{len(conflicts)} AGENTS.md file(s) changed during the sync; run it again")
+    return 1 if conflicts else 0
+
 def cmd_standards(args):
     """Standards management commands"""
-    print_warning("Standards management not implemented yet in Phase 001")
+    if args.standards_command == 'apply':
+        return cmd_standards_apply(args)
+    if args.standards_command == 'sync':
+        return cmd_standards_sync(args)
+    print_warning(f"Standards command '{args.standards_command}' not implemented yet")
     print_status("This will be available in Phase 002 with full validation")
     return 0
 
@@ -194,14 +866,14 @@ def cmd_status(args):
     """Show overall system status"""
     print_header("Start - Project Quality Controller Status")
     
-    start_root = get_start_root()
+    start_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     print(f"📂 Start Root: {start_root}")
     
     # Check directories
     dirs_to_check = ["templates", "standards", "scripts", "validators", "cli", "docs"]
     for dir_name in dirs_to_check:
-        dir_path = start_root / dir_name
-        if dir_path.exists():
+        dir_path = os.path.join(start_root, dir_name)
+        if os.path.exists(dir_path):
             print_success(f"✅ {dir_name}/ directory")
         else:
             print_warning(f"❌ {dir_name}/ directory")
@@ -214,8 +886,8 @@ def cmd_status(args):
     ]
     
     for file_path in key_files:
-        full_path = start_root / file_path
-        if full_path.exists():
+        full_path = os.path.join(start_root, file_path)
+        if os.path.exists(full_path):
             print_success(f"✅ {file_path}")
         else:
             print_warning(f"❌ {file_path}")
@@ -226,81 +898,207 @@ def cmd_status(args):
     
     return 0
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Start - Phase 001 Project Quality Controller",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+def configure_status(parser):
+    pass
+
+def configure_system(parser):
+    from project_updates import DEFAULT_APPS_DIR, DEFAULT_CONCURRENCY, DEFAULT_TIMEOUT
+
+    parser.add_argument('system_command', 
+                        choices=['check', 'update', 'projects'],
+                        help='System command to run')
+    parser.add_argument('--apps-dir', default=str(DEFAULT_APPS_DIR),
+                        help='Directory of repositories for `projects` (default: ~/Apps)')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'Repositories checked in parallel by `projects` (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help=f'Per-repository timeout in seconds for `projects` (default: {DEFAULT_TIMEOUT:g})')
+
+def configure_templates(parser):
+    parser.add_argument('template_command',
+                        choices=['list'],
+                        help='Template command to run')
+
+def configure_audit(parser):
+    audit_target = parser.add_mutually_exclusive_group(required=True)
+    audit_target.add_argument('--project', '-p',
+                              help='Path to project to audit')
+    audit_target.add_argument('--root', '-r',
+                              help='Audit every project found under this directory')
+    audit_target.add_argument('--workspace', '-w',
+                              help='Audit a monorepo: every nested package plus the workspace root')
+    parser.add_argument('--workers', '-j', type=int,
+                        help='Worker processes for --root/--workspace (default: CPU count)')
+    parser.add_argument('--depth', type=int, default=2,
+                        help='Maximum project discovery depth for --root')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-run every check instead of using ~/.cache/start')
+    parser.add_argument('--format', choices=['text', 'json', 'ndjson'], default='text',
+                        help='Output format; ndjson streams one record per check')
+    parser.add_argument('--no-daemon', action='store_true',
+                        help='Audit in-process even if `start daemon` is running')
+    parser.add_argument('--profile', action='store_true',
+                        help='Report per-check time, bytes read, stats and spawns')
+    parser.add_argument('--record', action='store_true',
+                        help='Append results to the audit history (see `start report`)')
+    parser.add_argument('--staged', action='store_true',
+                        help='Re-run only the checks the staged changes affect, taking the '
+                             'rest from the last audit (for pre-commit hooks)')
+    parser.add_argument('--ref', action='append', metavar='REV',
+                        help='Audit the project as committed at a revision (tag, branch, '
+                             'commit, HEAD~3) without checking it out; repeat for several')
+
+def configure_daemon(parser):
+    parser.add_argument('daemon_command', nargs='?', default='run',
+                        choices=['run', 'status', 'stop'],
+                        help='Run the daemon in the foreground (default), or query/stop it')
+    parser.add_argument('--socket', help='Unix socket path (default: $XDG_RUNTIME_DIR/start/audit.sock)')
+    parser.add_argument('--poll', action='store_true',
+                        help='Poll for changes instead of using inotify')
+    parser.add_argument('--poll-interval', type=float, default=2.0,
+                        help='Seconds between polls when polling')
+
+def configure_report(parser):
+    parser.add_argument('report_command', nargs='?', default='regressions',
+                        choices=['regressions', 'rules', 'trend'],
+                        help='Projects whose score dropped (default), pass rate per rule, '
+                             'or one project\'s score history')
+    parser.add_argument('--since', help='Time window, e.g. 7d, 24h, 2w or YYYY-MM-DD '
+                                        '(regressions default: 7d)')
+    parser.add_argument('--project', '-p', help='Project for `trend`')
+    parser.add_argument('--history', help='History database (default: '
+                                          '$XDG_DATA_HOME/start/audit-history.sqlite3)')
+    parser.add_argument('--format', choices=['text', 'json', 'ndjson'], default='text',
+                        help='Output format')
+
+def configure_bootstrap(parser):
+    parser.add_argument('--template', '-t', default='python-project',
+                        help='Template name (default: python-project)')
+    parser.add_argument('--name', '-n', help='Project name')
+    parser.add_argument('--output', '-o', default='.',
+                        help='Directory to create the project in (default: current directory)')
+    parser.add_argument('--author', help='Author name (default: $GIT_AUTHOR_NAME)')
+    parser.add_argument('--email', help='Author email (default: $GIT_AUTHOR_EMAIL)')
+    parser.add_argument('--description', help='One-line project description')
+    parser.add_argument('--count', type=int, default=1,
+                        help='Create N projects named NAME-1 .. NAME-N')
+    parser.add_argument('--workers', '-j', type=int, default=8,
+                        help='Threads writing files (default: 8)')
+    parser.add_argument('--link', action='store_true',
+                        help='Hardlink verbatim files to the template (for throwaway projects)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-parse the template instead of using ~/.cache/start')
+
+def configure_standards(parser):
+    parser.add_argument('standards_command', 
+                        choices=['sync', 'apply', 'check'],
+                        help='Standards command')
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--project', '-p', default='.',
+                        help='Project to fix or sync (default: current directory)')
+    target.add_argument('--root', '-r',
+                        help='Fix or sync every project found under this directory')
+    parser.add_argument('--depth', type=int, default=2,
+                        help='Maximum project discovery depth for --root')
+    parser.add_argument('--dry-run', '-n', action='store_true',
+                        help='Show the changes as a diff without writing')
+    parser.add_argument('--workers', '-j', type=int,
+                        help='Audit processes and writer threads (default: CPU count / 16)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-run every check instead of using ~/.cache/start')
+    parser.add_argument('--format', choices=['text', 'json'], default='text',
+                        help='Output format')
+
+# Subcommand dispatch table: name -> (help, argument setup, handler).
+# Handlers import their own dependencies, so a command only pays for
+# the modules it actually uses.
+COMMANDS = {
+    'status': ('Show system status', configure_status, cmd_status),
+    'system': ('System management', configure_system, cmd_system),
+    'templates': ('Template management', configure_templates, cmd_templates),
+    'audit': ('Audit project quality', configure_audit, cmd_audit),
+    'daemon': ('Run the background audit daemon', configure_daemon, cmd_daemon),
+    'report': ('Audit history trends and regressions', configure_report, cmd_report),
+    'bootstrap': ('Bootstrap new project', configure_bootstrap, cmd_bootstrap),
+    'standards': ('Standards management', configure_standards, cmd_standards),
+}
+
+EPILOG = """
 Examples:
   start status                           # Show system status
   start system check                     # Check for system updates
   start system update                    # Update development tools
   start audit --project /path/to/project # Audit project quality
+  start audit --root ~/Apps              # Audit every project under a directory
+  start audit --workspace ~/Apps/mono    # Audit each package of a monorepo
+  start audit -p . --ref v1.0 --ref main # Audit committed revisions, no checkout
+  start audit -p . --staged              # Pre-commit: re-run checks the staged files affect
+  start daemon                           # Keep audits warm for editors and hooks
+  start report --since 7d                # Projects that regressed this week
+  start standards apply -r ~/Apps -n     # Preview fixes for failed checks as a diff
+  start standards sync -r ~/Apps         # Render agents-md.template into every AGENTS.md
   start templates list                   # List available templates
+  start bootstrap --name my-app          # Create a project from a template
 
 Phase 001 Features:
   ✅ System management (NVM, Oh My Zsh)
   ✅ Basic project auditing
   ✅ Template structure (ready for Phase 002)
-  ⏳ Bootstrap (Phase 002)
+  ✅ Bootstrap from templates
   ⏳ Full standards validation (Phase 002)
         """
+
+class ParsedArgs:
+    """Minimal stand-in for argparse.Namespace on the fast paths"""
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+# Invocations with nothing to parse skip building the argparse parser
+FAST_PATHS = {
+    (): lambda: cmd_status(ParsedArgs(command='status')),
+    ('status',): lambda: cmd_status(ParsedArgs(command='status')),
+    ('templates', 'list'): lambda: cmd_templates(ParsedArgs(command='templates',
+                                                            template_command='list')),
+}
+
+def build_parser(command=None):
+    """Build the argument parser, only configuring `command` when given"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        prog="start",
+        description="Start - Phase 001 Project Quality Controller",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=EPILOG
     )
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    for name, (help_text, configure, _) in COMMANDS.items():
+        if command is None or name == command:
+            configure(subparsers.add_parser(name, help=help_text))
     
-    # Status command
-    status_parser = subparsers.add_parser('status', help='Show system status')
-    
-    # System management commands  
-    system_parser = subparsers.add_parser('system', help='System management')
-    system_parser.add_argument('system_command', 
-                              choices=['check', 'update', 'projects'],
-                              help='System command to run')
-    
-    # Template management
-    templates_parser = subparsers.add_parser('templates', help='Template management')
-    templates_parser.add_argument('template_command',
-                                 choices=['list'],
-                                 help='Template command to run')
-    
-    # Project audit
-    audit_parser = subparsers.add_parser('audit', help='Audit project quality')
-    audit_parser.add_argument('--project', '-p', required=True,
-                             help='Path to project to audit')
-    
-    # Bootstrap (placeholder for Phase 002)
-    bootstrap_parser = subparsers.add_parser('bootstrap', help='Bootstrap new project')
-    bootstrap_parser.add_argument('--template', '-t', help='Template name')
-    bootstrap_parser.add_argument('--name', '-n', help='Project name')
+    return parser
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
     
-    # Standards (placeholder for Phase 002)
-    standards_parser = subparsers.add_parser('standards', help='Standards management')
-    standards_parser.add_argument('standards_command', 
-                                 choices=['sync', 'apply', 'check'],
-                                 help='Standards command')
+    fast_path = FAST_PATHS.get(tuple(argv))
+    if fast_path is not None:
+        return fast_path()
     
-    args = parser.parse_args()
+    command = argv[0] if argv[0] in COMMANDS else None
+    args = build_parser(command).parse_args(argv)
     
     if not args.command:
         args.command = 'status'
     
     # Route to appropriate command handler
-    if args.command == 'status':
-        return cmd_status(args)
-    elif args.command == 'system':
-        return cmd_system(args)
-    elif args.command == 'templates':
-        return cmd_templates(args)
-    elif args.command == 'audit':
-        return cmd_audit(args)
-    elif args.command == 'bootstrap':
-        return cmd_bootstrap(args)
-    elif args.command == 'standards':
-        return cmd_standards(args)
-    else:
+    handler = COMMANDS.get(args.command)
+    if handler is None:
         print_error(f"Unknown command: {args.command}")
         return 1
+    return handler[2](args)
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
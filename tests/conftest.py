@@ -0,0 +1,68 @@
+"""Shared fixtures; the flat validators/ and cli/ modules are importable as in cli/start.py"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+for directory in ("validators", "cli"):
+    if str(ROOT / directory) not in sys.path:
+        sys.path.insert(0, str(ROOT / directory))
+
+# Tests never read the user's git configuration
+GIT_ENV = dict(
+    os.environ,
+    GIT_CONFIG_GLOBAL=os.devnull,
+    GIT_CONFIG_NOSYSTEM="1",
+    GIT_AUTHOR_NAME="Test",
+    GIT_AUTHOR_EMAIL="test@example.com",
+    GIT_COMMITTER_NAME="Test",
+    GIT_COMMITTER_EMAIL="test@example.com",
+    GIT_TERMINAL_PROMPT="0",
+)
+
+
+def run_git(repo, *args: str, check: bool = True, input: str = None) -> str:
+    """Run git in repo, feeding it input, and return its stdout"""
+    completed = subprocess.run(["git", *args], cwd=str(repo), env=GIT_ENV, check=check,
+                               input=input and input.encode(),
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    return completed.stdout.decode()
+
+
+@pytest.fixture(autouse=True)
+def isolated_git(monkeypatch):
+    """Point git spawned by the code under test at the same empty configuration"""
+    for name in ("GIT_CONFIG_GLOBAL", "GIT_CONFIG_NOSYSTEM", "GIT_AUTHOR_NAME",
+                 "GIT_AUTHOR_EMAIL", "GIT_COMMITTER_NAME", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.setenv(name, GIT_ENV[name])
+
+
+@pytest.fixture
+def git():
+    return run_git
+
+
+@pytest.fixture
+def git_env():
+    return dict(GIT_ENV)
+
+
+@pytest.fixture
+def make_repo(tmp_path):
+    """Create a repository holding files ({path: content}), committed unless commit=False"""
+    def make(name: str = "repo", files=None, commit: bool = True, branch: str = "main") -> Path:
+        repo = tmp_path / name
+        repo.mkdir(parents=True)
+        run_git(repo, "init", "-q", "-b", branch)
+        for path, content in (files or {}).items():
+            (repo / path).parent.mkdir(parents=True, exist_ok=True)
+            (repo / path).write_text(content)
+        if commit and files:
+            run_git(repo, "add", "-A")
+            run_git(repo, "commit", "-q", "-m", "initial")
+        return repo
+    return make
@@ -0,0 +1,139 @@
+"""agents_sync rendering, keep regions, adoption and the sync stamp"""
+
+import pytest
+
+from agents_sync import AgentsTemplate, TemplateError, read_regions, sync_projects
+from audit_cache import AuditCache
+from uv_validator import UVValidator
+
+TEMPLATE = """# AGENTS.md template
+
+```markdown
+# {{name}}
+
+## Overview
+<!-- start:keep overview -->
+{{description}}
+<!-- start:end overview -->
+
+## Conventions
+Follow the standards.
+
+## Tasks
+<!-- start:keep tasks -->
+None yet.
+<!-- start:end tasks -->
+```
+"""
+
+
+@pytest.fixture
+def template():
+    return AgentsTemplate(TEMPLATE, {})
+
+
+@pytest.fixture
+def project(tmp_path):
+    path = tmp_path / "demo"
+    path.mkdir()
+    (path / "package.json").write_text('{"name": "demo", "description": "A demo app"}')
+    return path
+
+
+def sync(project, template, **kwargs):
+    [result] = sync_projects([str(project)], template, workers=1, **kwargs)
+    return result
+
+
+def test_creates_from_template(project, template):
+    result = sync(project, template)
+    assert (result["action"], result["outcome"]) == ("create", "written")
+    text = (project / "AGENTS.md").read_text()
+    assert text.startswith("# demo\n")
+    assert read_regions(text) == {"overview": "A demo app\n", "tasks": "None yet.\n"}
+    assert sync(project, template)["action"] == "unchanged"
+
+
+def test_keep_regions_survive_and_managed_text_is_restored(project, template):
+    sync(project, template)
+    path = project / "AGENTS.md"
+    edited = path.read_text().replace("None yet.", "- `npm test`").replace(
+        "Follow the standards.", "Anything goes.")
+    path.write_text(edited)
+
+    assert sync(project, template)["action"] == "update"
+    text = path.read_text()
+    assert "- `npm test`" in text and "Follow the standards." in text
+    assert "Anything goes." not in text
+
+
+def test_regions_dropped_from_the_template_are_kept(project, template):
+    sync(project, template)
+    path = project / "AGENTS.md"
+    path.write_text(path.read_text() + "\n<!-- start:keep local -->\nMine\n"
+                                       "<!-- start:end local -->\n")
+    sync(project, template)
+    assert read_regions(path.read_text())["local"] == "Mine\n"
+    assert sync(project, template)["action"] == "unchanged"
+
+
+def test_adopts_a_document_without_markers(project, template):
+    (project / "AGENTS.md").write_text(
+        "# Old title\n\nIntro text.\n\n## Overview\nHand-written overview.\n\n"
+        "## Conventions\nOld conventions.\n\n## Deploying\nRun `make deploy`.\n\n"
+        "```\n## not a heading\n```\n")
+    sync(project, template)
+    regions = read_regions((project / "AGENTS.md").read_text())
+    assert regions["overview"] == "Hand-written overview.\n"
+    assert regions["tasks"] == "None yet.\n"
+    assert regions["notes"] == ("Intro text.\n\n## Deploying\nRun `make deploy`.\n\n"
+                                "```\n## not a heading\n```\n")
+    assert sync(project, template)["action"] == "unchanged"
+
+
+def test_python_projects_get_the_uv_sections(tmp_path):
+    validator = UVValidator()
+    template = AgentsTemplate.load(validator.standards_dir, validator.uv_requirements)
+    project = tmp_path / "pyapp"
+    project.mkdir()
+    (project / "pyproject.toml").write_text('[project]\nname = "pyapp"\n')
+    sync(project, template)
+    text = (project / "AGENTS.md").read_text()
+    for section in validator.uv_requirements["agents_md_uv_sections"]["required_sections"]:
+        assert section["section"] in text
+    assert sync(project, template)["action"] == "unchanged"
+
+
+def test_dry_run_writes_nothing(project, template):
+    result = sync(project, template, dry_run=True)
+    assert result["action"] == "create" and "outcome" not in result
+    assert not (project / "AGENTS.md").exists()
+
+
+def test_unchanged_projects_are_answered_from_the_cache(project, template, tmp_path):
+    cache = AuditCache(tmp_path / "cache.db")
+    try:
+        assert sync(project, template, cache=cache)["action"] == "create"
+        assert sync(project, template, cache=cache) == {
+            "project_path": str(project), "action": "unchanged", "cached": True}
+
+        # A changed input is read again; the description only seeds the kept overview
+        (project / "package.json").write_text('{"name": "renamed", "description": "Other"}')
+        result = sync(project, template, cache=cache)
+        assert result["action"] == "update" and "cached" not in result
+        text = (project / "AGENTS.md").read_text()
+        assert text.startswith("# renamed\n")
+        assert read_regions(text)["overview"] == "A demo app\n"
+    finally:
+        cache.close()
+
+
+@pytest.mark.parametrize("text, message", [
+    ("no example block", "no ```markdown example block"),
+    ("```markdown\n{{owner}}\n```\n", "Unknown placeholder"),
+    ("```markdown\n<!-- start:keep a -->\n<!-- start:end a -->\n"
+     "<!-- start:keep a -->\n<!-- start:end a -->\n```\n", "repeats a keep region"),
+])
+def test_template_errors(text, message):
+    with pytest.raises(TemplateError, match=message):
+        AgentsTemplate(text, {})
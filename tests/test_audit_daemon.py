@@ -0,0 +1,43 @@
+"""AuditService invalidation as watched directories change, vanish and return"""
+
+import shutil
+import time
+
+import pytest
+
+from audit_daemon import AuditService
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.02)
+
+
+@pytest.fixture
+def project(tmp_path):
+    path = tmp_path / "demo"
+    (path / "src" / "demo").mkdir(parents=True)
+    (path / "pyproject.toml").write_text('[project]\nname = "demo"\n')
+    (path / "src" / "demo" / "__init__.py").write_text("")
+    return path
+
+
+@pytest.mark.parametrize("force_polling", [False, True])
+def test_recreated_directories_are_watched_again(project, force_polling):
+    service = AuditService(poll_interval=0.02, force_polling=force_polling)
+    src = str(project / "src")
+    service.audit(str(project))
+    assert src in service.watched and str(project) in service.outcomes
+
+    shutil.rmtree(src)
+    wait_for(lambda: src not in service.watched)
+    assert str(project) not in service.outcomes
+
+    (project / "src").mkdir()
+    service.audit(str(project))
+    assert src in service.watched and str(project) in service.outcomes
+
+    (project / "src" / "new.py").write_text("")
+    wait_for(lambda: str(project) not in service.outcomes)
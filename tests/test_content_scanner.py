@@ -0,0 +1,83 @@
+"""content_scanner compared with a position-by-position search"""
+
+import random
+
+import pytest
+
+from content_scanner import ContentScanner, register_patterns, scanner_for
+
+PATTERNS = ["pip install", "uv pip install", "uv", "UV PIP", "pip", "aaa", "a", "\n\n"]
+IGNORE_CASE = ["uv", "UV PIP"]
+
+
+def expected_hits(text, patterns, ignore_case):
+    """{pattern: [(offset, line, column)]} found by trying every position"""
+    hits = {}
+    for pattern in patterns:
+        folded = pattern in ignore_case
+        haystack, needle = (text.lower(), pattern.lower()) if folded else (text, pattern)
+        hits[pattern] = [
+            (start, text.count("\n", 0, start) + 1, start - text.rfind("\n", 0, start))
+            for start in range(len(text)) if haystack.startswith(needle, start)
+        ]
+    return hits
+
+
+def actual_hits(result):
+    return {pattern: [tuple(hit) for hit in hits] for pattern, hits in result.hits.items()}
+
+
+def sample_text(seed: int, length: int = 2000) -> str:
+    words = ["uv pip install", "UV Pip install", "pip install", "pip", "aaaa", "a", " ",
+             "\n", "\n\n", "x", "Uv", "  \t", "install"]
+    rng = random.Random(seed)
+    return "".join(rng.choice(words) for _ in range(length // 4))
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("chunk_size", [1, 3, 13, 1 << 20])
+def test_matches_every_position(seed, chunk_size):
+    text = sample_text(seed)
+    scanner = ContentScanner(PATTERNS, IGNORE_CASE)
+    chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+    result = scanner.scan_chunks(chunks)
+    assert actual_hits(result) == expected_hits(text, PATTERNS, IGNORE_CASE)
+    assert result.length == len(text)
+    assert result.stripped_length == len(text.strip())
+
+
+def test_overlapping_hits_and_locations():
+    scanner = ContentScanner(["pip install", "uv pip install"])
+    result = scanner.scan_text("# Setup\n\nRun `uv pip install -e .`\n")
+    assert result.first("uv pip install").location() == "3:6"
+    assert result.first("pip install").location() == "3:9"
+    assert not ContentScanner(["pip install"]).scan_text("pip  install").found("pip install")
+
+
+def test_scan_file_streams_in_chunks(tmp_path):
+    text = sample_text(7, length=20000)
+    path = tmp_path / "AGENTS.md"
+    path.write_text(text, encoding="utf-8", newline="")
+    scanner = ContentScanner(PATTERNS, IGNORE_CASE)
+    assert actual_hits(scanner.scan_file(path, chunk_size=64)) == expected_hits(
+        text, PATTERNS, IGNORE_CASE)
+
+
+def test_empty_input_and_no_patterns():
+    result = ContentScanner(PATTERNS).scan_text("")
+    assert result.length == result.stripped_length == 0
+    assert not any(result.hits.values())
+    assert ContentScanner([]).scan_text("anything").hits == {}
+    assert ContentScanner(["x"]).scan_text("   \n\t ").stripped_length == 0
+
+
+def test_registered_patterns_share_one_scanner():
+    register_patterns("TEST_SCANNER.md", ["needle"])
+    first = scanner_for("TEST_SCANNER.md")
+    assert scanner_for("TEST_SCANNER.md") is first
+    register_patterns("TEST_SCANNER.md", ["Other"], ignore_case=True)
+    scanner = scanner_for("TEST_SCANNER.md")
+    assert scanner is not first
+    result = scanner.scan_text("needle OTHER Needle")
+    assert [hit.column for hit in result.hits["needle"]] == [1]
+    assert [hit.column for hit in result.hits["Other"]] == [8]
@@ -0,0 +1,152 @@
+"""git_metadata compared with what `git` itself reports for the same repository"""
+
+import pytest
+
+from git_metadata import GitError, GitRepository
+
+FILES = {
+    "README.md": "readme\n",
+    "setup.py": "print('setup')\n",
+    "src/pkg/__init__.py": "",
+    "src/pkg/core.py": "VALUE = 1\n",
+    "src/pkg/sub/deep.py": "DEEP = 1\n",
+    "docs/index.md": "# Docs\n",
+}
+
+
+def lines(output: str):
+    return sorted(line for line in output.splitlines() if line)
+
+
+@pytest.fixture
+def repo(make_repo):
+    return make_repo(files=FILES)
+
+
+def edit_tree(repo, git):
+    """Staged additions, edits, deletions and a mode change across nested directories"""
+    (repo / "src/pkg/core.py").write_text("VALUE = 2\n")
+    (repo / "src/pkg/sub/new.py").write_text("NEW = 1\n")
+    (repo / "top.txt").write_text("top\n")
+    git(repo, "rm", "-q", "docs/index.md")
+    git(repo, "update-index", "--chmod=+x", "setup.py")
+    git(repo, "add", "-A")
+
+
+def test_head_and_refs(repo, git):
+    repository = GitRepository.discover(repo)
+    assert repository.head() == ("main", git(repo, "rev-parse", "HEAD").strip())
+
+    git(repo, "tag", "-a", "-m", "release", "v1")
+    git(repo, "pack-refs", "--all")
+    assert repository.resolve_revision("v1") == git(repo, "rev-parse", "v1^{commit}").strip()
+
+    git(repo, "checkout", "-q", "--detach")
+    assert GitRepository.discover(repo).head() == (None, git(repo, "rev-parse", "HEAD").strip())
+
+
+def test_discover_linked_worktree(repo, git, tmp_path):
+    git(repo, "worktree", "add", "-q", "-b", "other", str(tmp_path / "linked"))
+    repository = GitRepository.discover(tmp_path / "linked")
+    assert repository.head() == ("other", git(repo, "rev-parse", "HEAD").strip())
+    assert GitRepository.discover(tmp_path) is None
+
+
+def test_packed_history(repo, git):
+    """Revisions, trees and diffs read through delta-compressed pack files"""
+    for number in range(5):
+        (repo / "src/pkg/core.py").write_text("VALUE = 1\n" * 50 + f"CHANGE = {number}\n")
+        (repo / f"docs/page{number}.md").write_text(f"page {number}\n")
+        git(repo, "add", "-A")
+        git(repo, "commit", "-q", "-m", f"change {number}")
+    git(repo, "gc", "-q", "--aggressive")
+    assert not list((repo / ".git/objects").glob("??/*"))
+
+    repository = GitRepository.discover(repo)
+    short = git(repo, "rev-parse", "--short", "HEAD~3").strip()
+    for revision in ("HEAD", "HEAD~2", "main^", short):
+        sha = repository.resolve_revision(revision)
+        assert sha == git(repo, "rev-parse", revision).strip()
+        assert sorted(repository.tree_files(repository.commit_tree(sha))) == lines(
+            git(repo, "ls-tree", "-r", "--name-only", sha))
+    assert repository.changed_files(repository.resolve_revision("HEAD~4"),
+                                    repository.resolve_revision("HEAD")) == lines(
+        git(repo, "diff", "--name-only", "HEAD~4", "HEAD"))
+    with pytest.raises(GitError):
+        repository.resolve_revision("HEAD~20")
+
+
+def test_ahead_behind(repo, git, tmp_path):
+    clone = tmp_path / "clone"
+    git(tmp_path, "clone", "-q", str(repo), str(clone))
+    for number in range(3):
+        (repo / "README.md").write_text(f"upstream {number}\n")
+        git(repo, "commit", "-q", "-am", f"upstream {number}")
+    (clone / "local.txt").write_text("local\n")
+    git(clone, "add", "local.txt")
+    git(clone, "commit", "-q", "-m", "local")
+    git(clone, "fetch", "-q")
+
+    repository = GitRepository.discover(clone)
+    upstream = repository.upstream("main")
+    assert upstream == "refs/remotes/origin/main"
+    ahead, behind = git(clone, "rev-list", "--left-right", "--count",
+                        "HEAD...origin/main").split()
+    assert repository.ahead_behind(repository.head()[1], repository.resolve(upstream)) == (
+        int(ahead), int(behind))
+    assert repository.resolve_revision("FETCH_HEAD") == git(clone, "rev-parse",
+                                                            "FETCH_HEAD").strip()
+
+
+@pytest.mark.parametrize("version", ["2", "3", "4"])
+def test_staged_files(repo, git, version):
+    git(repo, "update-index", "--index-version", version)
+    repository = GitRepository.discover(repo)
+    assert repository.staged_files() == []
+
+    edit_tree(repo, git)
+    git(repo, "update-index", "--index-version", version)
+    expected = lines(git(repo, "diff", "--cached", "--name-only"))
+    assert expected
+    assert repository.staged_files() == expected
+    git(repo, "commit", "-q", "-m", "edits")
+    assert repository.staged_files() == []
+
+
+def test_staged_files_before_first_commit(make_repo, git):
+    repo = make_repo(files=FILES, commit=False)
+    git(repo, "add", "src", "README.md")
+    assert GitRepository.discover(repo).staged_files() == lines(
+        git(repo, "diff", "--cached", "--name-only", "--root"))
+
+
+@pytest.mark.parametrize("version", ["2", "4"])
+def test_modified_files(repo, git, version):
+    git(repo, "update-index", "--index-version", version)
+    repository = GitRepository.discover(repo)
+    assert repository.modified_files() == []
+
+    (repo / "src/pkg/core.py").write_text("VALUE = 3\n")  # same size
+    (repo / "README.md").write_text("a longer readme\n")
+    (repo / "src/pkg/sub/deep.py").unlink()
+    (repo / "setup.py").chmod(0o755)
+    assert sorted(repository.modified_files()) == lines(git(repo, "diff", "--name-only"))
+
+
+def test_split_index_is_refused(repo, git):
+    edit_tree(repo, git)
+    git(repo, "update-index", "--split-index")
+    repository = GitRepository.discover(repo)
+    for read in (repository.index_entries, repository.modified_files,
+                 repository.staged_files):
+        with pytest.raises(GitError, match="split index"):
+            read()
+
+    git(repo, "update-index", "--no-split-index")
+    assert repository.staged_files() == lines(git(repo, "diff", "--cached", "--name-only"))
+
+
+def test_sparse_index_is_refused(repo, git):
+    git(repo, "sparse-checkout", "set", "--cone", "--sparse-index", "src")
+    with pytest.raises(GitError, match="sparse index"):
+        GitRepository.discover(repo).modified_files()
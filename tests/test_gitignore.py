@@ -0,0 +1,105 @@
+"""gitignore compared with `git check-ignore` and `git ls-files` on the same tree"""
+
+import pytest
+
+from gitignore import GitignoreMatcher, compile_rules
+
+ROOT_RULES = r"""
+# comment
+*.log
+!keep.log
+/rooted.txt
+build/
+docs/**/generated
+**/cache
+a/**/z.txt
+*.py[co]
+data?.csv
+[!x]ray.md
+\#literal
+\!bang
+trailing\
+spaced
+doc/*.txt
+dist
+!dist/keep/
+"""
+
+NESTED_RULES = """
+*.md
+!README.md
+/local.txt
+"""
+
+PATHS = [
+    "app.log", "keep.log", "sub/deep/app.log", "sub/keep.log",
+    "rooted.txt", "sub/rooted.txt",
+    "build/out.o", "sub/build/out.o", "build.txt",
+    "docs/a/generated", "docs/a/b/generated/file", "docs/generated", "other/generated",
+    "cache/x", "deep/er/cache/x", "cached/x",
+    "a/z.txt", "a/b/c/z.txt", "b/a/z.txt",
+    "mod.pyc", "mod.pyo", "mod.py", "pkg/mod.pyc",
+    "data1.csv", "data12.csv", "xray.md", "gray.md",
+    "#literal", "!bang", "trailing ", "spaced", "spaced   ",
+    "doc/a.txt", "doc/sub/a.txt",
+    "dist/app.js", "dist/keep/file",
+    "nested/notes.md", "nested/README.md", "nested/local.txt", "nested/inner/local.txt",
+    "nested/inner/x.md",
+]
+
+
+@pytest.fixture
+def tree(make_repo):
+    files = {path: "x\n" for path in PATHS}
+    files[".gitignore"] = ROOT_RULES
+    files["nested/.gitignore"] = NESTED_RULES
+    return make_repo(files=files, commit=False)
+
+
+def candidates():
+    """Every path and each of its parent directories, as (path, is_dir)"""
+    seen = {}
+    for path in PATHS:
+        parts = path.split("/")
+        for end in range(1, len(parts)):
+            seen["/".join(parts[:end])] = True
+        seen[path] = False
+    return sorted(seen.items())
+
+
+def git_ignored(repo, git, paths):
+    output = git(repo, "check-ignore", "--no-index", "--stdin", "-z",
+                 input="\0".join(paths), check=False)
+    return set(filter(None, output.split("\0")))
+
+
+def test_matches_git_check_ignore(tree, git):
+    matcher = GitignoreMatcher(tree)
+    paths = candidates()
+    ignored = git_ignored(tree, git, [path for path, _ in paths])
+    for path, is_dir in paths:
+        assert matcher.is_ignored(path, is_dir) == (path in ignored), path
+
+
+def test_walk_matches_untracked_files(tree, git):
+    expected = sorted(git(tree, "ls-files", "--others", "--exclude-standard").splitlines())
+    walked = sorted(path for path, entry in GitignoreMatcher(tree).walk()
+                    if not entry.is_dir())
+    assert walked == expected
+
+
+def test_walk_prunes_ignored_directories(tree, monkeypatch):
+    listed = []
+    matcher = GitignoreMatcher(tree)
+    scandir = __import__("os").scandir
+    monkeypatch.setattr("gitignore.os.scandir", lambda path: listed.append(path) or scandir(path))
+    list(matcher.walk())
+    assert str(tree / "build") not in listed
+    assert str(tree / "docs/a/b/generated") not in listed
+
+
+def test_rules_are_shared_by_content():
+    assert compile_rules("*.log\n") is compile_rules("*.log\n")
+    assert compile_rules("*.log\n").match("x.log", False) is True
+    assert compile_rules("*.log\n!x.log\n").match("x.log", False) is False
+    assert compile_rules("*.log\n").match("x.txt", False) is None
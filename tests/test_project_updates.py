@@ -0,0 +1,76 @@
+"""start system projects against local bare repositories acting as remotes"""
+
+import pytest
+
+import project_updates
+from project_updates import check_projects, find_repositories
+
+
+@pytest.fixture
+def apps(tmp_path, git, git_env, monkeypatch):
+    """An apps directory of clones of one bare remote, in every reported state"""
+    monkeypatch.setattr(project_updates, "GIT_ENV", git_env)
+    remote = tmp_path / "remote.git"
+    git(tmp_path, "init", "-q", "--bare", "-b", "main", str(remote))
+    seed = tmp_path / "seed"
+    git(tmp_path, "clone", "-q", str(remote), str(seed))
+    (seed / "README.md").write_text("one\n")
+    git(seed, "add", "README.md")
+    git(seed, "commit", "-q", "-m", "one")
+    git(seed, "push", "-q", "origin", "HEAD:main")
+
+    apps = tmp_path / "Apps"
+    apps.mkdir()
+    for name in ("behind", "clean", "dirty"):
+        git(tmp_path, "clone", "-q", str(remote), str(apps / name))
+    (apps / "dirty" / "README.md").write_text("edited\n")
+
+    # Two commits land upstream after "behind" was cloned
+    for message in ("two", "three"):
+        (seed / "README.md").write_text(message + "\n")
+        git(seed, "commit", "-q", "-am", message)
+    git(seed, "push", "-q", "origin", "HEAD:main")
+    git(apps / "clean", "pull", "-q")
+    git(apps / "dirty", "pull", "-q", "--autostash")
+    return apps
+
+
+def run(apps, **kwargs):
+    reported = []
+    results = check_projects(apps, reported.append, **kwargs)
+    assert sorted(map(str, reported)) == sorted(map(str, results))
+    return {result["name"]: result for result in results}
+
+
+def test_statuses(apps):
+    results = run(apps)
+    assert results["behind"]["status"] == "updates"
+    assert results["behind"]["behind"] == 2
+    assert results["clean"]["status"] == "up_to_date"
+    assert results["dirty"]["status"] == "uncommitted"
+    assert results["dirty"]["uncommitted"] == 1
+    assert {result["branch"] for result in results.values()} == {"main"}
+
+
+def test_fetch_failure(apps, git):
+    git(apps / "clean", "remote", "set-url", "origin", str(apps / "missing.git"))
+    assert run(apps)["clean"]["status"] == "fetch_failed"
+
+
+def test_timeout_does_not_hold_up_the_rest(apps, git):
+    # An ssh remote whose transport never answers
+    git(apps / "clean", "remote", "set-url", "origin", "ssh://example.invalid/repo.git")
+    git(apps / "clean", "config", "core.sshCommand", "sh -c 'sleep 5' --")
+    results = run(apps, timeout=1.0, concurrency=1)
+    assert results["clean"]["status"] == "timeout"
+    assert results["behind"]["status"] == "updates"
+
+
+def test_find_repositories_needs_a_git_directory(apps, tmp_path):
+    (apps / "notes").mkdir()
+    (apps / ".hidden").mkdir()
+    (apps / ".hidden" / ".git").mkdir()
+    worktree = apps / "worktree"
+    worktree.mkdir()
+    (worktree / ".git").write_text(f"gitdir: {tmp_path}/elsewhere\n")
+    assert [path.name for path in find_repositories(apps)] == ["behind", "clean", "dirty"]
@@ -0,0 +1,64 @@
+"""Auditing a revision matches auditing a checkout of it"""
+
+import pytest
+
+from check_results import CheckResults
+from fleet_auditor import audit_one, load_validators
+from ref_snapshot import audit_revisions
+
+FILES = {
+    "README.md": "# demo\n",
+    "requirements.txt": "requests\n",
+    "setup.py": "from setuptools import setup\nsetup(name='demo')\n",
+    "src/demo/__init__.py": "",
+    "build/out/leftover.py": "",
+    ".gitignore": "*.log\n",
+    "AGENTS.md": "# Agents\n\nRun `pip install -r requirements.txt`.\n",
+}
+
+
+def records(result, validator):
+    checks = result.get(validator, {}).get("checks")
+    return sorted((rule_id, passed, path, tuple(map(str, args)))
+                  for rule_id, passed, _, path, args in CheckResults.from_dict(checks).records()
+                  if not rule_id.startswith("structure.git")) if checks else []
+
+
+@pytest.fixture
+def history(make_repo, git):
+    repo = make_repo(files=FILES)
+    (repo / "pyproject.toml").write_text('[project]\nname = "demo"\nrequires-python = ">=3.10"\n')
+    (repo / "requirements.txt").unlink()
+    (repo / "AGENTS.md").write_text("# Agents\n\nRun `uv sync`.\n")
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", "migrate to uv")
+    return repo
+
+
+@pytest.mark.parametrize("revision", ["HEAD", "HEAD~1"])
+def test_revision_matches_checkout(history, git, tmp_path, revision):
+    validators = load_validators()
+    checkout = tmp_path / "checkout"
+    # A clone, since a linked worktree's .git is a file
+    git(tmp_path, "clone", "-q", str(history), str(checkout))
+    git(checkout, "checkout", "-q", "--detach", git(history, "rev-parse", revision).strip())
+
+    [at_revision] = audit_revisions(history, [revision], validators)
+    in_checkout = audit_one(str(checkout), validators)
+    assert at_revision["commit"] == git(history, "rev-parse", revision).strip()
+    for validator in ("structure", "uv"):
+        assert records(at_revision, validator) == records(in_checkout, validator)
+    assert records(at_revision, "uv")
+
+
+def test_unknown_revision_is_an_error(history):
+    [result] = audit_revisions(history, ["no-such-branch"], load_validators())
+    assert "Unknown revision" in result["error"]
+    assert result["meets_standards"] is False
+
+
+@pytest.mark.parametrize("revision", ["description", "index", "config", "/etc/hostname",
+                                      "heads/../../config"])
+def test_git_directory_files_are_not_revisions(history, revision):
+    [result] = audit_revisions(history, [revision], load_validators())
+    assert "Unknown revision" in result["error"]
@@ -0,0 +1,165 @@
+"""remediation planning and the all-or-nothing application of a project's changes"""
+
+import os
+
+import pytest
+
+import remediation
+from check_results import CheckResults
+from documents import toml_module
+from fleet_auditor import audit_one, load_validators
+from remediation import ProjectPlan, apply_plans, plan_project, reaudit, write_atomic
+
+FIX = ("uv", "uv.legacy_file", "requirements.txt")
+
+
+@pytest.fixture
+def project(make_repo):
+    return make_repo(files={
+        "requirements.txt": "requests>=2.31\n",
+        "README.md": "# demo\n",
+        "main.py": "print('hi')\n",
+        "docs/old.txt": "old\n",
+    })
+
+
+def migration(project):
+    """Move requirements.txt into a new pyproject.toml, plus a nested new file"""
+    plan = ProjectPlan({"project_path": str(project)}, {})
+    plan.write("pyproject.toml", '[project]\nname = "demo"\ndependencies = ["requests>=2.31"]\n',
+               FIX)
+    plan.write("docs/new/guide.md", "# Guide\n", FIX)
+    plan.delete("requirements.txt", FIX)
+    plan.delete("docs/old.txt", FIX)
+    return plan
+
+
+def tree(root):
+    return sorted(str(path.relative_to(root)) for path in root.rglob("*")
+                  if ".git" not in path.parts)
+
+
+def test_applies_writes_then_deletes(project):
+    plan = migration(project)
+    assert [(change.path, change.action) for change in plan.file_changes] == [
+        ("docs/new/guide.md", "create"), ("docs/old.txt", "delete"),
+        ("pyproject.toml", "create"), ("requirements.txt", "delete")]
+    assert apply_plans([plan])[str(project)] == {
+        "pyproject.toml": "written", "docs/new/guide.md": "written",
+        "requirements.txt": "deleted", "docs/old.txt": "deleted"}
+    assert (project / "docs/new/guide.md").read_text() == "# Guide\n"
+    assert not (project / "requirements.txt").exists()
+    assert not [name for name in tree(project) if name.endswith(".tmp")]
+
+
+def test_conflict_leaves_the_project_untouched(project):
+    plan = migration(project)
+    (project / "requirements.txt").write_text("flask\n")
+    before = tree(project)
+    outcomes = apply_plans([plan])[str(project)]
+    assert outcomes["requirements.txt"] == "conflict"
+    assert {outcome for path, outcome in outcomes.items() if path != "requirements.txt"} == {
+        "skipped: requirements.txt was not applied"}
+    assert tree(project) == before
+    assert (project / "requirements.txt").read_text() == "flask\n"
+
+
+def test_failed_staging_deletes_nothing(project, monkeypatch):
+    stage = remediation._stage
+
+    def failing_stage(path, content, mode):
+        if path.name == "pyproject.toml":
+            raise OSError(28, "No space left on device")
+        return stage(path, content, mode)
+
+    monkeypatch.setattr(remediation, "_stage", failing_stage)
+    plan = migration(project)
+    before = tree(project)
+    outcomes = apply_plans([plan])[str(project)]
+    assert outcomes["pyproject.toml"].startswith("error: ")
+    assert outcomes["requirements.txt"] == "skipped: pyproject.toml was not applied"
+    # docs/new/guide.md was staged first; its temporary file is gone again
+    assert [name for name in tree(project) if name not in before] == ["docs/new"]
+    assert (project / "requirements.txt").exists()
+
+
+def test_failed_rename_keeps_legacy_files(project, monkeypatch):
+    replace = os.replace
+
+    def failing_replace(source, target):
+        if os.path.basename(target) == "pyproject.toml":
+            raise PermissionError(13, "Permission denied")
+        return replace(source, target)
+
+    monkeypatch.setattr(remediation.os, "replace", failing_replace)
+    outcomes = apply_plans([migration(project)])[str(project)]
+    assert outcomes["docs/new/guide.md"] == "written"
+    assert outcomes["pyproject.toml"].startswith("error: ")
+    assert outcomes["requirements.txt"] == "skipped: pyproject.toml was not applied"
+    assert (project / "requirements.txt").exists()
+    assert not [name for name in tree(project) if name.endswith(".tmp")]
+
+
+def test_projects_apply_independently(project, make_repo):
+    other = make_repo("other", files={"requirements.txt": "rich\n"})
+    broken = migration(other)
+    (other / "requirements.txt").write_text("changed\n")
+    applied = apply_plans([migration(project), broken], workers=2)
+    assert set(applied[str(project)].values()) == {"written", "deleted"}
+    assert applied[str(other)]["requirements.txt"] == "conflict"
+
+
+def test_write_atomic(tmp_path):
+    path = tmp_path / "missing" / "dir" / "file.txt"
+    assert write_atomic(path, "one\n", None) == "written"
+    assert write_atomic(path, "two\n", "stale\n") == "conflict"
+    assert path.read_text() == "one\n"
+
+    path.chmod(0o755)
+    assert write_atomic(path, "two\n", "one\n") == "written"
+    assert path.read_text() == "two\n"
+    assert path.stat().st_mode & 0o777 == 0o755
+    assert write_atomic(path, None, "two\n") == "deleted"
+    assert os.listdir(path.parent) == []
+
+
+def test_plan_apply_and_reaudit(project):
+    validators = load_validators()
+    result = audit_one(str(project), validators)
+    plan = plan_project(result, validators[1].uv_requirements)
+    changes = {change.path: change.action for change in plan.file_changes}
+    assert changes["requirements.txt"] == "delete"
+    assert changes["pyproject.toml"] == "create"
+
+    outcomes = apply_plans([plan])[str(project)]
+    assert set(outcomes.values()) <= {"written", "deleted"}
+    report = reaudit(plan, outcomes, validators)
+    assert ("uv", "uv.legacy_file", "requirements.txt") in map(tuple, report["fixed"])
+    assert "requests>=2.31" in (project / "pyproject.toml").read_text()
+
+    # The generated AGENTS.md passes the checks it was written for
+    agents_md = (project / "AGENTS.md").read_text()
+    assert "WRONG" not in agents_md
+    after = audit_one(str(project), validators)
+    assert [rule_id for rule_id, passed, _, _, _ in
+            CheckResults.from_dict(after["uv"]["checks"]).records()
+            if rule_id.startswith("uv.agents_md.") and not passed] == []
+
+
+def test_setup_py_metadata_survives_a_requirements_migration(make_repo):
+    project = make_repo("p4", files={
+        "requirements.txt": "requests>=2.31\n",
+        "setup.py": "from setuptools import setup\n"
+                    "setup(name='p3', version='1.2', description='Real desc',\n"
+                    "      install_requires=['click'])\n",
+        "README.md": "# p3\n",
+    })
+    validators = load_validators()
+    plan = plan_project(audit_one(str(project), validators), validators[1].uv_requirements)
+    changes = {change.path: change for change in plan.file_changes}
+    assert changes["setup.py"].action == changes["requirements.txt"].action == "delete"
+
+    project_table = toml_module().loads(changes["pyproject.toml"].after)["project"]
+    assert (project_table["name"], project_table["version"], project_table["description"]) == (
+        "p3", "1.2", "Real desc")
+    assert sorted(project_table["dependencies"]) == ["click", "requests>=2.31"]
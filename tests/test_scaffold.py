@@ -0,0 +1,41 @@
+"""scaffold on the bundled python-project template"""
+
+from pathlib import Path
+
+import pytest
+
+from documents import toml_module
+from scaffold import TemplateError, bootstrap, project_values
+
+TEMPLATE = Path(__file__).resolve().parent.parent / "templates" / "python-project"
+
+
+def make(tmp_path, name="demo", **kwargs):
+    return bootstrap(TEMPLATE, tmp_path / "out", name, cache_dir=tmp_path / "cache", **kwargs)
+
+
+def test_renders_a_parseable_project(tmp_path):
+    result = make(tmp_path, description="Say 'hi' there", author="O'Brien")
+    project = tmp_path / "out" / "demo"
+    assert result["projects"] == [str(project)]
+    table = toml_module().loads((project / "pyproject.toml").read_text())["project"]
+    assert table["description"] == "Say 'hi' there"
+    assert table["authors"][0]["name"] == "O'Brien"
+    compile((project / "src/demo/__init__.py").read_text(), "__init__.py", "exec")
+
+
+@pytest.mark.parametrize("field, value", [
+    ("description", 'Say "hi"'), ("description", "back\\slash"), ("author", "two\nlines"),
+    ("email", 'a"@example.com'),
+])
+def test_values_that_break_string_literals_are_refused(field, value):
+    with pytest.raises(TemplateError, match=f"Invalid {field}"):
+        project_values("demo", **{field: value})
+
+
+def test_a_taken_name_creates_nothing(tmp_path):
+    (tmp_path / "out" / "demo-3").mkdir(parents=True)
+    (tmp_path / "out" / "demo-3" / "keep.txt").write_text("mine\n")
+    with pytest.raises(TemplateError, match="demo-3"):
+        make(tmp_path, count=3)
+    assert sorted(path.name for path in (tmp_path / "out").iterdir()) == ["demo-3"]
@@ -0,0 +1,141 @@
+"""uv_lock on lockfiles laid out the way uv writes them"""
+
+import pytest
+
+from documents import toml_module
+from uv_lock import LockError, LockIndex, check_lock, lock_key, parse_requirement
+
+pytestmark = pytest.mark.skipif(toml_module() is None, reason="no TOML parser")
+
+PYPROJECT = {
+    "project": {
+        "name": "demo-app",
+        "requires-python": ">=3.10",
+        "dependencies": ["requests>=2.31,<3", "Click >= 8.0"],
+        "optional-dependencies": {"dev": ["pytest[testing]>=8"]},
+    }
+}
+
+LOCK = '''version = 1
+revision = 1
+requires-python = ">=3.10"
+
+[[package]]
+name = "click"
+version = "8.1.7"
+source = { registry = "https://pypi.org/simple" }
+
+[[package]]
+name = "demo-app"
+version = "0.1.0"
+source = { editable = "." }
+dependencies = [
+    { name = "click" },
+    { name = "requests" },
+]
+
+[package.optional-dependencies]
+dev = [
+    { name = "pytest" },
+]
+
+[package.metadata]
+requires-dist = [
+    { name = "click", specifier = ">=8.0" },
+    { name = "pytest", extras = ["testing"], marker = "extra == 'dev'", specifier = ">=8" },
+    { name = "requests", specifier = "<3,>=2.31" },
+]
+provides-extras = ["dev"]
+
+[[package]]
+name = "pytest"
+version = "8.3.3"
+source = { registry = "https://pypi.org/simple" }
+
+[[package]]
+name = "requests"
+version = "2.32.3"
+source = { registry = "https://pypi.org/simple" }
+'''
+
+
+def outcomes(results):
+    return {rule_id: (passed, tuple(args)) for rule_id, passed, _, _, args in results.records()}
+
+
+def with_project(**changes):
+    return {"project": dict(PYPROJECT["project"], **changes)}
+
+
+def test_consistent_lock_passes():
+    results = outcomes(check_lock(PYPROJECT, LOCK.encode()))
+    assert set(results) == {"uv.lock.requires_python", "uv.lock.project", "uv.lock.stale",
+                            "uv.lock.missing", "uv.lock.duplicate"}
+    assert all(passed for passed, _ in results.values())
+
+
+def test_changed_requirements_are_stale():
+    pyproject = with_project(dependencies=["requests>=2.32,<3", "click>=8.0", "rich"])
+    results = outcomes(check_lock(pyproject, LOCK.encode()))
+    passed, (count, changes) = results["uv.lock.stale"]
+    assert not passed and count == 3
+    assert changes == "+requests<3,>=2.32, +rich, -requests<3,>=2.31"
+    assert results["uv.lock.missing"] == (False, (1, "rich"))
+
+
+def test_requires_python_and_project_entry():
+    results = outcomes(check_lock(with_project(name="other", **{"requires-python": ">=3.12"}),
+                                  LOCK.encode()))
+    assert results["uv.lock.requires_python"] == (False, (">=3.12", ">=3.10"))
+    assert results["uv.lock.project"] == (False, ("other",))
+    assert "uv.lock.stale" not in results
+
+
+def test_lock_without_metadata_compares_names():
+    # Older uv versions wrote no [package.metadata] table
+    end = 'provides-extras = ["dev"]\n'
+    lock = LOCK.replace(LOCK[LOCK.index("[package.metadata]"):LOCK.index(end) + len(end)], "")
+    assert outcomes(check_lock(PYPROJECT, lock.encode()))["uv.lock.stale"][0]
+    dropped = with_project(dependencies=["click"])
+    assert outcomes(check_lock(dropped, lock.encode()))["uv.lock.stale"] == (
+        False, (1, "-requests"))
+
+
+def test_duplicates_and_forks():
+    duplicate = LOCK + '\n[[package]]\nname = "requests"\nversion = "2.31.0"\n'
+    results = outcomes(check_lock(PYPROJECT, duplicate.encode()))
+    assert results["uv.lock.duplicate"] == (
+        False, (2, "requests==2.31.0, requests==2.32.3"))
+
+    forked = duplicate.replace('requires-python = ">=3.10"\n',
+                               'requires-python = ">=3.10"\nresolution-markers = ["a", "b"]\n', 1)
+    assert outcomes(check_lock(PYPROJECT, forked.encode()))["uv.lock.duplicate"][0]
+
+
+def test_unreadable_lock_is_a_warning():
+    results = check_lock(PYPROJECT, b"[[package]]\nversion = 1\n")
+    assert outcomes(results)["uv.lock.parse_error"][0] is False
+    assert results.scored == (0, 0)
+    assert results.render(passed=False)[0].startswith("⚠️ Cannot check uv.lock")
+    with pytest.raises(LockError):
+        LockIndex(b"not = 'a lock'\n")
+
+
+def test_lock_index_parses_entries_on_demand():
+    index = LockIndex(LOCK.encode())
+    assert sorted(index.packages) == ["click", "demo-app", "pytest", "requests"]
+    assert index.project_entry("Demo_App")["version"] == "0.1.0"
+    assert index.entries("missing") == []
+
+
+def test_parse_requirement():
+    assert parse_requirement("Foo_Bar[B,a] >= 1.0 , <2 ; python_version < '3.11'") == (
+        None, "foo-bar", ("a", "b"), "<2,>=1.0")
+    assert parse_requirement("pkg @ https://example.com/pkg.whl", "Dev") == (
+        "dev", "pkg", (), "")
+    with pytest.raises(LockError):
+        parse_requirement("[invalid]")
+
+
+def test_lock_key_covers_both_files():
+    assert lock_key(b"a", b"b") != lock_key(b"a", b"c") != lock_key(b"b", b"c")
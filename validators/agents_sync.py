@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+AGENTS.md Sync
+
+Renders standards/agents-md.template into each project's AGENTS.md. The
+template's example block is the rendered document: `{{name}}` and
+`{{description}}` are filled in from pyproject.toml or package.json, and
+text between `<!-- start:keep NAME -->` and `<!-- start:end NAME -->`
+markers is owned by the project, so its current content replaces the
+template default. Python projects also get the UV-first sections of the
+uv standards. A file is written only when the rendered content hash
+differs from the file's; an AGENTS.md without markers is adopted by
+matching its `##` sections to the template's.
+
+Each project's inputs are stamped (template digest plus mtime and size of
+the files the rendering reads) in the audit cache, so syncing an
+unchanged fleet reads nothing but directory listings.
+"""
+
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from fleet_auditor import PYTHON_MARKERS, is_python_project
+from project_snapshot import ProjectSnapshot
+from remediation import DEFAULT_WORKERS, write_atomic, uv_sections
+
+# Bumped whenever the rendering of the same inputs changes
+SYNC_FORMAT = "2"
+
+TEMPLATE_NAME = "agents-md.template"
+
+# Files whose content the rendering depends on
+SYNC_INPUTS = ("AGENTS.md", "pyproject.toml", "package.json")
+
+EXAMPLE_BLOCK = re.compile(r"^```markdown\n(.*?)^```[ \t]*$", re.S | re.M)
+KEEP_REGION = re.compile(r"^<!-- start:keep ([A-Za-z0-9_-]+) -->[ \t]*\n(.*?)"
+                         r"^<!-- start:end \1 -->[ \t]*(?:\n|\Z)", re.S | re.M)
+PLACEHOLDER = re.compile(r"\{\{\s*([a-z_]+)\s*\}\}")
+PLACEHOLDERS = ("name", "description")
+HEADING = re.compile(r"^## +(.+?)[ \t]*$", re.M)
+FENCE = re.compile(r"^(```|~~~)", re.M)
+
+# Region for the sections of an adopted AGENTS.md the template has no place for
+ADOPTED_REGION = "notes"
+
+
+class TemplateError(ValueError):
+    """The AGENTS.md template cannot be rendered"""
+
+
+def _heading_key(heading: str) -> str:
+    return " ".join(heading.lower().split())
+
+
+def _keep(name: str, content: str) -> str:
+    if content and not content.endswith("\n"):
+        content += "\n"
+    return f"<!-- start:keep {name} -->\n{content}<!-- start:end {name} -->\n"
+
+
+class AgentsTemplate:
+    """The renderable part of agents-md.template"""
+
+    def __init__(self, text: str, standards: Dict[str, Any]):
+        match = EXAMPLE_BLOCK.search(text)
+        if match is None:
+            raise TemplateError(f"{TEMPLATE_NAME} has no ```markdown example block")
+        self.standards = standards
+        # [literal, region name, region default, literal, ...]
+        self.parts = KEEP_REGION.split(match.group(1))
+        unknown = sorted(set(PLACEHOLDER.findall(match.group(1))) - set(PLACEHOLDERS))
+        if unknown:
+            raise TemplateError(f"Unknown placeholder(s) in {TEMPLATE_NAME}: {', '.join(unknown)}")
+
+        self.regions = self.parts[1::3]
+        if len(set(self.regions)) != len(self.regions):
+            raise TemplateError(f"{TEMPLATE_NAME} repeats a keep region name")
+
+        # A region belongs to the heading right above it; other headings are managed
+        self.region_headings: Dict[str, str] = {}
+        self.managed_headings = set()
+        for index, literal in enumerate(self.parts[0::3]):
+            headings = HEADING.findall(literal)
+            if index < len(self.regions) and headings and literal.rstrip().endswith(headings[-1]):
+                self.region_headings[_heading_key(headings.pop())] = self.regions[index]
+            self.managed_headings.update(_heading_key(heading) for heading in headings)
+        sections = standards.get("agents_md_uv_sections", {}).get("required_sections", [])
+        self.managed_headings.update(_heading_key(section["section"]) for section in sections)
+
+        self.digest = hashlib.sha256(
+            (text + json.dumps(sections, sort_keys=True)).encode()).hexdigest()
+
+    @classmethod
+    def load(cls, standards_dir: Path, standards: Dict[str, Any]) -> "AgentsTemplate":
+        path = Path(standards_dir) / TEMPLATE_NAME
+        try:
+            return cls(path.read_text(encoding="utf-8"), standards)
+        except OSError as e:
+            raise TemplateError(f"Cannot read {path}: {e}")
+
+    def render(self, values: Dict[str, str], kept: Dict[str, str], python: bool) -> str:
+        """AGENTS.md for one project; kept holds the project's region contents"""
+        def fill(text: str) -> str:
+            return PLACEHOLDER.sub(lambda match: values[match.group(1)], text)
+
+        out = []
+        for index in range(0, len(self.parts), 3):
+            out.append(fill(self.parts[index]))
+            if index + 1 < len(self.parts):
+                name, default = self.parts[index + 1], self.parts[index + 2]
+                out.append(_keep(name, kept[name] if name in kept else fill(default)))
+        # Regions the template no longer has are kept, after it
+        out.extend("\n" + _keep(name, content) for name, content in kept.items()
+                   if name not in self.regions)
+        text = "".join(out)
+        if python:
+            text = text.rstrip("\n") + "\n" + uv_sections(self.standards, text)
+        return text
+
+    def adopt(self, text: str) -> Dict[str, str]:
+        """Region contents for an AGENTS.md written without keep markers.
+
+        Sections under a region's heading fill that region; sections the
+        template manages are replaced; the rest are kept in ADOPTED_REGION.
+        """
+        kept: Dict[str, str] = {}
+        extra: List[str] = []
+        for heading, body in _sections(text):
+            key = _heading_key(heading) if heading is not None else None
+            if key in self.region_headings:
+                kept[self.region_headings[key]] = body.strip("\n")
+            elif heading is None:
+                # Text above the first section, without the title
+                body = re.sub(r"\A\s*# .*\n?", "", body).strip("\n")
+                if body:
+                    extra.append(body)
+            elif key not in self.managed_headings:
+                extra.append(f"## {heading}{body}".rstrip())
+        if extra:
+            kept[ADOPTED_REGION] = "\n\n".join(extra)
+        return kept
+
+
+def _sections(text: str) -> List[Tuple[Optional[str], str]]:
+    """(heading, body) of each `##` section; heading None for the preamble"""
+    # Headings inside code fences are not sections
+    fenced = []
+    fence_start = None
+    for match in FENCE.finditer(text):
+        if fence_start is None:
+            fence_start = match.start()
+        else:
+            fenced.append((fence_start, match.end()))
+            fence_start = None
+    headings = [match for match in HEADING.finditer(text)
+                if not any(start <= match.start() < end for start, end in fenced)]
+
+    sections = [(None, text[:headings[0].start()] if headings else text)]
+    for index, match in enumerate(headings):
+        end = headings[index + 1].start() if index + 1 < len(headings) else len(text)
+        sections.append((match.group(1), text[match.end():end]))
+    return sections
+
+
+def read_regions(text: str) -> Optional[Dict[str, str]]:
+    """Contents of the keep regions in an AGENTS.md, or None if it has none"""
+    regions = {match.group(1): match.group(2) for match in KEEP_REGION.finditer(text)}
+    return regions or None
+
+
+def project_values(snapshot: ProjectSnapshot) -> Dict[str, str]:
+    """{{name}} and {{description}} from pyproject.toml or package.json"""
+    data: Dict[str, Any] = {}
+    for name, table in (("pyproject.toml", "project"), ("package.json", None)):
+        if snapshot.is_file(name):
+            try:
+                document = snapshot.document(name)
+            except (OSError, ValueError):
+                continue
+            data = document.get(table, {}) if table else document
+            if isinstance(data, dict):
+                break
+            data = {}
+    name = data.get("name") if isinstance(data.get("name"), str) else None
+    name = name or snapshot.path.name
+    description = data.get("description") if isinstance(data.get("description"), str) else None
+    return {"name": name, "description": description or f"The {name} project"}
+
+
+def sync_stamp(snapshot: ProjectSnapshot, template: AgentsTemplate) -> str:
+    """Everything the rendering of one project depends on, short of file content"""
+    return (f"{SYNC_FORMAT}:{template.digest}:"
+            + snapshot.fingerprint(PYTHON_MARKERS, SYNC_INPUTS))
+
+
+def _cache_key(project_path: str) -> str:
+    return os.path.join(os.path.abspath(project_path), "AGENTS.md") + "#sync"
+
+
+def plan_sync(snapshot: ProjectSnapshot, template: AgentsTemplate) -> Dict[str, Any]:
+    """Render one project's AGENTS.md and compare it with the file on disk"""
+    before = snapshot.read_text("AGENTS.md") if snapshot.is_file("AGENTS.md") else None
+    if before is None:
+        kept: Dict[str, str] = {}
+    else:
+        regions = read_regions(before)
+        kept = regions if regions is not None else template.adopt(before)
+    after = template.render(project_values(snapshot), kept, is_python_project(snapshot))
+
+    before_hash = (hashlib.sha256(before.encode("utf-8")).hexdigest()
+                   if before is not None else None)
+    after_hash = hashlib.sha256(after.encode("utf-8")).hexdigest()
+    if before_hash == after_hash:
+        action = "unchanged"
+    else:
+        action = "create" if before is None else "update"
+    return {"project_path": str(snapshot.path), "action": action,
+            "before": before, "after": after, "sha256": after_hash}
+
+
+def _sync_one(project_path: str, template: AgentsTemplate, dry_run: bool) -> Dict[str, Any]:
+    snapshot = ProjectSnapshot(project_path)
+    # Stamped before reading: a file edited meanwhile fails the next lookup
+    stamp = sync_stamp(snapshot, template)
+    plan = plan_sync(snapshot, template)
+    if plan["action"] == "unchanged":
+        plan["stamp"] = stamp
+    elif not dry_run:
+        plan["outcome"] = write_atomic(snapshot.path / "AGENTS.md", plan["after"], plan["before"])
+        if plan["outcome"] == "written":
+            plan["stamp"] = sync_stamp(ProjectSnapshot(project_path), template)
+    return plan
+
+
+def sync_projects(projects: List[str], template: AgentsTemplate, cache=None,
+                  dry_run: bool = False, workers: int = DEFAULT_WORKERS) -> List[Dict[str, Any]]:
+    """Sync AGENTS.md across projects; unchanged projects come back as action "unchanged".
+
+    Projects whose stamp matches the cache are not read at all; the rest
+    are rendered and written on a thread pool.
+    """
+    results = []
+    pending = []
+    for project in projects:
+        if cache is not None:
+            stamp = sync_stamp(ProjectSnapshot(project), template)
+            if cache.get_document(_cache_key(project), stamp) is not None:
+                results.append({"project_path": str(project), "action": "unchanged",
+                                "cached": True})
+                continue
+        pending.append(project)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        synced = list(pool.map(lambda project: _sync_one(project, template, dry_run), pending))
+
+    for plan in synced:
+        stamp = plan.pop("stamp", None)
+        if cache is not None and stamp is not None:
+            cache.put_document(_cache_key(plan["project_path"]), stamp,
+                               {"sha256": plan["sha256"]})
+        results.append(plan)
+    if cache is not None:
+        cache.commit()
+    return sorted(results, key=lambda result: result["project_path"])
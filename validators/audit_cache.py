@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Persistent Audit Cache
+
+Stores the structured outcome of every individual check in a small
+SQLite database under ~/.cache/start. A cached outcome is reused while
+the fingerprint of the files the check depends on, together with the
+digest of the standards file the check was compiled from, is unchanged.
+Entries are evicted least-recently-used once the cache grows past its
+size bound. A second table keeps parsed config documents (see
+documents.py) keyed on path, mtime and size, and a third keeps verdicts
+keyed on the content of the files they were computed from, which survive
+touched files and checkouts and are shared between projects.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from check_results import CheckResults
+import profiling
+
+DEFAULT_MAX_ENTRIES = 200_000
+
+# Bumped whenever the stored result format or check semantics change
+CACHE_FORMAT = "5"
+
+
+def default_cache_dir() -> Path:
+    """Cache directory, honouring XDG_CACHE_HOME"""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "start"
+
+
+def default_cache_path() -> Path:
+    return default_cache_dir() / "audit-cache.sqlite3"
+
+
+class AuditCache:
+    """SQLite-backed, LRU-bounded store of per-check audit outcomes"""
+
+    def __init__(self, path: Optional[Path] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = Path(path) if path is not None else default_cache_path()
+        self.max_entries = max_entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(str(self.path), timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS checks (
+                project TEXT NOT NULL,
+                check_name TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                result TEXT NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (project, check_name)
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS checks_last_used ON checks (last_used)")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS documents (
+                path TEXT PRIMARY KEY,
+                stamp TEXT NOT NULL,
+                data TEXT NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS verdicts (
+                key TEXT PRIMARY KEY,
+                result TEXT NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+        self._hits: List[Tuple[float, str, str]] = []
+        self._verdict_hits: List[Tuple[float, str]] = []
+        self._writes = 0
+
+    def get(self, project: str, check_name: str, fingerprint: str) -> Optional[CheckResults]:
+        """Return the cached outcome if the stored fingerprint still matches"""
+        row = self._conn.execute(
+            "SELECT fingerprint, result FROM checks WHERE project = ? AND check_name = ?",
+            (project, check_name),
+        ).fetchone()
+        if row is None or row[0] != fingerprint:
+            return None
+
+        # Recency updates are batched and written on commit()
+        self._hits.append((time.time(), project, check_name))
+        return CheckResults.from_dict(json.loads(row[1]))
+
+    def put(self, project: str, check_name: str, fingerprint: str, result: CheckResults):
+        """Store the outcome of a check"""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO checks VALUES (?, ?, ?, ?, ?)",
+            (project, check_name, fingerprint, json.dumps(result.to_dict()), time.time()),
+        )
+        self._writes += 1
+
+    def get_document(self, path: str, stamp: str) -> Optional[Dict[str, Any]]:
+        """Parsed document entry if the file's mtime/size stamp still matches"""
+        row = self._conn.execute(
+            "SELECT stamp, data FROM documents WHERE path = ?", (path,)
+        ).fetchone()
+        if row is None or row[0] != stamp:
+            return None
+        return json.loads(row[1])
+
+    def put_document(self, path: str, stamp: str, entry: Dict[str, Any]):
+        """Store a parsed document entry; values JSON cannot hold are skipped"""
+        try:
+            data = json.dumps(entry)
+        except (TypeError, ValueError):
+            # e.g. TOML datetimes
+            return
+        self._conn.execute(
+            "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?)",
+            (path, stamp, data, time.time()),
+        )
+        self._writes += 1
+
+    def get_verdict(self, key: str) -> Optional[CheckResults]:
+        """Outcome stored under a content-derived key"""
+        row = self._conn.execute("SELECT result FROM verdicts WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        self._verdict_hits.append((time.time(), key))
+        return CheckResults.from_dict(json.loads(row[0]))
+
+    def put_verdict(self, key: str, result: CheckResults):
+        """Store an outcome under a content-derived key"""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?)",
+            (key, json.dumps(result.to_dict()), time.time()),
+        )
+        self._writes += 1
+
+    def commit(self):
+        """Flush pending writes and apply the size bound"""
+        if self._hits:
+            self._conn.executemany(
+                "UPDATE checks SET last_used = ? WHERE project = ? AND check_name = ?",
+                self._hits,
+            )
+            self._hits = []
+        if self._verdict_hits:
+            self._conn.executemany("UPDATE verdicts SET last_used = ? WHERE key = ?",
+                                   self._verdict_hits)
+            self._verdict_hits = []
+        if self._writes:
+            self._evict()
+            self._writes = 0
+        self._conn.commit()
+
+    def _evict(self):
+        for table in ("checks", "documents", "verdicts"):
+            count = self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            excess = count - self.max_entries
+            if excess > 0:
+                self._conn.execute(
+                    f"DELETE FROM {table} WHERE rowid IN "
+                    f"(SELECT rowid FROM {table} ORDER BY last_used LIMIT ?)",
+                    (excess,),
+                )
+
+    def clear(self):
+        """Drop every cached outcome, parsed document and verdict"""
+        self._conn.execute("DELETE FROM checks")
+        self._conn.execute("DELETE FROM documents")
+        self._conn.execute("DELETE FROM verdicts")
+        self._conn.commit()
+
+    def close(self):
+        self.commit()
+        self._conn.close()
+
+
+def run_cached(cache: Optional[AuditCache], snapshot, check_name: str,
+               dependencies: Tuple[Iterable[str], Iterable[str]], salt: str,
+               check: Callable[[], CheckResults]) -> CheckResults:
+    """Run a check, or reuse its cached outcome when its inputs are unchanged.
+
+    dependencies is (paths, content_paths): the paths whose existence and
+    type the check looks at, and the files whose content it reads.
+    """
+    if cache is None:
+        return check()
+
+    paths, content_paths = dependencies
+    fingerprint = f"{CACHE_FORMAT}:{salt}:" + snapshot.fingerprint(paths, content_paths)
+    if snapshot.content_addressed:
+        # Object ids name the exact content, so outcomes are shared by every
+        # revision (and project) with the same inputs
+        key = f"{check_name}:{fingerprint}"
+        cached = cache.get_verdict(key)
+        if cached is not None:
+            profiling.count("cache_hits")
+            return cached
+        result = check()
+        cache.put_verdict(key, result)
+        return result
+
+    project = os.path.abspath(snapshot.path)
+
+    cached = cache.get(project, check_name, fingerprint)
+    if cached is not None:
+        profiling.count("cache_hits")
+        return cached
+
+    result = check()
+    cache.put(project, check_name, fingerprint, result)
+    return result
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Audit Daemon
+
+Long-lived audit server for editor integrations and pre-commit hooks.
+It keeps ProjectValidator/UVValidator loaded and the latest result for
+each project's check outcomes warm, answering requests on a Unix domain
+socket (see daemon_client.py for the protocol). The directories holding
+each check's input files are watched with inotify, or by polling where
+inotify is unavailable, and only checks whose inputs changed are re-run.
+Checks over the whole tree and of the git state re-run on every request:
+watching every directory they read would not scale.
+"""
+
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import socketserver
+import struct
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set
+
+from daemon_client import default_socket_path
+from fleet_auditor import audit_one, load_validators
+from project_snapshot import ProjectSnapshot
+from structure_validator import AUDIT_CHECKS
+from uv_validator import UV_CHECKS
+
+# Most recently used projects kept warm
+MAX_PROJECTS = 512
+DEFAULT_POLL_INTERVAL = 2.0
+
+# inotify event masks (see inotify(7))
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+# Sent when the kernel drops a watch, e.g. because its directory was deleted
+IN_IGNORED = 0x00008000
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+              | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+EVENT_HEADER = struct.Struct("iIII")
+
+
+class InotifyWatcher:
+    """Directory watcher backed by Linux inotify.
+
+    on_change(path, removed) is called with removed=True once the
+    directory is gone and no longer watched.
+    """
+
+    def __init__(self, on_change: Callable[[str, bool], None]):
+        libc_name = ctypes.util.find_library("c")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_CLOEXEC | os.O_NONBLOCK)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._on_change = on_change
+        self._paths: Dict[int, str] = {}
+        self._watches: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        threading.Thread(target=self._run, name="inotify", daemon=True).start()
+
+    def watch(self, path: str):
+        with self._lock:
+            if path in self._watches:
+                return
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+            if wd < 0:
+                return
+            self._watches[path] = wd
+            self._paths[wd] = path
+
+    def unwatch(self, path: str):
+        with self._lock:
+            wd = self._watches.pop(path, None)
+            if wd is not None:
+                self._paths.pop(wd, None)
+                self._libc.inotify_rm_watch(self._fd, wd)
+
+    def _run(self):
+        while True:
+            select.select([self._fd], [], [])
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                continue
+
+            changed = set()
+            removed = set()
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, name_len = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size + name_len
+                with self._lock:
+                    path = self._paths.get(wd)
+                    if path is not None and mask & (IN_IGNORED | IN_MOVE_SELF):
+                        # The kernel has dropped this watch, or it now follows the
+                        # directory elsewhere; forget it so the path can be re-added
+                        del self._paths[wd]
+                        if self._watches.get(path) == wd:
+                            del self._watches[path]
+                        if not mask & IN_IGNORED:
+                            self._libc.inotify_rm_watch(self._fd, wd)
+                        removed.add(path)
+                if path is not None:
+                    changed.add(path)
+
+            for path in changed:
+                self._on_change(path, path in removed)
+
+
+class PollingWatcher:
+    """Fallback watcher comparing root listings and stats on an interval"""
+
+    def __init__(self, on_change: Callable[[str, bool], None],
+                 interval: float = DEFAULT_POLL_INTERVAL):
+        self._on_change = on_change
+        self._interval = interval
+        self._states: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        threading.Thread(target=self._run, name="poller", daemon=True).start()
+
+    @staticmethod
+    def _state(path: str):
+        try:
+            state = set()
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    st = entry.stat(follow_symlinks=False)
+                    state.add((entry.name, st.st_mtime_ns, st.st_size))
+            return frozenset(state)
+        except OSError:
+            return None
+
+    def watch(self, path: str):
+        with self._lock:
+            if path not in self._states:
+                self._states[path] = self._state(path)
+
+    def unwatch(self, path: str):
+        with self._lock:
+            self._states.pop(path, None)
+
+    def _run(self):
+        while True:
+            time.sleep(self._interval)
+            with self._lock:
+                paths = list(self._states)
+            for path in paths:
+                state = self._state(path)
+                with self._lock:
+                    if path not in self._states or self._states[path] == state:
+                        continue
+                    self._states[path] = state
+                self._on_change(path, state is None)
+
+
+def create_watcher(on_change: Callable[[str, bool], None],
+                   poll_interval: float = DEFAULT_POLL_INTERVAL,
+                   force_polling: bool = False):
+    """inotify where available, polling otherwise"""
+    if not force_polling:
+        try:
+            return InotifyWatcher(on_change)
+        except (OSError, AttributeError, TypeError):
+            pass
+    return PollingWatcher(on_change, poll_interval)
+
+
+class AuditService:
+    """Warm validators plus an invalidation-driven cache of check outcomes.
+
+    Outcomes of the checks with known input files (see check_dependencies())
+    are kept until a watched directory holding one of those files changes.
+    Checks over the whole tree, the git state and the uv probe have no such
+    inputs and run on every request.
+    """
+
+    def __init__(self, standards_dir: Optional[Path] = None,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL, force_polling: bool = False):
+        self.standards_dir = Path(standards_dir) if standards_dir else Path(__file__).parent.parent / "standards"
+        self.validators = load_validators(self.standards_dir)
+        # Project -> {"structure": {check: CheckResults}, "uv": {...}}
+        self.outcomes: "OrderedDict[str, Dict[str, Dict[str, Any]]]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0}
+        # Watched directory -> projects with check inputs in it
+        self.watched: Dict[str, Set[str]] = {}
+        # Invalidations per project, so an audit racing one does not store stale outcomes
+        self.generations: Dict[str, int] = {}
+        self.watcher = create_watcher(self._changed, poll_interval, force_polling)
+        # Editing the standards invalidates every result
+        self.watcher.watch(str(self.standards_dir))
+
+    def _changed(self, path: str, removed: bool = False):
+        with self.lock:
+            if path == str(self.standards_dir):
+                self.validators = load_validators(self.standards_dir)
+                projects = list(self.outcomes)
+            elif removed:
+                # The directory is gone; its projects watch again on their next audit
+                projects = list(self.watched.pop(path, ()))
+                self.watcher.unwatch(path)
+            else:
+                projects = list(self.watched.get(path, ()))
+            for project in projects:
+                self.outcomes.pop(project, None)
+                self.generations[project] = self.generations.get(project, 0) + 1
+            self.stats["invalidations"] += 1
+
+    @staticmethod
+    def _input_dirs(project_path: str, snapshot: ProjectSnapshot, validators) -> Set[str]:
+        """Directories holding the inputs of the cached checks"""
+        structure_validator, uv_validator = validators
+        project_type = structure_validator.detect_project_type(snapshot)
+        paths = []
+        for check in AUDIT_CHECKS:
+            try:
+                paths.extend(sum(structure_validator.check_dependencies(check, project_type), []))
+            except ValueError:
+                pass
+        for check in UV_CHECKS:
+            try:
+                paths.extend(sum(uv_validator.check_dependencies(check), []))
+            except ValueError:
+                pass
+        return {os.path.join(project_path, os.path.dirname(path.rstrip("/"))).rstrip(os.sep)
+                for path in paths}
+
+    @staticmethod
+    def _cacheable(outcomes: Dict[str, Dict[str, Any]], validators) -> Dict[str, Dict[str, Any]]:
+        """The outcomes of checks with known inputs"""
+        structure_validator, uv_validator = validators
+        kept: Dict[str, Dict[str, Any]] = {"structure": {}, "uv": {}}
+        for validator, checks in outcomes.items():
+            for check, outcome in checks.items():
+                try:
+                    if validator == "structure":
+                        structure_validator.check_dependencies(check, "unknown")
+                    else:
+                        uv_validator.check_dependencies(check)
+                except ValueError:
+                    continue
+                kept[validator][check] = outcome
+        return kept
+
+    def _watch(self, project_path: str, directories: Set[str]):
+        for directory in directories:
+            # A missing directory is watched through its nearest existing
+            # parent, whose listing changes when it is created
+            while directory != project_path and not os.path.isdir(directory):
+                directory = os.path.dirname(directory)
+            projects = self.watched.setdefault(directory, set())
+            if not projects:
+                self.watcher.watch(directory)
+            projects.add(project_path)
+
+    def _evict(self, project_path: str):
+        self.generations.pop(project_path, None)
+        for directory, projects in list(self.watched.items()):
+            projects.discard(project_path)
+            if not projects:
+                del self.watched[directory]
+                self.watcher.unwatch(directory)
+
+    def audit(self, project_path: str) -> Dict[str, Any]:
+        project_path = os.path.abspath(project_path)
+        with self.lock:
+            validators = self.validators
+            generation = self.generations.get(project_path, 0)
+            kept = self.outcomes.get(project_path)
+            if kept is not None:
+                self.outcomes.move_to_end(project_path)
+                self.stats["hits"] += 1
+            else:
+                self.stats["misses"] += 1
+
+        # Audits run outside the lock, so clients do not wait on each other
+        snapshot = ProjectSnapshot(project_path)
+        if kept is None:
+            # Watch before auditing so changes made mid-audit still invalidate
+            directories = self._input_dirs(project_path, snapshot, validators)
+            with self.lock:
+                self._watch(project_path, directories)
+        outcomes: Dict[str, Dict[str, Any]] = {"structure": {}, "uv": {}}
+        result = audit_one(project_path, validators, snapshot, kept, outcomes)
+
+        with self.lock:
+            if (kept is None and self.validators is validators
+                    and self.generations.get(project_path, 0) == generation):
+                self.outcomes[project_path] = self._cacheable(outcomes, validators)
+            while len(self.outcomes) > MAX_PROJECTS:
+                evicted, _ = self.outcomes.popitem(last=False)
+                self._evict(evicted)
+        return result
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            message = json.loads(line)
+            response = self.server.dispatch(message)
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class AuditDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server answering audit requests from an AuditService"""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Optional[str] = None, service: Optional[AuditService] = None):
+        self.socket_path = socket_path or default_socket_path()
+        self.service = service or AuditService()
+        os.makedirs(os.path.dirname(self.socket_path), mode=0o700, exist_ok=True)
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        super().__init__(self.socket_path, _RequestHandler)
+        os.chmod(self.socket_path, 0o600)
+
+    def dispatch(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        op = message.get("op")
+        if op == "audit":
+            return {"ok": True, "result": self.service.audit(message["project"])}
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid(), "projects": len(self.service.outcomes),
+                    "stats": self.service.stats}
+        if op == "shutdown":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"ok": True}
+        return {"ok": False, "error": f"Unknown op: {op}"}
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+
+
+def serve(socket_path: Optional[str] = None, poll_interval: float = DEFAULT_POLL_INTERVAL,
+          force_polling: bool = False):
+    """Run the daemon until interrupted or asked to shut down"""
+    import signal
+
+    service = AuditService(poll_interval=poll_interval, force_polling=force_polling)
+    server = AuditDaemon(socket_path, service)
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown).start())
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Audit History
+
+Append-only SQLite store of audit outcomes for trend and regression
+reports. Only changes are written: a check's status is stored when it
+differs from the last recorded status for that project, and a score row
+when a project's score changes, so re-auditing an unchanged fleet adds
+nothing but a last-seen timestamp. A `current` table mirrors the latest
+status of every check, which keeps fleet-wide pass rates a single
+aggregate over a few thousand rows however long the history grows.
+
+The store lives under $XDG_DATA_HOME/start since, unlike the audit
+cache, it cannot be rebuilt.
+"""
+
+import os
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from check_results import CheckResults
+
+# Status values; ABSENT marks a check that is no longer evaluated
+FAILED, PASSED, ABSENT = 0, 1, 2
+
+VALIDATORS = ("structure", "uv")
+
+DURATION = re.compile(r"^(\d+)([hdw])$")
+DURATION_SECONDS = {"h": 3600, "d": 86400, "w": 7 * 86400}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    last_seen INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rules (
+    id INTEGER PRIMARY KEY,
+    validator TEXT NOT NULL,
+    rule_id TEXT NOT NULL,
+    path TEXT NOT NULL,
+    ordinal INTEGER NOT NULL,
+    UNIQUE (validator, rule_id, path, ordinal)
+);
+CREATE TABLE IF NOT EXISTS outcomes (
+    project INTEGER NOT NULL,
+    rule INTEGER NOT NULL,
+    ts INTEGER NOT NULL,
+    status INTEGER NOT NULL,
+    PRIMARY KEY (project, rule, ts)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS outcomes_ts ON outcomes (ts);
+CREATE TABLE IF NOT EXISTS current (
+    project INTEGER NOT NULL,
+    rule INTEGER NOT NULL,
+    status INTEGER NOT NULL,
+    since INTEGER NOT NULL,
+    PRIMARY KEY (project, rule)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS scores (
+    project INTEGER NOT NULL,
+    ts INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    meets_standards INTEGER NOT NULL,
+    PRIMARY KEY (project, ts)
+) WITHOUT ROWID;
+"""
+
+
+def default_history_path() -> Path:
+    """History database, honouring XDG_DATA_HOME"""
+    base = os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share"
+    return Path(base) / "start" / "audit-history.sqlite3"
+
+
+def parse_since(value: str, now: Optional[float] = None) -> int:
+    """Timestamp for "7d", "24h", "2w" or an ISO date such as 2026-01-31"""
+    now = time.time() if now is None else now
+    match = DURATION.match(value.strip())
+    if match:
+        return int(now - int(match.group(1)) * DURATION_SECONDS[match.group(2)])
+    try:
+        return int(time.mktime(time.strptime(value.strip(), "%Y-%m-%d")))
+    except ValueError:
+        raise ValueError(f"Invalid time: {value!r} (use e.g. 7d, 24h, 2w or YYYY-MM-DD)")
+
+
+def result_outcomes(result: Dict[str, Any]) -> Dict[Tuple[str, str, str, int], int]:
+    """(validator, rule_id, path, ordinal) -> status for one audit_one() result.
+
+    The ordinal tells apart repeated checks of one rule on one path, such
+    as each forbidden AGENTS.md pattern.
+    """
+    outcomes = {}
+    for validator in VALIDATORS:
+        checks = result.get(validator, {}).get("checks")
+        if not checks:
+            continue
+        seen: Dict[Tuple[str, str], int] = {}
+        for rule_id, passed, _, path, _ in CheckResults.from_dict(checks).records():
+            ordinal = seen.get((rule_id, path), 0)
+            seen[(rule_id, path)] = ordinal + 1
+            outcomes[(validator, rule_id, path, ordinal)] = PASSED if passed else FAILED
+    return outcomes
+
+
+def result_score(result: Dict[str, Any]) -> Tuple[int, int]:
+    score = total = 0
+    for validator in VALIDATORS:
+        part = result.get(validator, {})
+        if "error" not in part:
+            score += part.get("score", 0)
+            total += part.get("total", 0)
+    return score, total
+
+
+class AuditHistory:
+    """Deduplicating store of audit outcomes over time"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path is not None else default_history_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+        self._rules: Dict[Tuple[str, str, str, int], int] = {
+            tuple(row[1:]): row[0]
+            for row in self._conn.execute("SELECT id, validator, rule_id, path, ordinal FROM rules")
+        }
+
+    def _project_id(self, path: str, ts: int) -> int:
+        self._conn.execute(
+            "INSERT INTO projects (path, last_seen) VALUES (?, ?) "
+            "ON CONFLICT (path) DO UPDATE SET last_seen = excluded.last_seen",
+            (path, ts))
+        return self._conn.execute("SELECT id FROM projects WHERE path = ?", (path,)).fetchone()[0]
+
+    def _rule_id(self, key: Tuple[str, str, str, int]) -> int:
+        rule = self._rules.get(key)
+        if rule is None:
+            rule = self._conn.execute(
+                "INSERT INTO rules (validator, rule_id, path, ordinal) VALUES (?, ?, ?, ?)",
+                key).lastrowid
+            self._rules[key] = rule
+        return rule
+
+    def record(self, result: Dict[str, Any], ts: Optional[int] = None) -> int:
+        """Store what changed since the project's last recorded audit.
+
+        Returns the number of check status changes written.
+        """
+        if "error" in result or "project_path" not in result:
+            return 0
+        ts = int(time.time()) if ts is None else ts
+        project = self._project_id(os.path.abspath(result["project_path"]), ts)
+
+        current = dict(self._conn.execute(
+            "SELECT rule, status FROM current WHERE project = ?", (project,)))
+        statuses = {self._rule_id(key): status for key, status in result_outcomes(result).items()}
+        for rule, status in current.items():
+            if rule not in statuses and status != ABSENT:
+                statuses[rule] = ABSENT
+
+        changes = [(project, rule, ts, status) for rule, status in statuses.items()
+                   if current.get(rule) != status]
+        if changes:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO outcomes VALUES (?, ?, ?, ?)", changes)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO current (project, rule, since, status) "
+                "VALUES (?, ?, ?, ?)", changes)
+
+        score, total = result_score(result)
+        meets = 1 if result.get("meets_standards") else 0
+        last = self._conn.execute(
+            "SELECT score, total, meets_standards FROM scores WHERE project = ? "
+            "ORDER BY ts DESC LIMIT 1", (project,)).fetchone()
+        if last != (score, total, meets):
+            self._conn.execute("INSERT OR REPLACE INTO scores VALUES (?, ?, ?, ?, ?)",
+                               (project, ts, score, total, meets))
+        return len(changes)
+
+    def record_all(self, results: Iterable[Dict[str, Any]], ts: Optional[int] = None) -> int:
+        changes = sum(self.record(result, ts) for result in results)
+        self.commit()
+        return changes
+
+    def commit(self):
+        self._conn.commit()
+
+    def close(self):
+        self.commit()
+        self._conn.close()
+
+    # -- reports -----------------------------------------------------------
+
+    def regressions(self, since: int) -> List[Dict[str, Any]]:
+        """Projects whose score dropped since `since`, with the checks that started failing.
+
+        Projects first recorded after `since` are compared with their first audit.
+        """
+        # One index probe per project for each end rather than a scan of scores
+        rows = self._conn.execute("""
+            WITH ends AS (
+                SELECT p.id, p.path,
+                       COALESCE((SELECT MAX(ts) FROM scores WHERE project = p.id AND ts <= ?),
+                                (SELECT MIN(ts) FROM scores WHERE project = p.id)) AS baseline,
+                       (SELECT MAX(ts) FROM scores WHERE project = p.id) AS latest
+                FROM projects p
+            )
+            SELECT e.id, e.path, e.baseline, b.score, b.total, b.meets_standards,
+                   l.score, l.total, l.meets_standards
+            FROM ends e
+            JOIN scores b ON b.project = e.id AND b.ts = e.baseline
+            JOIN scores l ON l.project = e.id AND l.ts = e.latest
+            WHERE l.score * b.total < b.score * l.total
+               OR (b.meets_standards = 1 AND l.meets_standards = 0)
+            ORDER BY e.path
+        """, (since,)).fetchall()
+
+        regressions = []
+        for project, path, baseline, old_score, old_total, old_meets, score, total, meets in rows:
+            regressions.append({
+                "project": path,
+                "before": {"score": old_score, "total": old_total,
+                           "percentage": old_score / old_total * 100 if old_total else 0,
+                           "meets_standards": bool(old_meets)},
+                "now": {"score": score, "total": total,
+                        "percentage": score / total * 100 if total else 0,
+                        "meets_standards": bool(meets)},
+                "new_failures": self._new_failures(project, max(since, baseline)),
+            })
+        return regressions
+
+    def _new_failures(self, project: int, since: int) -> List[Dict[str, Any]]:
+        """Checks failing now that were not failing at `since`"""
+        rows = self._conn.execute("""
+            SELECT r.validator, r.rule_id, r.path, r.ordinal, c.since,
+                   (SELECT status FROM outcomes o
+                    WHERE o.project = c.project AND o.rule = c.rule AND o.ts <= ?
+                    ORDER BY o.ts DESC LIMIT 1) AS before
+            FROM current c JOIN rules r ON r.id = c.rule
+            WHERE c.project = ? AND c.status = ? AND c.since > ?
+            ORDER BY r.validator, r.rule_id, r.path, r.ordinal
+        """, (since, project, FAILED, since)).fetchall()
+        return [{"validator": validator, "rule_id": rule_id, "path": path, "ordinal": ordinal,
+                 "failing_since": failing_since,
+                 "was": {PASSED: "passed", ABSENT: "absent", None: "new"}.get(before, "failed")}
+                for validator, rule_id, path, ordinal, failing_since, before in rows
+                if before != FAILED]
+
+    def pass_rates(self, since: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Latest pass rate per rule across projects, worst first.
+
+        With `since`, only projects audited since then are counted.
+        """
+        query = """
+            SELECT r.validator, r.rule_id, r.path, r.ordinal,
+                   SUM(c.status = 1), COUNT(*)
+            FROM current c JOIN rules r ON r.id = c.rule
+        """
+        params: Tuple[Any, ...] = (ABSENT,)
+        if since is not None:
+            query += " JOIN projects p ON p.id = c.project AND p.last_seen >= ?"
+            params = (since, ABSENT)
+        query += """
+            WHERE c.status != ?
+            GROUP BY c.rule
+            ORDER BY 1.0 * SUM(c.status = 1) / COUNT(*), r.validator, r.rule_id, r.path
+        """
+        return [{"validator": validator, "rule_id": rule_id, "path": path, "ordinal": ordinal,
+                 "passed": passed, "projects": projects,
+                 "pass_rate": passed / projects * 100 if projects else 0}
+                for validator, rule_id, path, ordinal, passed, projects
+                in self._conn.execute(query, params)]
+
+    def trend(self, project_path: str) -> List[Dict[str, Any]]:
+        """Every recorded score change of one project, oldest first"""
+        rows = self._conn.execute("""
+            SELECT s.ts, s.score, s.total, s.meets_standards
+            FROM scores s JOIN projects p ON p.id = s.project
+            WHERE p.path = ? ORDER BY s.ts
+        """, (os.path.abspath(project_path),))
+        return [{"ts": ts, "score": score, "total": total,
+                 "percentage": score / total * 100 if total else 0,
+                 "meets_standards": bool(meets)}
+                for ts, score, total, meets in rows]
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Audit Output Formats
+
+Serialises audit results for machines. `json` prints one document per
+run; `ndjson` streams one compact record per check followed by a
+summary record per validator and per project, flushing after every line
+so log shippers and `jq` pipelines can consume fleet audits as they run.
+For a single project, check records are written from the validators'
+on_check callback (see stream_checks()) as each check finishes.
+"""
+
+import json
+import sys
+from typing import Any, Callable, Dict, Iterator, Optional, TextIO
+
+from check_results import CheckResults, render_message
+
+FORMATS = ("text", "json", "ndjson")
+
+
+def check_records(project_path: str, validator: str,
+                  checks: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """One record per check in a validator's columnar "checks" entry"""
+    return results_records(project_path, validator, CheckResults.from_dict(checks))
+
+
+def results_records(project_path: str, validator: str,
+                    results: CheckResults) -> Iterator[Dict[str, Any]]:
+    """One record per check in a CheckResults"""
+    for rule_id, passed, severity, path, args in results.records():
+        yield {
+            "record": "check",
+            "project": project_path,
+            "validator": validator,
+            "rule_id": rule_id,
+            "passed": passed,
+            "severity": severity,
+            "path": path,
+            "args": list(args),
+            "message": "\n".join(render_message(rule_id, passed, path, args)),
+        }
+
+
+def validator_records(validator: str, result: Dict[str, Any],
+                      checks: bool = True) -> Iterator[Dict[str, Any]]:
+    """Check records for one validator result (unless already streamed), then its summary"""
+    project_path = result.get("project_path", "")
+    if checks and "checks" in result:
+        yield from check_records(project_path, validator, result["checks"])
+
+    summary = {key: value for key, value in result.items()
+               if key not in ("checks", "project_path")}
+    yield {"record": "summary", "project": project_path, "validator": validator, **summary}
+
+
+def audit_records(result: Dict[str, Any], checks: bool = True) -> Iterator[Dict[str, Any]]:
+    """Records for a combined result from fleet_auditor.audit_one().
+
+    checks=False leaves out the check records, when stream_checks() wrote them.
+    """
+    project_path = result["project_path"]
+    # Results of `audit --ref` say which revision every record describes
+    revision = {key: result[key] for key in ("ref", "commit") if key in result}
+    for validator in ("structure", "uv"):
+        if validator in result:
+            for record in validator_records(validator, {"project_path": project_path,
+                                                        **result[validator]}, checks):
+                yield {**record, **revision}
+
+    project = {"record": "project", "project": project_path, **revision,
+               "meets_standards": result["meets_standards"]}
+    if "error" in result:
+        project["error"] = result["error"]
+    yield project
+
+
+def workspace_records(result: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Records for a result from workspace_auditor.audit_workspace()"""
+    for part in [result["root"]] + result["packages"]:
+        yield from audit_records(part)
+
+    yield {"record": "workspace", "workspace": result["workspace_path"],
+           **{key: value for key, value in result.items()
+              if key not in ("workspace_path", "root", "packages")},
+           "packages": [part["package"] for part in result["packages"]]}
+
+
+def stream_checks(project_path: str,
+                  stream: Optional[TextIO] = None) -> Callable[[str, str, CheckResults], None]:
+    """An on_check callback for fleet_auditor.audit_one() writing each check's records"""
+    def on_check(validator: str, check_name: str, outcome: CheckResults):
+        write_ndjson(results_records(str(project_path), validator, outcome), stream)
+    return on_check
+
+
+def write_ndjson(records, stream: Optional[TextIO] = None):
+    """Write records as compact JSON lines, flushing each one"""
+    stream = stream or sys.stdout
+    for record in records:
+        stream.write(json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n")
+        stream.flush()
+
+
+def write_json(document: Any, stream: Optional[TextIO] = None):
+    """Write one pretty-printed JSON document"""
+    stream = stream or sys.stdout
+    stream.write(json.dumps(document, indent=2) + "\n")
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Structured Check Results
+
+Checks record compact outcomes - rule id, status, severity, path and
+message args - in column arrays instead of formatting strings. Human
+readable text is only produced when a formatter asks for it, using the
+message templates below, so JSON consumers get stable rule ids and no
+rendering cost. Only error records count towards a score; warnings are
+reported alongside it, and a failed warning renders with ⚠️ instead of ❌.
+"""
+
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Severities
+ERROR = "error"
+WARNING = "warning"
+
+# Message templates per rule id: (passed, failed). A template is either a
+# single line or a tuple of lines, formatted with the record's args as
+# positional fields and its path as {path}.
+MESSAGES: Dict[str, Tuple[Any, Any]] = {
+    # structure_validator
+    "structure.required_file": ("✅ {path}", "❌ {path}"),
+    "structure.required_dir": ("✅ {path} (directory)", "❌ {path} (directory missing)"),
+    "structure.type_file": ("✅ {path} ({0} file)", "❌ {path} ({0} file missing)"),
+    "structure.type_dir": ("✅ {path} ({0} directory)", "❌ {path} ({0} directory missing)"),
+    "structure.type_forbidden": ("✅ No forbidden file: {path}", "❌ {path} - {0}"),
+    "structure.project_type": ("✅ Project type: {0}", "❌ Cannot determine project type"),
+    "structure.agents_md.exists": ("✅ AGENTS.md file present", "❌ AGENTS.md file missing"),
+    "structure.agents_md.structure": ("✅ AGENTS.md has proper structure",
+                                      "❌ AGENTS.md missing proper structure"),
+    "structure.agents_md.content": ("✅ AGENTS.md has meaningful content", "❌ AGENTS.md {0}"),
+    "structure.agents_md.read_error": ("", "❌ Error reading AGENTS.md: {0}"),
+    "structure.git.repository": ("✅ Git repository initialized", "❌ Not a git repository"),
+    "structure.git.gitignore": ("✅ .gitignore file present", "❌ .gitignore file missing"),
+    "structure.git.head": ("✅ HEAD is on branch {0}", "❌ HEAD is detached at {0}"),
+    "structure.git.branch": ("✅ Branch name follows convention: {0}",
+                             ("❌ Branch name does not follow convention: {0}",
+                              "   → Use YYYYMMDD-HHMMSS-type-description (type: feat, fix, docs, "
+                              "refactor, test, chore)")),
+    "structure.git.sync": ("✅ {0} is not behind {1} (ahead {2})",
+                           "❌ {0} is {3} commit(s) behind {1} (ahead {2})"),
+    "structure.git.clean": ("✅ No uncommitted changes to tracked files",
+                            ("❌ {0} tracked file(s) with uncommitted changes", "   → {1}")),
+    "structure.git.read_error": ("", "❌ Error reading git metadata: {0}"),
+
+    # uv_validator
+    "uv.installed": ("✅ {0}", "❌ {0}"),
+    "uv.required_file": ("✅ {path} exists", "❌ {path} missing"),
+    "uv.required_dir": ("✅ {path} directory exists", "❌ {path} directory missing"),
+    "uv.forbidden_file": ("✅ No forbidden file: {path}",
+                          ("❌ {path} found - {0}", "   → Use instead: {1}")),
+    "uv.pyproject.exists": ("✅ pyproject.toml present",
+                            "❌ pyproject.toml missing (REQUIRED for UV projects)"),
+    "uv.pyproject.parser": ("", "❌ Cannot parse pyproject.toml - install tomllib/tomli"),
+    "uv.pyproject.parse_error": ("", "❌ Error parsing pyproject.toml: {0}"),
+    "uv.pyproject.project_section": ("✅ [project] section exists",
+                                     "❌ [project] section missing in pyproject.toml"),
+    "uv.pyproject.field": ("✅ project.{0} defined", "❌ project.{0} missing"),
+    "uv.pyproject.dependencies": ("✅ project.dependencies defined",
+                                  "❌ project.dependencies missing (use instead of requirements.txt)"),
+    "uv.pyproject.build_system": ("✅ [build-system] section exists",
+                                  "❌ [build-system] section missing"),
+    "uv.lock.read_error": ("", "❌ Error reading uv.lock: {0}"),
+    "uv.lock.parse_error": ("", "❌ Cannot check uv.lock: {0}"),
+    "uv.lock.requires_python": ("✅ uv.lock requires-python matches ({0})",
+                                ("❌ uv.lock requires-python {1} differs from pyproject.toml {0}",
+                                 "   → Run: uv lock")),
+    "uv.lock.project": ("✅ uv.lock has an entry for {0}",
+                        ("❌ uv.lock has no entry for {0}", "   → Run: uv lock")),
+    "uv.lock.stale": ("✅ uv.lock matches pyproject.toml dependencies",
+                      ("❌ uv.lock is stale: {0} requirement change(s) since locking",
+                       "   → {1}", "   → Run: uv lock")),
+    "uv.lock.missing": ("✅ Every declared dependency is locked",
+                        ("❌ {0} declared dependency(ies) not in uv.lock", "   → {1}")),
+    "uv.lock.duplicate": ("✅ No duplicate packages in uv.lock",
+                          ("❌ {0} package version(s) locked more than once", "   → {1}")),
+    "uv.gitignore.exists": ("✅ .gitignore present", "❌ .gitignore missing"),
+    "uv.gitignore.entry": ("✅ .gitignore ignores {0}", "❌ .gitignore does not ignore {0}"),
+    "uv.gitignore.read_error": ("", "❌ Error reading .gitignore: {0}"),
+    "uv.agents_md.exists": ("✅ AGENTS.md present", "❌ AGENTS.md missing"),
+    "uv.agents_md.uv_section": ("✅ AGENTS.md contains UV-first requirements",
+                                ("❌ AGENTS.md missing UV-first requirements section",
+                                 "   → Found only: {0}",
+                                 "   → Must include UV-ONLY, uv pip install, uv run instructions")),
+    "uv.agents_md.forbidden_pattern": ("✅ AGENTS.md free of forbidden pattern: {0}",
+                                       ("❌ AGENTS.md contains forbidden pattern: {0} (line:column {1})",
+                                        "   → Must be prefixed with 'uv run' or replaced with UV equivalent")),
+    "uv.agents_md.read_error": ("", "❌ Error reading AGENTS.md: {0}"),
+    "uv.legacy_file": ("✅ No legacy file: {path}",
+                       ("❌ Legacy file found: {path}",
+                        "   → Remove and migrate to pyproject.toml with UV")),
+}
+
+
+def render_message(rule_id: str, passed: bool, path: str, args: Sequence[Any],
+                   severity: str = ERROR) -> List[str]:
+    """Render one record as the human-readable line(s) for its rule"""
+    templates = MESSAGES.get(rule_id)
+    if templates is None:
+        mark = "✅" if passed else "❌"
+        lines = [f"{mark} {rule_id} {path}".rstrip()]
+    else:
+        template = templates[0] if passed else templates[1]
+        if isinstance(template, str):
+            template = (template,)
+        lines = [line.format(*args, path=path) for line in template]
+    if not passed and severity == WARNING and lines and lines[0].startswith("❌"):
+        lines[0] = "⚠️" + lines[0][1:]
+    return lines
+
+
+class CheckResults:
+    """Column-oriented collection of check outcomes"""
+
+    __slots__ = ("rule_ids", "statuses", "severities", "paths", "args")
+
+    def __init__(self):
+        self.rule_ids: List[str] = []
+        self.statuses = array("b")
+        self.severities: List[str] = []
+        self.paths: List[str] = []
+        self.args: List[Sequence[Any]] = []
+
+    def add(self, rule_id: str, passed: bool, path: str = "", args: Sequence[Any] = (),
+            severity: str = ERROR):
+        """Record the outcome of a single check"""
+        self.rule_ids.append(rule_id)
+        self.statuses.append(1 if passed else 0)
+        self.severities.append(severity)
+        self.paths.append(path)
+        self.args.append(args)
+
+    def extend(self, other: "CheckResults"):
+        self.rule_ids.extend(other.rule_ids)
+        self.statuses.extend(other.statuses)
+        self.severities.extend(other.severities)
+        self.paths.extend(other.paths)
+        self.args.extend(other.args)
+
+    def __len__(self) -> int:
+        return len(self.statuses)
+
+    @property
+    def passed_count(self) -> int:
+        return sum(self.statuses)
+
+    @property
+    def failed_count(self) -> int:
+        return len(self.statuses) - sum(self.statuses)
+
+    @property
+    def scored(self) -> Tuple[int, int]:
+        """(passed, total) over error records; warnings are reported but not scored"""
+        passed = total = 0
+        for status, severity in zip(self.statuses, self.severities):
+            if severity != WARNING:
+                passed += status
+                total += 1
+        return passed, total
+
+    @property
+    def warning_count(self) -> int:
+        """Failed warning records"""
+        return sum(1 for status, severity in zip(self.statuses, self.severities)
+                   if severity == WARNING and not status)
+
+    def records(self) -> Iterator[Tuple[str, bool, str, str, Sequence[Any]]]:
+        """Iterate (rule_id, passed, severity, path, args) tuples"""
+        return zip(self.rule_ids, map(bool, self.statuses), self.severities,
+                   self.paths, self.args)
+
+    def render(self, passed: bool, severity: Optional[str] = None) -> List[str]:
+        """Human-readable lines for all passed or all failed records, optionally
+        of one severity only"""
+        wanted = 1 if passed else 0
+        lines = []
+        for rule_id, status, record_severity, path, args in zip(
+                self.rule_ids, self.statuses, self.severities, self.paths, self.args):
+            if status == wanted and severity in (None, record_severity):
+                lines.extend(render_message(rule_id, passed, path, args, record_severity))
+        return lines
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """Columnar, JSON-serialisable form"""
+        return {
+            "rule_id": self.rule_ids,
+            "status": self.statuses.tolist(),
+            "severity": self.severities,
+            "path": self.paths,
+            "args": [list(a) for a in self.args],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, List[Any]]) -> "CheckResults":
+        """Wrap the columnar form produced by to_dict()"""
+        results = cls()
+        results.rule_ids = list(data["rule_id"])
+        results.statuses = array("b", data["status"])
+        results.severities = list(data["severity"])
+        results.paths = list(data["path"])
+        results.args = list(data["args"])
+        return results
+
+
+def render_checks(checks: Dict[str, List[Any]], passed: bool,
+                  severity: Optional[str] = None) -> List[str]:
+    """Render the columnar "checks" entry of an audit result"""
+    return CheckResults.from_dict(checks).render(passed, severity)
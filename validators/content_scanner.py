@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Content Scanner
+
+Scans a file once for every literal pattern the validators care about.
+All patterns registered for a file are compiled into a single regular
+expression of zero-width alternatives, tried longest first, so each
+position is examined once no matter how many rules exist and overlapping
+hits ("pip install" inside "uv pip install") are all reported. Files are
+streamed in chunks with an overlap of the longest pattern, and every hit
+carries its line and column.
+"""
+
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+CHUNK_SIZE = 1 << 20
+
+_NON_SPACE = re.compile(r"\S")
+
+
+class Hit(NamedTuple):
+    """One occurrence of a pattern"""
+    offset: int
+    line: int
+    column: int
+
+    def location(self) -> str:
+        return f"{self.line}:{self.column}"
+
+
+class ScanResult:
+    """All hits for one file plus the few whole-file facts checks need"""
+
+    __slots__ = ("hits", "length", "stripped_length")
+
+    def __init__(self, patterns: Iterable[str]):
+        self.hits: Dict[str, List[Hit]] = {pattern: [] for pattern in patterns}
+        self.length = 0
+        # len(content.strip()), tracked without holding the content
+        self.stripped_length = 0
+
+    def found(self, pattern: str) -> bool:
+        return bool(self.hits[pattern])
+
+    def first(self, pattern: str) -> Optional[Hit]:
+        hits = self.hits[pattern]
+        return hits[0] if hits else None
+
+
+class ContentScanner:
+    """Compiled multi-pattern matcher for a fixed set of literals"""
+
+    def __init__(self, patterns: Iterable[str], ignore_case: Iterable[str] = ()):
+        ignore_case = frozenset(ignore_case)
+        # Longest first: a position reports the longest pattern that starts
+        # there, and the shorter patterns it implies come from _implied.
+        self.patterns: Tuple[str, ...] = tuple(sorted(set(patterns), key=lambda p: (-len(p), p)))
+        self.ignore_case = ignore_case & set(self.patterns)
+        self.max_length = max((len(p) for p in self.patterns), default=1)
+
+        alternatives = []
+        first_chars = set()
+        for index, pattern in enumerate(self.patterns):
+            body = re.escape(pattern)
+            first_chars.add(pattern[0])
+            if pattern in self.ignore_case:
+                body = f"(?i:{body})"
+                first_chars.update((pattern[0].lower(), pattern[0].upper()))
+            alternatives.append(f"(?P<p{index}>{body})")
+
+        self.regex = None
+        if alternatives:
+            # The leading character class rejects most positions before any
+            # alternative is tried.
+            guard = "".join(re.escape(c) for c in sorted(first_chars))
+            self.regex = re.compile(f"(?=[{guard}])(?=" + "|".join(alternatives) + ")")
+
+        # Shorter patterns that are a prefix of a longer one start at the
+        # same position; the regex only reports the longest of them.
+        self._implied: Dict[int, Tuple[int, ...]] = {}
+        for index, pattern in enumerate(self.patterns):
+            self._implied[index] = tuple(
+                other for other, shorter in enumerate(self.patterns)
+                if len(shorter) < len(pattern) and pattern.lower().startswith(shorter.lower())
+            )
+
+    def _matches_at(self, index: int, text: str, start: int) -> bool:
+        pattern = self.patterns[index]
+        candidate = text[start:start + len(pattern)]
+        if pattern in self.ignore_case:
+            return candidate.lower() == pattern.lower()
+        return candidate == pattern
+
+    def scan_chunks(self, chunks: Iterable[str]) -> ScanResult:
+        """Scan text delivered in chunks; matches may span chunk boundaries"""
+        result = ScanResult(self.patterns)
+        hits = [result.hits[pattern] for pattern in self.patterns]
+        overlap = self.max_length - 1
+
+        buffer = ""
+        base = 0          # absolute offset of buffer[0]
+        line = 1          # line number at buffer[0]
+        line_start = 0    # absolute offset of that line's first character
+        first_text = None
+        last_text = None
+
+        chunks = iter(chunks)
+        final = False
+        while not final:
+            chunk = next(chunks, None)
+            if chunk is None:
+                final = True
+            else:
+                consumed = result.length
+                result.length += len(chunk)
+                match = _NON_SPACE.search(chunk)
+                if match:
+                    if first_text is None:
+                        first_text = consumed + match.start()
+                    last_text = consumed + len(chunk.rstrip()) - 1
+                buffer += chunk
+                if len(buffer) <= overlap:
+                    continue
+
+            # Only positions whose longest pattern fits entirely in the
+            # buffer are decided now; the tail waits for the next chunk.
+            limit = len(buffer) if final else len(buffer) - overlap
+            position = 0
+            if self.regex is not None:
+                for match in self.regex.finditer(buffer, 0, len(buffer)):
+                    start = match.start()
+                    if start >= limit:
+                        break
+                    newlines = buffer.count("\n", position, start)
+                    if newlines:
+                        line += newlines
+                        line_start = base + buffer.rindex("\n", position, start) + 1
+                    position = start
+
+                    hit = Hit(base + start, line, base + start - line_start + 1)
+                    index = match.lastindex - 1
+                    hits[index].append(hit)
+                    for implied in self._implied[index]:
+                        if self._matches_at(implied, buffer, start):
+                            hits[implied].append(hit)
+
+            # Advance past the decided region, keeping line bookkeeping
+            newlines = buffer.count("\n", position, limit)
+            if newlines:
+                line += newlines
+                line_start = base + buffer.rindex("\n", position, limit) + 1
+            buffer = buffer[limit:]
+            base += limit
+
+        if first_text is not None:
+            result.stripped_length = last_text - first_text + 1
+        return result
+
+    def scan_text(self, text: str) -> ScanResult:
+        return self.scan_chunks((text,))
+
+    def scan_file(self, path, chunk_size: int = CHUNK_SIZE) -> ScanResult:
+        """Stream a UTF-8 file through the scanner"""
+        with open(path, encoding="utf-8", newline="") as f:
+            return self.scan_chunks(iter(lambda: f.read(chunk_size), ""))
+
+
+# Relative path -> patterns registered by validators for that file
+_registry: Dict[str, Dict[str, bool]] = {}
+_scanners: Dict[str, ContentScanner] = {}
+
+
+def register_patterns(relative_path: str, patterns: Sequence[str], ignore_case: bool = False):
+    """Add content rules for a file; all rules for it share one scan"""
+    rules = _registry.setdefault(relative_path, {})
+    for pattern in patterns:
+        rules[pattern] = rules.get(pattern, False) or ignore_case
+    _scanners.pop(relative_path, None)
+
+
+def scanner_for(relative_path: str) -> ContentScanner:
+    """Compiled scanner for every pattern registered for a file"""
+    scanner = _scanners.get(relative_path)
+    if scanner is None:
+        rules = _registry.get(relative_path, {})
+        scanner = ContentScanner(rules, [p for p, folded in rules.items() if folded])
+        _scanners[relative_path] = scanner
+    return scanner
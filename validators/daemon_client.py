@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Audit Daemon Client
+
+Thin client for the `start daemon` Unix socket API. Kept free of heavy
+imports so `start audit` can ask a running daemon for results without
+loading YAML or the validators itself.
+
+Protocol: one JSON object per line in each direction.
+    {"op": "audit", "project": "/abs/path"} -> {"ok": true, "result": {...}}
+    {"op": "ping"}                          -> {"ok": true, "pid": 1234}
+    {"op": "shutdown"}                      -> {"ok": true}
+"""
+
+import json
+import os
+import socket
+from typing import Any, Dict, Optional
+
+CONNECT_TIMEOUT = 0.2
+REQUEST_TIMEOUT = 30.0
+
+
+def default_socket_path() -> str:
+    """Socket location, preferring the per-user runtime directory"""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "start", "audit.sock")
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_dir, "start", "audit.sock")
+
+
+def request(message: Dict[str, Any], socket_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Send one request; returns None when no daemon is listening"""
+    socket_path = socket_path or default_socket_path()
+    if not os.path.exists(socket_path):
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            # Stale socket file from a daemon that is no longer running
+            return None
+
+        sock.settimeout(REQUEST_TIMEOUT)
+        sock.sendall(json.dumps(message).encode() + b"\n")
+
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if chunk.endswith(b"\n"):
+                break
+    except OSError:
+        return None
+    finally:
+        sock.close()
+
+    if not chunks:
+        return None
+    return json.loads(b"".join(chunks))
+
+
+def audit(project_path: str, socket_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Audit result from a running daemon, or None to fall back to a local audit"""
+    response = request({"op": "audit", "project": os.path.abspath(project_path)}, socket_path)
+    if response is None or not response.get("ok"):
+        return None
+    return response["result"]
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Parsed Config Documents
+
+Shared parse layer for the structured config files checks inspect:
+pyproject.toml, package.json and uv.lock. A ProjectSnapshot parses each
+document at most once per audit, and with an AuditCache the parsed form
+is also kept on disk, keyed on the file's path, mtime and size, so an
+unchanged file is not parsed again by later audits.
+"""
+
+import json
+import os
+from typing import Any, Dict, Optional
+
+import profiling
+
+# Document name -> parser kind
+PARSERS: Dict[str, str] = {
+    "pyproject.toml": "toml",
+    "uv.lock": "toml",
+    "package.json": "json",
+}
+
+
+class DocumentError(ValueError):
+    """A config document could not be parsed"""
+
+
+def toml_module():
+    """tomllib on Python 3.11+, tomli before that, or None"""
+    try:
+        import tomllib
+        return tomllib
+    except ImportError:
+        try:
+            import tomli
+            return tomli
+        except ImportError:
+            return None
+
+
+def parse_bytes(name: str, data: bytes) -> Any:
+    """Parse raw document content with the parser for its file name"""
+    kind = PARSERS.get(os.path.basename(name))
+    if kind == "toml":
+        toml = toml_module()
+        if toml is None:
+            raise ImportError("No TOML parser available (install tomli on Python < 3.11)")
+        return toml.loads(data.decode())
+    if kind == "json":
+        return json.loads(data.decode())
+    raise ValueError(f"No parser registered for {name}")
+
+
+def load_document(snapshot, name: str, cache=None) -> Any:
+    """Parse a document from a snapshot, consulting the on-disk parse cache.
+
+    Parse failures are cached too and raised as DocumentError with the
+    parser's message.
+    """
+    st = snapshot.stat(name)
+    if st is None:
+        raise FileNotFoundError(os.path.join(str(snapshot.path), name))
+
+    path = os.path.abspath(os.path.join(str(snapshot.path), name))
+    stamp = f"{st.st_mtime_ns}:{st.st_size}"
+
+    entry: Optional[Dict[str, Any]] = None
+    if cache is not None:
+        entry = cache.get_document(path, stamp)
+        if entry is not None:
+            profiling.count("cache_hits")
+
+    if entry is None:
+        with profiling.span(f"parse:{name}"):
+            try:
+                entry = {"data": parse_bytes(name, snapshot.read_bytes(name))}
+            except ValueError as e:
+                entry = {"error": str(e)}
+        if cache is not None:
+            cache.put_document(path, stamp, entry)
+
+    if "error" in entry:
+        raise DocumentError(entry["error"])
+    return entry["data"]
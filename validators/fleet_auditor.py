@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Fleet Auditor
+
+Discovers projects under a root directory and audits them in parallel
+with ProjectValidator and UVValidator. Each worker process loads the
+standards once and results are streamed back as each project finishes.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Iterable, Iterator, Optional
+
+from project_snapshot import ProjectSnapshot
+import profiling
+
+# Files or directories that mark a directory as a project root
+PROJECT_MARKERS = (
+    ".git",
+    "pyproject.toml",
+    "package.json",
+    "astro.config.mjs",
+    "setup.py",
+    "requirements.txt",
+)
+
+# Directories never descended into while discovering projects
+SKIP_DIRS = {"node_modules", ".venv", "venv", "__pycache__", "site-packages"}
+
+PYTHON_MARKERS = ("pyproject.toml", "setup.py", "requirements.txt")
+
+# Validators owned by the current worker process (set by _init_worker)
+_worker_validators = None
+
+
+def discover_projects(root: Path, max_depth: int = 2) -> List[Path]:
+    """Find project directories under root, not descending into projects"""
+    root = Path(root)
+    projects = []
+    pending = [(root, 0)]
+
+    while pending:
+        directory, depth = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                children = []
+                names = set()
+                for entry in entries:
+                    names.add(entry.name)
+                    if (entry.is_dir(follow_symlinks=False)
+                            and not entry.name.startswith(".")
+                            and entry.name not in SKIP_DIRS):
+                        children.append(entry.path)
+        except OSError:
+            continue
+
+        if depth > 0 and any(marker in names for marker in PROJECT_MARKERS):
+            projects.append(Path(directory))
+            continue
+
+        if depth < max_depth:
+            pending.extend((Path(child), depth + 1) for child in children)
+
+    return sorted(projects)
+
+
+def is_python_project(snapshot: ProjectSnapshot) -> bool:
+    """Check whether a project should also get the UV compliance audit"""
+    return any(snapshot.exists(marker) for marker in PYTHON_MARKERS)
+
+
+def meets_standards(result: Dict[str, Any]) -> bool:
+    """Apply the same pass criteria as `start audit --project`"""
+    structure = result.get("structure", {})
+    if "error" in result or "error" in structure:
+        return False
+    if structure.get("percentage", 0) < 75:
+        return False
+    if "uv" in result:
+        return result["uv"].get("uv_compliant", False)
+    return True
+
+
+def audit_one(project_path: str, validators, snapshot: Optional[ProjectSnapshot] = None,
+              reuse: Optional[Dict[str, Dict[str, Any]]] = None,
+              outcomes: Optional[Dict[str, Dict[str, Any]]] = None,
+              on_check: Optional[Callable[[str, str, Any], None]] = None) -> Dict[str, Any]:
+    """Audit a single project with already-loaded validators.
+
+    reuse and outcomes map "structure" and "uv" to the per-check mappings
+    of ProjectValidator.audit_project() and UVValidator.validate_uv_compliance();
+    on_check(validator, check_name, outcome) is called as each check finishes.
+    """
+    structure_validator, uv_validator = validators
+    if snapshot is None:
+        snapshot = ProjectSnapshot(project_path)
+    reuse = reuse or {}
+    outcomes = outcomes if outcomes is not None else {}
+
+    def notify(validator: str):
+        if on_check is None:
+            return None
+        return lambda check_name, outcome: on_check(validator, check_name, outcome)
+
+    result = {
+        "project_path": str(project_path),
+        "structure": structure_validator.audit_project(
+            project_path, snapshot, reuse=reuse.get("structure"),
+            outcomes=outcomes.get("structure"), on_check=notify("structure")),
+    }
+    if is_python_project(snapshot):
+        result["uv"] = uv_validator.validate_uv_compliance(
+            project_path, snapshot, reuse=reuse.get("uv"), outcomes=outcomes.get("uv"),
+            on_check=notify("uv"))
+    result["meets_standards"] = meets_standards(result)
+
+    if structure_validator.cache is not None:
+        structure_validator.cache.commit()
+    return result
+
+
+def load_validators(standards_dir: Optional[Path] = None, cache_path: Optional[Path] = None):
+    """Load both validators, parsing each standards file once.
+
+    When cache_path is given both validators share one AuditCache there.
+    """
+    from structure_validator import ProjectValidator
+    from uv_validator import UVValidator
+
+    cache = None
+    if cache_path is not None:
+        from audit_cache import AuditCache
+        cache = AuditCache(cache_path)
+
+    return ProjectValidator(standards_dir, cache), UVValidator(standards_dir, cache)
+
+
+def _init_worker(standards_dir: Optional[Path], cache_path: Optional[Path], profile: bool = False):
+    """Process pool initializer: load validators once per worker"""
+    global _worker_validators
+    if profile:
+        # A forked worker may inherit the parent's profiler; start clean
+        profiling.enable().reset()
+    _worker_validators = load_validators(standards_dir, cache_path)
+
+
+def _audit_in_worker(task: Callable, project_path: str) -> Dict[str, Any]:
+    result = task(project_path, _worker_validators)
+    profiler = profiling.active()
+    if profiler is not None:
+        # Ship this project's span statistics back for aggregation
+        result["profile"] = profiler.to_dict()
+        profiler.reset()
+    return result
+
+
+def audit_fleet(projects: Iterable[Path], workers: Optional[int] = None,
+                standards_dir: Optional[Path] = None,
+                cache_path: Optional[Path] = None,
+                profile: bool = False,
+                task: Callable = audit_one) -> Iterator[Dict[str, Any]]:
+    """Audit projects across a process pool, yielding results as they finish.
+
+    Each project is audited with task(project_path, validators), which
+    must be a module-level function so it can be sent to the workers.
+    With profile=True each result carries its worker's span statistics
+    under "profile" (see profiling.Profiler.merge).
+    """
+    projects = [str(p) for p in projects]
+    if not projects:
+        return
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(projects)))
+
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_worker,
+                             initargs=(standards_dir, cache_path, profile)) as pool:
+        futures = {pool.submit(_audit_in_worker, task, path): path for path in projects}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                yield {
+                    "project_path": futures[future],
+                    "error": str(e),
+                    "meets_standards": False,
+                }
+
+
+def main():
+    """CLI interface for fleet auditing"""
+    import sys
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Fleet Project Auditor")
+    parser.add_argument("root", help="Directory containing projects to audit")
+    parser.add_argument("--workers", "-j", type=int, help="Number of worker processes")
+    parser.add_argument("--depth", type=int, default=2, help="Maximum discovery depth")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the audit cache")
+
+    args = parser.parse_args()
+
+    cache_path = None
+    if not args.no_cache:
+        from audit_cache import default_cache_path
+        cache_path = default_cache_path()
+
+    projects = discover_projects(Path(args.root), args.depth)
+    failures = 0
+    for result in audit_fleet(projects, args.workers, cache_path=cache_path):
+        if not result["meets_standards"]:
+            failures += 1
+        if args.json:
+            print(json.dumps(result), flush=True)
+        else:
+            status = "✅" if result["meets_standards"] else "❌"
+            print(f"{status} {result['project_path']}", flush=True)
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,873 @@
+#!/usr/bin/env python3
+"""
+Git Metadata Reader
+
+Reads repository state straight from the .git directory so audits never
+fork `git`: HEAD, loose and packed refs, branch upstreams from the config,
+worktree and submodule `.git` files, commits and trees from loose
+objects and pack files (for ahead/behind counts and for auditing other
+revisions), and the index (for modified tracked files and staged
+changes). A typical audit costs a handful of small file reads per
+repository.
+
+Only what the audit needs is implemented: untracked files are not
+reported, clean/smudge filters are assumed not to change file sizes, and
+split and sparse indexes are refused with a GitError.
+"""
+
+import hashlib
+import heapq
+import mmap
+import os
+import re
+import stat
+import struct
+import zlib
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+import profiling
+
+# YYYYMMDD-HHMMSS-type-description, as enforced by scripts/local-ci.sh
+BRANCH_PATTERN = re.compile(r"^[0-9]{8}-[0-9]{6}-(feat|fix|docs|refactor|test|chore)-.+$")
+# Long-lived branches exempt from the naming convention
+PROTECTED_BRANCHES = ("main",)
+
+# Commits visited before an ahead/behind count is given up as unknown
+MAX_WALK = 10_000
+
+HASH_LENGTHS = {"sha1": 20, "sha256": 32}
+
+OBJECT_TYPES = {1: "commit", 2: "tree", 3: "blob", 4: "tag"}
+OFS_DELTA = 6
+REF_DELTA = 7
+
+# Index entry flags
+ASSUME_VALID = 0x8000
+EXTENDED = 0x4000
+SKIP_WORKTREE = 0x4000  # in the extended flags
+NAME_MASK = 0x0FFF
+FLAGS = struct.Struct(">H")
+GITLINK = 0o160000
+TREE = 0o040000
+
+
+# Refs outside refs/ that a revision may name directly
+PSEUDO_REF = re.compile(r"[A-Z_]+")
+
+# Mandatory index extensions (lower-case signatures) readers must understand;
+# entries are misread without them, so they are refused
+INDEX_EXTENSIONS = {b"link": "split index (core.splitIndex)", b"sdir": "sparse index"}
+
+
+class GitError(ValueError):
+    """Repository metadata could not be read"""
+
+
+# Everything a corrupt or unexpected repository can raise while being read
+READ_ERRORS = (GitError, OSError, ValueError, IndexError, KeyError, struct.error, zlib.error)
+
+
+def _read(path: str) -> Optional[bytes]:
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+        return None
+    profiling.count("bytes_read", len(data))
+    return data
+
+
+def _check_extensions(data: bytes, offset: int, hash_length: int):
+    """Raise GitError for a mandatory extension among the index extensions at offset"""
+    end = len(data) - hash_length
+    while offset + 8 <= end:
+        signature = data[offset:offset + 4]
+        if not b"A" <= signature[:1] <= b"Z":
+            name = INDEX_EXTENSIONS.get(signature, f"extension {signature!r}")
+            raise GitError(f"Unsupported index: {name}")
+        offset += 8 + struct.unpack_from(">I", data, offset + 4)[0]
+
+
+def _varint(data: bytes, offset: int) -> Tuple[int, int]:
+    """Little-endian base-128 integer, as used in delta headers"""
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return value, offset
+
+
+def apply_delta(base: bytes, delta: bytes) -> bytes:
+    """Rebuild an object from its base and a pack delta"""
+    _, offset = _varint(delta, 0)
+    size, offset = _varint(delta, offset)
+    out = bytearray()
+    while offset < len(delta):
+        op = delta[offset]
+        offset += 1
+        if op & 0x80:
+            copy_offset = copy_size = 0
+            for bit in range(4):
+                if op & (1 << bit):
+                    copy_offset |= delta[offset] << (8 * bit)
+                    offset += 1
+            for bit in range(3):
+                if op & (0x10 << bit):
+                    copy_size |= delta[offset] << (8 * bit)
+                    offset += 1
+            out += base[copy_offset:copy_offset + (copy_size or 0x10000)]
+        elif op:
+            out += delta[offset:offset + op]
+            offset += op
+        else:
+            raise GitError("Invalid delta opcode 0")
+    if len(out) != size:
+        raise GitError("Delta produced the wrong size")
+    return bytes(out)
+
+
+class _SortedIds:
+    """The sorted object ids of a pack index, sliced out on access so that
+    opening a pack costs nothing per object"""
+
+    def __init__(self, idx: bytes, start: int, count: int, hash_length: int):
+        self.idx = idx
+        self.start = start
+        self.count = count
+        self.hash_length = hash_length
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> bytes:
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        position = self.start + index * self.hash_length
+        return self.idx[position:position + self.hash_length]
+
+
+class PackFile:
+    """A pack and its version 2 index"""
+
+    def __init__(self, idx_path: str, hash_length: int):
+        self.pack_path = idx_path[:-4] + ".pack"
+        self.hash_length = hash_length
+        idx = _read(idx_path)
+        if idx is None or idx[:4] != b"\377tOc" or struct.unpack(">I", idx[4:8])[0] != 2:
+            raise GitError(f"Unsupported pack index: {idx_path}")
+        self.fanout = struct.unpack(">256I", idx[8:8 + 1024])
+        count = self.fanout[-1]
+        start = 8 + 1024
+        self.hashes = _SortedIds(idx, start, count, hash_length)
+        self.idx = idx
+        self.offsets_start = start + count * hash_length + count * 4
+        large_start = self.offsets_start + count * 4
+        self.large_offsets = idx[large_start:len(idx) - 2 * hash_length]
+        self._data: Optional[mmap.mmap] = None
+
+    def offset_of(self, binary_sha: bytes) -> Optional[int]:
+        first = binary_sha[0]
+        low = self.fanout[first - 1] if first else 0
+        high = self.fanout[first]
+        index = bisect_left(self.hashes, binary_sha, low, high)
+        if index == high or self.hashes[index] != binary_sha:
+            return None
+        offset = struct.unpack_from(">I", self.idx, self.offsets_start + index * 4)[0]
+        if offset & 0x80000000:
+            large = (offset & 0x7FFFFFFF) * 8
+            offset = struct.unpack(">Q", self.large_offsets[large:large + 8])[0]
+        return offset
+
+    @property
+    def data(self) -> mmap.mmap:
+        # Mapped rather than read: only the objects actually visited are paged in
+        if self._data is None:
+            try:
+                with open(self.pack_path, "rb") as f:
+                    self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError) as e:
+                raise GitError(f"Cannot open pack {self.pack_path}: {e}")
+        return self._data
+
+    def read_at(self, offset: int, repository: "GitRepository") -> Tuple[str, bytes]:
+        data = self.data
+        byte = data[offset]
+        kind = (byte >> 4) & 7
+        size = byte & 0x0F
+        shift = 4
+        position = offset + 1
+        while byte & 0x80:
+            byte = data[position]
+            position += 1
+            size |= (byte & 0x7F) << shift
+            shift += 7
+
+        if kind == OFS_DELTA:
+            byte = data[position]
+            position += 1
+            distance = byte & 0x7F
+            while byte & 0x80:
+                byte = data[position]
+                position += 1
+                distance = ((distance + 1) << 7) | (byte & 0x7F)
+            base_kind, base = self.read_at(offset - distance, repository)
+        elif kind == REF_DELTA:
+            base_sha = data[position:position + self.hash_length].hex()
+            position += self.hash_length
+            base_kind, base = repository.read_object(base_sha)
+        else:
+            return OBJECT_TYPES[kind], zlib.decompressobj().decompress(
+                memoryview(data)[position:], size)
+
+        delta = zlib.decompressobj().decompress(memoryview(data)[position:], size)
+        return base_kind, apply_delta(base, delta)
+
+
+class _IndexCursor:
+    """Reads index entries in order; entries skipped over are not decoded
+    (before index version 4, whose paths are compressed against the last)"""
+
+    def __init__(self, data: bytes, hash_length: int):
+        if data[:4] != b"DIRC":
+            raise GitError("Invalid index signature")
+        self.version, self.remaining = struct.unpack(">II", data[4:12])
+        if self.version not in (2, 3, 4):
+            raise GitError(f"Unsupported index version {self.version}")
+        self.data = data
+        self.hash_length = hash_length
+        self.offset = 12
+        self.previous = b""
+        self._entry: Optional[Tuple[bytes, int, str, int]] = None
+
+    def current(self) -> Optional[Tuple[bytes, int, str]]:
+        """(path, mode, object id) of the entry at the cursor, or None at the end"""
+        if self.remaining <= 0:
+            return None
+        if self._entry is None:
+            self._entry = self._decode()
+        return self._entry[:3]
+
+    def _decode(self) -> Tuple[bytes, int, str, int]:
+        data, offset, hash_length = self.data, self.offset, self.hash_length
+        mode = struct.unpack_from(">I", data, offset + 24)[0]
+        sha = data[offset + 40:offset + 40 + hash_length].hex()
+        flags = struct.unpack_from(">H", data, offset + 40 + hash_length)[0]
+        position = offset + 42 + hash_length
+        if flags & EXTENDED and self.version >= 3:
+            position += 2
+
+        if self.version == 4:
+            strip, position = GitRepository._index_varint(data, position)
+            end = data.index(b"\0", position)
+            path = self.previous[:len(self.previous) - strip] + data[position:end]
+            return path, mode, sha, end + 1
+        length = flags & NAME_MASK
+        end = position + length if length < NAME_MASK else data.index(b"\0", position)
+        return data[position:end], mode, sha, offset + ((end - offset) // 8 + 1) * 8
+
+    def advance(self, count: int = 1):
+        """Move past count entries"""
+        count = min(count, self.remaining)
+        self.remaining -= count
+        if self._entry is not None and count:
+            # Already decoded
+            self.previous, self.offset = self._entry[0], self._entry[3]
+            self._entry = None
+            count -= 1
+        if self.version == 4:
+            for _ in range(count):
+                self.previous, self.offset = self._decode()[::3]
+            return
+
+        # Only the name length is needed to find the next entry
+        data, offset, extended = self.data, self.offset, self.version >= 3
+        flags_at = 40 + self.hash_length
+        unpack = FLAGS.unpack_from
+        for _ in range(count):
+            flags = unpack(data, offset + flags_at)[0]
+            position = offset + flags_at + (4 if extended and flags & EXTENDED else 2)
+            length = flags & NAME_MASK
+            if length == NAME_MASK:
+                length = data.index(b"\0", position) - position
+            offset += (position - offset + length) // 8 * 8 + 8
+        self.offset = offset
+
+
+class GitRepository:
+    """Read-only view of one repository's metadata"""
+
+    def __init__(self, worktree: str, git_dir: str, common_dir: str):
+        self.worktree = worktree
+        self.git_dir = git_dir
+        self.common_dir = common_dir
+        self._config: Optional[Dict[Tuple[str, str], Dict[str, str]]] = None
+        self._packed_refs: Optional[Dict[str, str]] = None
+        self._packs: Optional[List[PackFile]] = None
+        self._commits: Dict[str, Tuple[int, List[str]]] = {}
+        self._trees: Dict[str, Dict[str, Tuple[int, str]]] = {}
+
+    @classmethod
+    def discover(cls, worktree) -> Optional["GitRepository"]:
+        """The repository whose working tree is `worktree`, or None.
+
+        Follows `.git` files (`gitdir: ...`) used by linked worktrees and
+        submodules, and a worktree's `commondir`.
+        """
+        worktree = str(worktree)
+        dot_git = os.path.join(worktree, ".git")
+        if os.path.isdir(dot_git):
+            git_dir = dot_git
+        else:
+            content = _read(dot_git)
+            if content is None or not content.startswith(b"gitdir:"):
+                return None
+            git_dir = os.path.join(worktree, content[7:].strip().decode())
+            if not os.path.isdir(git_dir):
+                return None
+        git_dir = os.path.normpath(git_dir)
+
+        common_dir = git_dir
+        commondir = _read(os.path.join(git_dir, "commondir"))
+        if commondir is not None:
+            common_dir = os.path.normpath(os.path.join(git_dir, commondir.strip().decode()))
+        return cls(worktree, git_dir, common_dir)
+
+    # -- config and refs ---------------------------------------------------
+
+    @property
+    def config(self) -> Dict[Tuple[str, str], Dict[str, str]]:
+        """(section, subsection) -> {key: value}; keys are lowercased"""
+        if self._config is None:
+            self._config = {}
+            content = _read(os.path.join(self.common_dir, "config")) or b""
+            section: Dict[str, str] = {}
+            for line in content.decode("utf-8", "replace").splitlines():
+                line = line.strip()
+                if not line or line[0] in "#;":
+                    continue
+                header = re.match(r'^\[\s*([\w.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]', line)
+                if header:
+                    name, subsection = header.group(1).lower(), header.group(2) or ""
+                    if "." in name and not subsection:
+                        # Legacy [section.subsection] syntax
+                        name, subsection = name.split(".", 1)
+                    section = self._config.setdefault((name, subsection), {})
+                    continue
+                key, _, value = line.partition("=")
+                section[key.strip().lower()] = value.strip().strip('"') if _ else "true"
+        return self._config
+
+    @property
+    def hash_length(self) -> int:
+        object_format = self.config.get(("extensions", ""), {}).get("objectformat", "sha1")
+        return HASH_LENGTHS.get(object_format, 20)
+
+    @property
+    def packed_refs(self) -> Dict[str, str]:
+        if self._packed_refs is None:
+            self._packed_refs = {}
+            content = _read(os.path.join(self.common_dir, "packed-refs")) or b""
+            for line in content.decode("utf-8", "replace").splitlines():
+                # Skip the header and ^peeled tag targets
+                if line and line[0] not in "#^":
+                    sha, _, name = line.partition(" ")
+                    self._packed_refs[name] = sha
+        return self._packed_refs
+
+    def _ref_dir(self, ref: str) -> str:
+        # HEAD and refs outside refs/ are per worktree; everything else is shared
+        return self.common_dir if ref.startswith("refs/") else self.git_dir
+
+    def resolve(self, ref: str) -> Optional[str]:
+        """Object id a ref points to, following symbolic refs; None if unborn"""
+        for _ in range(5):
+            content = _read(os.path.join(self._ref_dir(ref), ref))
+            if content is None:
+                return self.packed_refs.get(ref)
+            try:
+                content = content.strip().decode()
+            except UnicodeDecodeError:
+                raise GitError(f"Not a ref: {ref}")
+            if not content.startswith("ref:"):
+                # FETCH_HEAD lists more after the first object id
+                sha = content.split(None, 1)[0] if content else ""
+                if not re.fullmatch(f"[0-9a-f]{{{self.hash_length * 2}}}", sha):
+                    raise GitError(f"Not a ref: {ref}")
+                return sha
+            ref = content[4:].strip()
+        raise GitError(f"Symbolic ref loop at {ref}")
+
+    def head(self) -> Tuple[Optional[str], Optional[str]]:
+        """(branch name or None when detached, commit id or None when unborn)"""
+        content = _read(os.path.join(self.git_dir, "HEAD"))
+        if content is None:
+            raise GitError("HEAD missing")
+        content = content.strip().decode()
+        if content.startswith("ref:"):
+            ref = content[4:].strip()
+            branch = ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ref
+            return branch, self.resolve(ref)
+        return None, content
+
+    def upstream(self, branch: str) -> Optional[str]:
+        """Remote-tracking ref configured for a branch, e.g. refs/remotes/origin/main"""
+        settings = self.config.get(("branch", branch), {})
+        remote, merge = settings.get("remote"), settings.get("merge")
+        if not remote or not merge:
+            return None
+        if remote == ".":
+            return merge
+        if merge.startswith("refs/heads/"):
+            merge = merge[len("refs/heads/"):]
+        return f"refs/remotes/{remote}/{merge}"
+
+    # -- objects -----------------------------------------------------------
+
+    @property
+    def packs(self) -> List[PackFile]:
+        if self._packs is None:
+            pack_dir = os.path.join(self.common_dir, "objects", "pack")
+            try:
+                names = sorted(name for name in os.listdir(pack_dir) if name.endswith(".idx"))
+            except OSError:
+                names = []
+            self._packs = [PackFile(os.path.join(pack_dir, name), self.hash_length)
+                           for name in names]
+        return self._packs
+
+    def read_object(self, sha: str) -> Tuple[str, bytes]:
+        """(type, content) of an object from the loose store or a pack"""
+        loose = _read(os.path.join(self.common_dir, "objects", sha[:2], sha[2:]))
+        if loose is not None:
+            raw = zlib.decompress(loose)
+            header, _, body = raw.partition(b"\0")
+            return header.split(b" ", 1)[0].decode(), body
+
+        binary_sha = bytes.fromhex(sha)
+        for pack in self.packs:
+            offset = pack.offset_of(binary_sha)
+            if offset is not None:
+                return pack.read_at(offset, self)
+        raise GitError(f"Object not found: {sha}")
+
+    def commit(self, sha: str) -> Tuple[int, List[str]]:
+        """(committer timestamp, parent ids) of a commit"""
+        if sha not in self._commits:
+            self._commits[sha] = self._parse_commit(sha)
+        return self._commits[sha]
+
+    def _parse_commit(self, sha: str) -> Tuple[int, List[str]]:
+        kind, body = self.read_object(sha)
+        if kind != "commit":
+            raise GitError(f"{sha} is a {kind}, not a commit")
+        timestamp = 0
+        parents = []
+        for line in body.split(b"\n"):
+            if not line:
+                break
+            if line.startswith(b"parent "):
+                parents.append(line[7:].decode())
+            elif line.startswith(b"committer "):
+                timestamp = int(line.rsplit(b" ", 2)[1])
+        return timestamp, parents
+
+    def ahead_behind(self, local: str, remote: str) -> Optional[Tuple[int, int]]:
+        """Commits only reachable from local and only from remote, or None if
+        the histories are too large to compare within MAX_WALK commits"""
+        if local == remote:
+            return 0, 0
+        flags = {local: 1, remote: 2}
+        queue = []
+        for sha in (local, remote):
+            try:
+                timestamp, _ = self.commit(sha)
+            except GitError:
+                # Shallow or pruned history
+                timestamp = 0
+            heapq.heappush(queue, (-timestamp, sha))
+
+        visited = 0
+        # Newest first; stop once everything still queued is reachable from both
+        while queue and any(flags[sha] != 3 for _, sha in queue):
+            _, sha = heapq.heappop(queue)
+            visited += 1
+            if visited > MAX_WALK:
+                return None
+            try:
+                _, parents = self.commit(sha)
+            except GitError:
+                parents = []
+            for parent in parents:
+                old = flags.get(parent, 0)
+                new = old | flags[sha]
+                if new != old:
+                    flags[parent] = new
+                    try:
+                        timestamp, _ = self.commit(parent)
+                    except GitError:
+                        timestamp = 0
+                    heapq.heappush(queue, (-timestamp, parent))
+
+        ahead = sum(1 for flag in flags.values() if flag == 1)
+        behind = sum(1 for flag in flags.values() if flag == 2)
+        return ahead, behind
+
+    # -- revisions and trees -----------------------------------------------
+
+    def _expand(self, prefix: str) -> Optional[str]:
+        """Full object id for an abbreviated one; GitError if ambiguous"""
+        prefix = prefix.lower()
+        found = set()
+        try:
+            names = os.listdir(os.path.join(self.common_dir, "objects", prefix[:2]))
+        except OSError:
+            names = []
+        found.update(prefix[:2] + name for name in names if name.startswith(prefix[2:]))
+
+        low = bytes.fromhex(prefix[:len(prefix) // 2 * 2])
+        for pack in self.packs:
+            index = bisect_left(pack.hashes, low)
+            while index < len(pack.hashes) and pack.hashes[index].hex().startswith(prefix):
+                found.add(pack.hashes[index].hex())
+                index += 1
+        if len(found) > 1:
+            raise GitError(f"Ambiguous object id: {prefix}")
+        return found.pop() if found else None
+
+    def peel(self, sha: str) -> str:
+        """The commit an object id or (nested) annotated tag points to"""
+        for _ in range(10):
+            kind, body = self.read_object(sha)
+            if kind == "commit":
+                return sha
+            if kind != "tag" or not body.startswith(b"object "):
+                raise GitError(f"{sha} is a {kind}, not a commit")
+            sha = body[7:body.index(b"\n")].decode()
+        raise GitError(f"Tag chain too long at {sha}")
+
+    def resolve_revision(self, revision: str) -> str:
+        """Commit id for a revision: an object id (possibly abbreviated), a ref
+        name looked up like git does (tags, branches, remotes), followed by
+        any number of ~N and ^N suffixes"""
+        match = re.match(r"^(.+?)((?:[~^][0-9]*)*)$", revision.strip())
+        if match is None:
+            raise GitError(f"Invalid revision: {revision!r}")
+        name, suffixes = match.groups()
+
+        sha = None
+        # Only pseudo-refs (HEAD, FETCH_HEAD, ...) are looked up by their bare
+        # name, so other files of the git directory are never read as refs
+        candidates = [f"refs/{name}", f"refs/tags/{name}", f"refs/heads/{name}",
+                      f"refs/remotes/{name}", f"refs/remotes/{name}/HEAD"]
+        if PSEUDO_REF.fullmatch(name):
+            candidates.insert(0, name)
+        if ".." not in name and not os.path.isabs(name):
+            for ref in candidates:
+                sha = self.resolve(ref)
+                if sha is not None:
+                    break
+        if sha is None and re.fullmatch(r"[0-9a-fA-F]{4,64}", name):
+            sha = self._expand(name)
+        if sha is None:
+            raise GitError(f"Unknown revision: {name}")
+        sha = self.peel(sha)
+
+        for operator, count in re.findall(r"([~^])([0-9]*)", suffixes):
+            count = int(count) if count else 1
+            if operator == "~":
+                for _ in range(count):
+                    parents = self.commit(sha)[1]
+                    if not parents:
+                        raise GitError(f"{revision}: history ends at {sha[:12]}")
+                    sha = parents[0]
+            elif count:
+                parents = self.commit(sha)[1]
+                if len(parents) < count:
+                    raise GitError(f"{revision}: {sha[:12]} has no parent {count}")
+                sha = parents[count - 1]
+        return sha
+
+    def commit_tree(self, sha: str) -> str:
+        """Root tree id of a commit"""
+        kind, body = self.read_object(sha)
+        if kind != "commit" or not body.startswith(b"tree "):
+            raise GitError(f"{sha} is a {kind}, not a commit")
+        return body[5:body.index(b"\n")].decode()
+
+    def tree(self, sha: str) -> Dict[str, Tuple[int, str]]:
+        """name -> (mode, object id) of a tree; trees are immutable, so kept"""
+        entries = self._trees.get(sha)
+        if entries is None:
+            kind, body = self.read_object(sha)
+            if kind != "tree":
+                raise GitError(f"{sha} is a {kind}, not a tree")
+            entries = {}
+            position = 0
+            length = self.hash_length
+            while position < len(body):
+                space = body.index(b" ", position)
+                nul = body.index(b"\0", space)
+                entries[body[space + 1:nul].decode("utf-8", "surrogateescape")] = (
+                    int(body[position:space], 8), body[nul + 1:nul + 1 + length].hex())
+                position = nul + 1 + length
+            self._trees[sha] = entries
+        return entries
+
+    def tree_files(self, sha: str, prefix: str = "") -> List[str]:
+        """Paths of every file below a tree"""
+        files = []
+        for name, (mode, entry) in self.tree(sha).items():
+            if mode == TREE:
+                files.extend(self.tree_files(entry, f"{prefix}{name}/"))
+            else:
+                files.append(prefix + name)
+        return files
+
+    def changed_files(self, old: Optional[str], new: Optional[str]) -> List[str]:
+        """Paths that differ between two commits; shared subtrees are not read"""
+        changed: List[str] = []
+        self._diff_trees(old and self.commit_tree(old), new and self.commit_tree(new), "",
+                         changed)
+        return sorted(changed)
+
+    def _diff_trees(self, old: Optional[str], new: Optional[str], prefix: str,
+                    changed: List[str]):
+        if old == new:
+            return
+        old_entries = self.tree(old) if old else {}
+        new_entries = self.tree(new) if new else {}
+        for name in old_entries.keys() | new_entries.keys():
+            before, after = old_entries.get(name), new_entries.get(name)
+            if before == after:
+                continue
+            path = prefix + name
+            old_tree = before[1] if before is not None and before[0] == TREE else None
+            new_tree = after[1] if after is not None and after[0] == TREE else None
+            if old_tree or new_tree:
+                self._diff_trees(old_tree, new_tree, path + "/", changed)
+            if (before is not None and not old_tree) or (after is not None and not new_tree):
+                changed.append(path)
+
+    # -- index -------------------------------------------------------------
+
+    def index_entries(self) -> List[Tuple[str, int, int, int, int, bytes]]:
+        """(path, mode, mtime_s, mtime_ns, size, object id) for each tracked file"""
+        data = _read(os.path.join(self.git_dir, "index"))
+        if data is None:
+            return []
+        if data[:4] != b"DIRC":
+            raise GitError("Invalid index signature")
+        version, count = struct.unpack(">II", data[4:12])
+        if version not in (2, 3, 4):
+            raise GitError(f"Unsupported index version {version}")
+
+        hash_length = self.hash_length
+        entries = []
+        offset = 12
+        previous = b""
+        fixed = struct.Struct(f">10I{hash_length}sH")
+        for _ in range(count):
+            (_, _, mtime_s, mtime_ns, _, _, mode, _, _, size,
+             sha, flags) = fixed.unpack_from(data, offset)
+            position = offset + fixed.size
+            extended = 0
+            if flags & EXTENDED and version >= 3:
+                extended = struct.unpack_from(">H", data, position)[0]
+                position += 2
+
+            if version == 4:
+                # Path compressed against the previous entry's path
+                strip, position = self._index_varint(data, position)
+                end = data.index(b"\0", position)
+                path = previous[:len(previous) - strip] + data[position:end]
+                offset = end + 1
+            else:
+                end = data.index(b"\0", position)
+                path = data[position:end]
+                # Entries are NUL-padded to a multiple of eight bytes
+                offset += ((end - offset) // 8 + 1) * 8
+            previous = path
+
+            if flags & ASSUME_VALID or extended & SKIP_WORKTREE or mode == GITLINK:
+                continue
+            entries.append((path.decode("utf-8", "surrogateescape"), mode, mtime_s,
+                            mtime_ns, size, sha))
+        _check_extensions(data, offset, hash_length)
+        return entries
+
+    @staticmethod
+    def _index_varint(data: bytes, offset: int) -> Tuple[int, int]:
+        """Offset-encoded integer used by index version 4"""
+        byte = data[offset]
+        offset += 1
+        value = byte & 0x7F
+        while byte & 0x80:
+            byte = data[offset]
+            offset += 1
+            value = ((value + 1) << 7) | (byte & 0x7F)
+        return value, offset
+
+    def _blob_id(self, content: bytes) -> bytes:
+        digest = hashlib.sha256 if self.hash_length == 32 else hashlib.sha1
+        return digest(b"blob %d\0" % len(content) + content).digest()
+
+    def modified_files(self) -> List[str]:
+        """Tracked files whose working tree copy differs from the index.
+
+        Stat data decides where it can; files whose size matches but whose
+        timestamps do not (or are too recent to trust) are hashed.
+        """
+        try:
+            index_mtime = os.stat(os.path.join(self.git_dir, "index")).st_mtime_ns
+        except OSError:
+            return []
+
+        modified = []
+        for path, mode, mtime_s, mtime_ns, size, sha in self.index_entries():
+            full_path = os.path.join(self.worktree, path)
+            try:
+                st = os.lstat(full_path)
+            except OSError:
+                modified.append(path)
+                continue
+            profiling.count("stats")
+
+            # Executable bit changes count for regular files (core.fileMode)
+            exec_changed = (stat.S_ISREG(mode) and stat.S_ISREG(st.st_mode)
+                            and (st.st_mode & 0o100) != (mode & 0o100))
+            if (st.st_size & 0xFFFFFFFF) != size or exec_changed:
+                modified.append(path)
+                continue
+            if (st.st_mtime_ns // 1_000_000_000 == mtime_s
+                    and st.st_mtime_ns % 1_000_000_000 == mtime_ns
+                    and st.st_mtime_ns < index_mtime):
+                continue
+
+            # Same size, different or racy timestamp: compare content
+            try:
+                if os.path.islink(full_path):
+                    content = os.fsencode(os.readlink(full_path))
+                else:
+                    content = _read(full_path) or b""
+            except OSError:
+                modified.append(path)
+                continue
+            if self._blob_id(content) != sha:
+                modified.append(path)
+        return modified
+
+    # -- staged changes ----------------------------------------------------
+
+    def staged_files(self) -> List[str]:
+        """Paths whose staged content differs from HEAD (`git diff --cached --name-only`).
+
+        Directories whose cache-tree id (the index's TREE extension) equals
+        HEAD's tree are stepped over without reading either side, so only
+        the directories holding staged changes are compared.
+        """
+        _, commit = self.head()
+        root = self.commit_tree(commit) if commit else None
+        data = _read(os.path.join(self.git_dir, "index"))
+        if data is None:
+            return sorted(self.tree_files(root)) if root else []
+
+        cache_tree = self._cache_tree(data)
+        if root is not None and cache_tree.get(b"", (0, None))[1] == root:
+            return []
+        changed: set = set()
+        cursor = _IndexCursor(data, self.hash_length)
+        self._compare_staged(cursor, cache_tree, b"", root, changed)
+        # The cursor has moved past every entry, onto the extensions
+        _check_extensions(data, cursor.offset, self.hash_length)
+        return sorted(changed)
+
+    def _compare_staged(self, cursor: _IndexCursor, cache_tree: Dict[bytes, Tuple[int, str]],
+                        prefix: bytes, tree: Optional[str], changed: set):
+        """Compare the index entries under prefix with a HEAD tree"""
+        head = self.tree(tree) if tree else {}
+        seen = set()
+        decode = prefix.decode("utf-8", "surrogateescape")
+        while True:
+            entry = cursor.current()
+            if entry is None or not entry[0].startswith(prefix):
+                break
+            path, mode, sha = entry
+            name_bytes, slash, _ = path[len(prefix):].partition(b"/")
+            name = name_bytes.decode("utf-8", "surrogateescape")
+            seen.add(name)
+            head_entry = head.get(name)
+            if not slash:
+                if head_entry != (mode, sha):
+                    changed.add(decode + name)
+                if head_entry is not None and head_entry[0] == TREE:
+                    # A directory replaced by a file
+                    changed.update(self.tree_files(head_entry[1], f"{decode}{name}/"))
+                cursor.advance()
+                continue
+
+            subtree = head_entry[1] if head_entry is not None and head_entry[0] == TREE else None
+            if head_entry is not None and subtree is None:
+                # A file replaced by a directory
+                changed.add(decode + name)
+            cached = cache_tree.get(prefix + name_bytes)
+            if cached is not None and subtree is not None and cached[1] == subtree:
+                cursor.advance(cached[0])
+            else:
+                self._compare_staged(cursor, cache_tree, prefix + name_bytes + b"/", subtree,
+                                     changed)
+
+        # Removed from the index
+        for name, (mode, sha) in head.items():
+            if name not in seen:
+                if mode == TREE:
+                    changed.update(self.tree_files(sha, f"{decode}{name}/"))
+                else:
+                    changed.add(decode + name)
+
+    def _cache_tree(self, data: bytes) -> Dict[bytes, Tuple[int, str]]:
+        """Directory -> (entry count, tree id) for the valid cache-tree entries.
+
+        Extensions follow the variable-length entries, so they are found
+        from the end: the last "TREE" whose chain of extensions ends exactly
+        at the index checksum.
+        """
+        end = len(data) - self.hash_length
+        position = data.rfind(b"TREE", 12, end)
+        while position != -1:
+            chain = position
+            while chain + 8 <= end and data[chain:chain + 4].isalpha():
+                chain += 8 + struct.unpack_from(">I", data, chain + 4)[0]
+            if chain == end:
+                break
+            position = data.rfind(b"TREE", 12, position)
+        if position == -1:
+            return {}
+
+        # Entries are in pre-order, each followed by its subtrees; invalidated
+        # entries (count -1) have no tree id
+        length = self.hash_length
+        entry = re.compile(rb"([^\0]*)\0(?:-1 ([0-9]+)\n|([0-9]+) ([0-9]+)\n(.{%d}))" % length,
+                           re.S)
+        trees: Dict[bytes, Tuple[int, str]] = {}
+        position += 8
+        parents: List[List] = [[b"", 1]]
+        while parents:
+            parent = parents[-1]
+            if not parent[1]:
+                parents.pop()
+                continue
+            parent[1] -= 1
+            match = entry.match(data, position)
+            if match is None:
+                raise GitError(f"Invalid cache tree at byte {position}")
+            name, invalid_subtrees, count, subtrees, sha = match.groups()
+            path = parent[0] + name
+            if count is not None:
+                trees[path] = (int(count), sha.hex())
+            position = match.end()
+            parents.append([path + b"/" if path else b"", int(subtrees or invalid_subtrees)])
+        return trees
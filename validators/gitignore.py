@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Gitignore Matcher
+
+Compiled implementation of git's ignore rules: comments and escapes,
+negation with `!`, anchoring by a leading or inner `/`, directory-only
+patterns with a trailing `/`, and wildmatch globs (`*`, `?`, `[...]`,
+`**`). Each .gitignore compiles into one regular expression whose
+alternatives are ordered last-rule-first, so a single fullmatch finds the
+deciding rule. Compiled files are cached by content and a matcher caches
+them per directory, so tree walks can skip ignored subtrees such as
+node_modules/ or .venv/ without looking inside them.
+"""
+
+import os
+import re
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+
+class IgnoreRule:
+    """One parsed .gitignore pattern"""
+
+    __slots__ = ("pattern", "negated", "dir_only", "regex")
+
+    def __init__(self, pattern: str, negated: bool, dir_only: bool, regex: str):
+        self.pattern = pattern
+        self.negated = negated
+        self.dir_only = dir_only
+        self.regex = regex
+
+    def __repr__(self) -> str:
+        return f"IgnoreRule({self.pattern!r})"
+
+
+def _translate_bracket(pattern: str, start: int) -> Tuple[Optional[str], int]:
+    """Translate a [...] class starting at pattern[start]; None if unterminated"""
+    i = start + 1
+    negated = i < len(pattern) and pattern[i] in "!^"
+    if negated:
+        i += 1
+    members = []
+    first = True
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "]" and not first:
+            body = "".join(members)
+            # Classes never match the path separator
+            return ("[^/" + body + "]" if negated else "[" + body + "]"), i + 1
+        if c == "\\" and i + 1 < len(pattern):
+            i += 1
+            c = pattern[i]
+        if c == "-" and members and i + 1 < len(pattern) and pattern[i + 1] != "]":
+            members.append("-")
+        else:
+            members.append(re.escape(c) if c in "\\]^-[" else c)
+        first = False
+        i += 1
+    return None, start + 1
+
+
+def translate(pattern: str) -> str:
+    """Regex body for a wildmatch pattern with git's pathname semantics"""
+    out: List[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i):
+                end = i + 2
+                at_start = i == 0 or pattern[i - 1] == "/"
+                at_end = end == n or pattern[end] == "/"
+                if at_start and at_end:
+                    if end == n:
+                        # Trailing "/**" (or a lone "**"): everything inside
+                        out.append(".*")
+                        i = end
+                    else:
+                        # "**/": zero or more leading directories
+                        out.append("(?:.*/)?")
+                        i = end + 1
+                    continue
+                out.append("[^/]*")
+                i = end
+                while i < n and pattern[i] == "*":
+                    i += 1
+                continue
+            out.append("[^/]*")
+            i += 1
+        elif c == "?":
+            out.append("[^/]")
+            i += 1
+        elif c == "[":
+            translated, i = _translate_bracket(pattern, i)
+            out.append(translated if translated is not None else re.escape("["))
+        elif c == "\\" and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return "".join(out)
+
+
+def parse_line(line: str) -> Optional[IgnoreRule]:
+    """Parse one .gitignore line, or None for blanks and comments"""
+    line = line.rstrip("\r\n")
+    if not line or line.startswith("#"):
+        return None
+
+    # Trailing spaces are ignored unless escaped with a backslash
+    while line.endswith(" ") and not line.endswith("\\ "):
+        line = line[:-1]
+
+    negated = line.startswith("!")
+    if negated:
+        line = line[1:]
+
+    dir_only = line.endswith("/")
+    if dir_only:
+        line = line[:-1]
+    if not line:
+        return None
+
+    # A slash anywhere but the end anchors the pattern to the .gitignore's directory
+    anchored = "/" in line
+    body = translate(line[1:] if line.startswith("/") else line)
+    regex = body if anchored else "(?:.*/)?" + body
+    return IgnoreRule(line, negated, dir_only, regex)
+
+
+class IgnoreRules:
+    """All rules of one .gitignore, compiled for last-match-wins lookup"""
+
+    __slots__ = ("rules", "_dir_regex", "_file_regex")
+
+    def __init__(self, rules: List[IgnoreRule]):
+        self.rules = rules
+        self._dir_regex = self._compile(range(len(rules)))
+        self._file_regex = self._compile(i for i, rule in enumerate(rules) if not rule.dir_only)
+
+    def _compile(self, indices):
+        # Later rules win, so they are tried first
+        alternatives = [f"(?P<r{i}>{self.rules[i].regex})" for i in sorted(indices, reverse=True)]
+        return re.compile("|".join(alternatives)) if alternatives else None
+
+    def match(self, relative_path: str, is_dir: bool) -> Optional[bool]:
+        """True if ignored, False if re-included by a `!` rule, None if no rule applies"""
+        regex = self._dir_regex if is_dir else self._file_regex
+        if regex is None:
+            return None
+        match = regex.fullmatch(relative_path)
+        if match is None:
+            return None
+        return not self.rules[int(match.lastgroup[1:])].negated
+
+
+@lru_cache(maxsize=1024)
+def compile_rules(content: str) -> IgnoreRules:
+    """Compile .gitignore content; identical files share one compiled form"""
+    rules = [rule for rule in map(parse_line, content.splitlines()) if rule is not None]
+    return IgnoreRules(rules)
+
+
+class GitignoreMatcher:
+    """Applies a project's root and nested .gitignore files"""
+
+    def __init__(self, root, read: Optional[Callable[[str], Optional[str]]] = None):
+        self.root = str(root)
+        # read(".gitignore" path relative to root) -> content, or None if absent
+        self._read = read or self._read_file
+        self._rules: Dict[str, Optional[IgnoreRules]] = {}
+
+    def _read_file(self, relative_path: str) -> Optional[str]:
+        try:
+            with open(os.path.join(self.root, relative_path), encoding="utf-8",
+                      errors="replace") as f:
+                return f.read()
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+            return None
+
+    def rules_for(self, relative_dir: str) -> Optional[IgnoreRules]:
+        """Compiled .gitignore of a directory, loaded once"""
+        if relative_dir not in self._rules:
+            path = f"{relative_dir}/.gitignore" if relative_dir else ".gitignore"
+            content = self._read(path)
+            self._rules[relative_dir] = compile_rules(content) if content else None
+        return self._rules[relative_dir]
+
+    def mark_absent(self, relative_dir: str):
+        """Record that a directory has no .gitignore, e.g. from a listing"""
+        self._rules.setdefault(relative_dir, None)
+
+    def match(self, relative_path: str, is_dir: bool = False) -> bool:
+        """Whether the path itself matches, assuming its parents are not ignored.
+
+        The deepest .gitignore with a matching rule decides.
+        """
+        parts = relative_path.strip("/").split("/")
+        for depth in range(len(parts) - 1, -1, -1):
+            rules = self.rules_for("/".join(parts[:depth]))
+            if rules is not None:
+                verdict = rules.match("/".join(parts[depth:]), is_dir)
+                if verdict is not None:
+                    return verdict
+        return False
+
+    def is_ignored(self, relative_path: str, is_dir: bool = False) -> bool:
+        """Full git semantics: a path inside an ignored directory is ignored"""
+        parts = relative_path.strip("/").split("/")
+        for end in range(1, len(parts)):
+            if self.match("/".join(parts[:end]), is_dir=True):
+                return True
+        return self.match(relative_path, is_dir)
+
+    def walk(self, relative_dir: str = "") -> Iterator[Tuple[str, os.DirEntry]]:
+        """Yield (relative path, entry) for every non-ignored path below a directory.
+
+        Ignored directories and .git/ are pruned without being listed.
+        """
+        pending = [relative_dir.strip("/")]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(os.path.join(self.root, current)) as entries:
+                    entries = list(entries)
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.name == ".git":
+                    continue
+                path = f"{current}/{entry.name}" if current else entry.name
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    is_dir = False
+                if self.match(path, is_dir):
+                    continue
+                yield path, entry
+                if is_dir:
+                    pending.append(path)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Incremental Audit
+
+Re-audits a project from its staged changes, for pre-commit hooks. Every
+audit stores each check's outcome in the audit cache, together with an
+index from project paths to the checks that depend on them (built from
+the validators' check_dependencies()). The next audit reads the paths
+staged in .git, plus those staged or committed since the stored audit,
+re-runs only the checks they map to and takes every other outcome from
+the stored audit. Checks over the whole tree re-run when a file with a
+registered name or a .gitignore changes. The git state and uv
+installation checks, which do not depend on particular project files,
+always run; the git state leaves out unstaged edits, which a partial
+commit expects.
+
+The existence and type of every indexed path is compared as well, which
+covers untracked paths such as .venv/; other unstaged edits are seen
+once they are staged. A stored audit is used only while both standards
+files, the project type and its Python-ness are unchanged; otherwise
+every check runs.
+"""
+
+import os
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from check_results import CheckResults
+from fleet_auditor import audit_one, is_python_project
+from git_metadata import READ_ERRORS
+from project_snapshot import ProjectSnapshot
+from ref_snapshot import find_repository
+from structure_validator import AUDIT_CHECKS
+from tree_walker import registered_names
+from uv_validator import UV_CHECKS
+import profiling
+
+# Bumped whenever the stored audit changes shape
+INCREMENTAL_FORMAT = "1"
+
+# Checks over the whole tree, driven by file names rather than paths
+TREE_CHECKS = {"structure": ("nested_forbidden_files",), "uv": ("nested_legacy_files",)}
+
+# Checks of the machine or the .git directory rather than of project files; always run
+ALWAYS_RUN = {"structure": ("git_state",), "uv": ("uv_installed",)}
+
+
+def _cache_key(project_path: str) -> str:
+    return os.path.abspath(project_path) + "#incremental"
+
+
+def dependency_index(validators, project_type: str, python: bool) -> Dict[str, Dict[str, List[str]]]:
+    """Checks ("structure:agents_md") depending on each project path, and on each file name"""
+    structure_validator, uv_validator = validators
+    paths: Dict[str, List[str]] = {}
+    names: Dict[str, List[str]] = {}
+
+    def add(index: Dict[str, List[str]], keys: Iterable[str], check: str):
+        for key in keys:
+            entry = index.setdefault(key.rstrip("/"), [])
+            if check not in entry:
+                entry.append(check)
+
+    groups = [("structure", AUDIT_CHECKS)] + ([("uv", UV_CHECKS)] if python else [])
+    for validator, checks in groups:
+        for check in checks:
+            key = f"{validator}:{check}"
+            if check in TREE_CHECKS[validator]:
+                # A .gitignore anywhere can prune or expose a directory
+                add(names, sorted(registered_names()) + [".gitignore"], key)
+            elif check not in ALWAYS_RUN[validator]:
+                if validator == "structure":
+                    dependencies = structure_validator.check_dependencies(
+                        check, project_type if check == "project_type" else None)
+                else:
+                    dependencies = uv_validator.check_dependencies(check)
+                add(paths, dependencies[0] + dependencies[1], key)
+    return {"paths": paths, "names": names}
+
+
+def affected_checks(index: Dict[str, Dict[str, List[str]]], changed: Iterable[str]) -> Set[str]:
+    """Checks depending on any changed path, its directories or its file name"""
+    affected: Set[str] = set()
+    for path in changed:
+        parts = path.split("/")
+        for depth in range(1, len(parts) + 1):
+            affected.update(index["paths"].get("/".join(parts[:depth]), ()))
+        affected.update(index["names"].get(parts[-1], ()))
+    return affected
+
+
+def path_kinds(snapshot: ProjectSnapshot, paths: Iterable[str]) -> Dict[str, str]:
+    """Existence and type of each path, as the snapshot fingerprints it"""
+    return {path: snapshot.fingerprint([path]) for path in paths}
+
+
+def project_paths(paths: Iterable[str], prefix: str) -> Set[str]:
+    """Repository paths inside the project directory prefix, relative to it"""
+    if not prefix:
+        return set(paths)
+    start = prefix + "/"
+    return {path[len(start):] for path in paths if path.startswith(start)}
+
+
+def audit_staged(project_path: str, validators,
+                 on_check: Optional[Callable[[str, str, CheckResults], None]] = None
+                 ) -> Dict[str, Any]:
+    """Audit a project, re-running only the checks its staged changes affect.
+
+    The result is that of fleet_auditor.audit_one(), plus "incremental":
+    the changed paths and re-run checks, or the reason for a full audit.
+    on_check is passed on to audit_one().
+    """
+    structure_validator, uv_validator = validators
+    cache = structure_validator.cache
+    if cache is None:
+        raise ValueError("Incremental audits keep their last result in the audit cache")
+
+    repository, prefix = find_repository(project_path)
+    commit = repository.head()[1]
+    with profiling.span("incremental:staged"):
+        staged = project_paths(repository.staged_files(), prefix)
+    snapshot = ProjectSnapshot(project_path)
+    project_type = structure_validator.detect_project_type(snapshot)
+    python = is_python_project(snapshot)
+    stamp = (f"{INCREMENTAL_FORMAT}:{structure_validator.standards_digest}:"
+             f"{uv_validator.standards_digest}")
+    stored = cache.get_document(_cache_key(project_path), stamp)
+
+    reason = None
+    changed: Set[str] = set()
+    if stored is None:
+        reason = "no stored audit for these standards"
+    elif (stored["project_type"], stored["python"]) != (project_type, python):
+        reason = "project type changed"
+    else:
+        # Paths staged for the stored audit may since have been committed or dropped
+        changed = staged | set(stored["staged"])
+        try:
+            if stored["commit"] != commit:
+                changed.update(project_paths(
+                    repository.changed_files(stored["commit"], commit), prefix))
+        except READ_ERRORS:
+            reason = "stored commit unreadable"
+
+    reuse: Dict[str, Dict[str, CheckResults]] = {"structure": {}, "uv": {}}
+    if reason is None:
+        index = stored["index"]
+        # Untracked paths only show up as a changed existence or type
+        kinds = path_kinds(snapshot, index["paths"])
+        changed.update(path for path, kind in kinds.items() if stored["kinds"].get(path) != kind)
+
+        rerun = affected_checks(index, changed)
+        for validator, outcomes in stored["outcomes"].items():
+            for check, outcome in outcomes.items():
+                if (f"{validator}:{check}" not in rerun
+                        and check not in ALWAYS_RUN[validator]):
+                    reuse[validator][check] = CheckResults.from_dict(outcome)
+        incremental = {"full": False, "changed": sorted(changed), "rerun": sorted(rerun)}
+    else:
+        index = dependency_index(validators, project_type, python)
+        kinds = path_kinds(snapshot, index["paths"])
+        incremental = {"full": True, "reason": reason}
+
+    # Unstaged edits are normal while committing part of a change, and looking
+    # for them would stat every tracked file; only the rest of the git state runs
+    with profiling.span("structure:git_state"):
+        reuse["structure"]["git_state"] = structure_validator.validate_git_state(
+            snapshot, worktree=False)
+
+    outcomes: Dict[str, Dict[str, CheckResults]] = {"structure": {}, "uv": {}}
+    result = audit_one(project_path, validators, snapshot, reuse, outcomes, on_check)
+
+    if "error" not in result["structure"]:
+        cache.put_document(_cache_key(project_path), stamp, {
+            "commit": commit,
+            "staged": sorted(staged),
+            "project_type": project_type,
+            "python": python,
+            "index": index,
+            "kinds": kinds,
+            "outcomes": {validator: {check: outcome.to_dict()
+                                     for check, outcome in checks.items()}
+                         for validator, checks in outcomes.items()},
+        })
+    cache.commit()
+    result["incremental"] = incremental
+    return result
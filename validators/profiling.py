@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Audit Profiling
+
+Optional instrumentation for the validators. Checks, document parses,
+content scans and toolchain probes run inside named spans; while a
+Profiler is active each span accumulates call counts, wall time and the
+bytes read, stat calls, directory listings, subprocess spawns and cache
+hits recorded inside it. Like wall time, counters are inclusive: they
+also count towards every enclosing span. Hooks subscribe to finished
+spans for external tracing.
+
+When no profiler is active, span() returns a shared no-op context and
+the counters return after a single global check.
+"""
+
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, List, Optional
+
+COUNTERS = ("bytes_read", "stats", "listings", "spawns", "cache_hits")
+
+# Hook signature: hook(span_name, {"wall_ns": ..., "bytes_read": ..., ...})
+Hook = Callable[[str, Dict[str, int]], None]
+
+_NULL_SPAN = nullcontext()
+
+# The active Profiler, or None when profiling is off
+_profiler: Optional["Profiler"] = None
+
+
+class SpanStats:
+    """Accumulated measurements for one span name"""
+
+    __slots__ = ("calls", "wall_ns") + COUNTERS
+
+    def __init__(self):
+        self.calls = 0
+        self.wall_ns = 0
+        self.bytes_read = 0
+        self.stats = 0
+        self.listings = 0
+        self.spawns = 0
+        self.cache_hits = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def merge(self, data: Dict[str, int]):
+        for slot in self.__slots__:
+            setattr(self, slot, getattr(self, slot) + data.get(slot, 0))
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "started", "counts")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.counts = dict.fromkeys(COUNTERS, 0)
+
+    def __enter__(self):
+        self.profiler._stack().append(self)
+        self.started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        wall_ns = time.perf_counter_ns() - self.started
+        self.profiler._stack().pop()
+        self.profiler._finish(self.name, wall_ns, self.counts)
+        return False
+
+
+class Profiler:
+    """Collects per-span statistics and notifies hooks"""
+
+    def __init__(self):
+        self.spans: Dict[str, SpanStats] = {}
+        self.hooks: List[Hook] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> List[_Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def span(self, name: str) -> _Span:
+        return _Span(self, name)
+
+    def count(self, counter: str, amount: int = 1):
+        """Attribute a counter to every open span, so span figures are inclusive"""
+        stack = self._stack()
+        if stack:
+            for open_span in stack:
+                open_span.counts[counter] += amount
+        else:
+            self._finish("(outside checks)", 0, {counter: amount}, calls=0)
+
+    def _finish(self, name: str, wall_ns: int, counts: Dict[str, int], calls: int = 1):
+        with self._lock:
+            stats = self.spans.get(name)
+            if stats is None:
+                stats = self.spans[name] = SpanStats()
+            stats.calls += calls
+            stats.wall_ns += wall_ns
+            for counter, amount in counts.items():
+                setattr(stats, counter, getattr(stats, counter) + amount)
+        if self.hooks:
+            event = dict(counts, wall_ns=wall_ns)
+            for hook in self.hooks:
+                hook(name, event)
+
+    def merge(self, data: Dict[str, Dict[str, int]]):
+        """Fold in a snapshot from another process (see to_dict)"""
+        with self._lock:
+            for name, values in data.items():
+                self.spans.setdefault(name, SpanStats()).merge(values)
+
+    def reset(self):
+        with self._lock:
+            self.spans.clear()
+
+    def to_dict(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {name: stats.to_dict() for name, stats in self.spans.items()}
+
+    def report(self) -> List[Dict[str, Any]]:
+        """Spans sorted by total wall time, slowest first"""
+        rows = [dict(stats, span=name) for name, stats in self.to_dict().items()]
+        rows.sort(key=lambda row: row["wall_ns"], reverse=True)
+        return rows
+
+    def format_table(self) -> List[str]:
+        lines = [f"{'span':32} {'calls':>7} {'total ms':>10} {'avg us':>9} "
+                 f"{'bytes':>11} {'stats':>7} {'lists':>6} {'spawns':>6} {'hits':>6}"]
+        for row in self.report():
+            calls = row["calls"]
+            average_us = row["wall_ns"] / calls / 1000 if calls else 0.0
+            lines.append(f"{row['span']:32} {calls:7d} {row['wall_ns'] / 1e6:10.2f} "
+                         f"{average_us:9.1f} {row['bytes_read']:11d} {row['stats']:7d} "
+                         f"{row['listings']:6d} {row['spawns']:6d} {row['cache_hits']:6d}")
+        return lines
+
+
+def enable() -> Profiler:
+    """Start profiling in this process, returning the active Profiler"""
+    global _profiler
+    if _profiler is None:
+        _profiler = Profiler()
+    return _profiler
+
+
+def disable():
+    global _profiler
+    _profiler = None
+
+
+def active() -> Optional[Profiler]:
+    return _profiler
+
+
+def add_hook(hook: Hook) -> Profiler:
+    """Subscribe to finished spans; enables profiling if it is off"""
+    profiler = enable()
+    profiler.hooks.append(hook)
+    return profiler
+
+
+def remove_hook(hook: Hook):
+    if _profiler is not None and hook in _profiler.hooks:
+        _profiler.hooks.remove(hook)
+
+
+def span(name: str):
+    """Context manager measuring a named span (no-op when profiling is off)"""
+    if _profiler is None:
+        return _NULL_SPAN
+    return _profiler.span(name)
+
+
+def count(counter: str, amount: int = 1):
+    """Record bytes_read, stats, listings, spawns or cache_hits against the open spans"""
+    if _profiler is not None:
+        _profiler.count(counter, amount)
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Project Snapshot
+
+A point-in-time view of a project root shared by every validator. The
+root is listed with a single os.scandir() and the few files whose
+content matters are read lazily, at most once, so the number of
+filesystem calls per project does not grow with the number of rules.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+from content_scanner import ContentScanner, ScanResult, scanner_for
+from documents import load_document
+from tree_walker import WalkResult, registered_names, walk_tree
+import profiling
+
+
+class ProjectSnapshot:
+    """Single-pass filesystem view of a project root"""
+
+    # Whether fingerprint() identifies content exactly (object ids, not mtimes)
+    content_addressed = False
+
+    def __init__(self, project_path: Union[str, Path]):
+        self.path = Path(project_path)
+        self._entries: Dict[str, os.DirEntry] = {}
+        self._nested: Dict[str, Optional[os.stat_result]] = {}
+        self._text: Dict[str, str] = {}
+        self._bytes: Dict[str, bytes] = {}
+        self._scans: Dict[str, Tuple[ContentScanner, ScanResult]] = {}
+        self._documents: Dict[str, Tuple[Any, Optional[Exception]]] = {}
+        self._walk: Optional[Tuple[frozenset, WalkResult]] = None
+
+        with profiling.span("snapshot.scandir"):
+            profiling.count("listings")
+            try:
+                with os.scandir(self.path) as entries:
+                    for entry in entries:
+                        self._entries[entry.name] = entry
+                self.root_exists = True
+            except (FileNotFoundError, NotADirectoryError):
+                self.root_exists = False
+
+    @classmethod
+    def of(cls, project: Union[str, Path, "ProjectSnapshot"]) -> "ProjectSnapshot":
+        """Return project unchanged if it is already a snapshot"""
+        if isinstance(project, cls):
+            return project
+        return cls(project)
+
+    @staticmethod
+    def _normalize(relative_path: str) -> str:
+        return relative_path.strip("/")
+
+    def names(self):
+        """Names of all entries in the project root"""
+        return self._entries.keys()
+
+    def _nested_stat(self, relative_path: str) -> Optional[os.stat_result]:
+        # Paths below the root are not covered by the scandir pass; stat
+        # them on first use and remember the answer.
+        if relative_path not in self._nested:
+            profiling.count("stats")
+            try:
+                self._nested[relative_path] = os.stat(self.path / relative_path)
+            except OSError:
+                self._nested[relative_path] = None
+        return self._nested[relative_path]
+
+    def exists(self, relative_path: str) -> bool:
+        """Equivalent of (project / relative_path).exists()"""
+        name = self._normalize(relative_path)
+        if "/" in name:
+            return self._nested_stat(name) is not None
+
+        entry = self._entries.get(name)
+        if entry is None:
+            return False
+        if entry.is_symlink():
+            return os.path.exists(entry.path)
+        return True
+
+    def is_dir(self, relative_path: str) -> bool:
+        """Equivalent of (project / relative_path).is_dir()"""
+        name = self._normalize(relative_path)
+        if "/" in name:
+            st = self._nested_stat(name)
+            return st is not None and (st.st_mode & 0o170000) == 0o040000
+
+        entry = self._entries.get(name)
+        try:
+            return entry is not None and entry.is_dir()
+        except OSError:
+            return False
+
+    def is_file(self, relative_path: str) -> bool:
+        """Equivalent of (project / relative_path).is_file()"""
+        name = self._normalize(relative_path)
+        if "/" in name:
+            st = self._nested_stat(name)
+            return st is not None and (st.st_mode & 0o170000) == 0o100000
+
+        entry = self._entries.get(name)
+        try:
+            return entry is not None and entry.is_file()
+        except OSError:
+            return False
+
+    def _kind(self, name: str) -> str:
+        if self.is_dir(name):
+            return "d"
+        if self.is_file(name):
+            return "f"
+        return "o" if self.exists(name) else "-"
+
+    def _stat(self, name: str) -> Optional[os.stat_result]:
+        if "/" in name:
+            return self._nested_stat(name)
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        profiling.count("stats")
+        try:
+            return entry.stat()
+        except OSError:
+            return None
+
+    def stat(self, relative_path: str) -> Optional[os.stat_result]:
+        """stat() of a path, or None if it does not exist"""
+        return self._stat(self._normalize(relative_path))
+
+    def fingerprint(self, paths: Iterable[str], content_paths: Iterable[str] = ()) -> str:
+        """Describe the state of the given paths for cache validation.
+
+        Existence-only paths contribute their type, which the scandir pass
+        already knows; content paths also contribute mtime and size.
+        """
+        parts = []
+        for relative_path in paths:
+            name = self._normalize(relative_path)
+            parts.append(f"{name}={self._kind(name)}")
+        for relative_path in content_paths:
+            name = self._normalize(relative_path)
+            st = self._stat(name)
+            if st is None:
+                parts.append(f"{name}@-")
+            else:
+                parts.append(f"{name}@{st.st_mtime_ns}:{st.st_size}")
+        return "|".join(parts)
+
+    def read_bytes(self, relative_path: str) -> bytes:
+        """Read a file once and cache its raw content"""
+        name = self._normalize(relative_path)
+        if name not in self._bytes:
+            with open(self.path / name, "rb") as f:
+                self._bytes[name] = f.read()
+            profiling.count("bytes_read", len(self._bytes[name]))
+        return self._bytes[name]
+
+    def read_text(self, relative_path: str) -> str:
+        """Read a text file once and cache its decoded content"""
+        name = self._normalize(relative_path)
+        if name not in self._text:
+            self._text[name] = self.read_bytes(name).decode()
+        return self._text[name]
+
+    def scan(self, relative_path: str) -> ScanResult:
+        """Hits for every content pattern registered for a file, scanned once"""
+        name = self._normalize(relative_path)
+        scanner = scanner_for(name)
+        cached = self._scans.get(name)
+        if cached is None or cached[0] is not scanner:
+            with profiling.span(f"scan:{name}"):
+                if name in self._text:
+                    result = scanner.scan_text(self._text[name])
+                else:
+                    result = scanner.scan_file(self.path / name)
+                    profiling.count("bytes_read", result.length)
+            cached = self._scans[name] = (scanner, result)
+        return cached[1]
+
+    def document(self, relative_path: str, cache=None) -> Any:
+        """Parsed config document, parsed at most once per snapshot"""
+        name = self._normalize(relative_path)
+        if name not in self._documents:
+            try:
+                self._documents[name] = (self._load_document(name, cache), None)
+            except (ValueError, ImportError) as e:
+                self._documents[name] = (None, e)
+        data, error = self._documents[name]
+        if error is not None:
+            raise error
+        return data
+
+    def _load_document(self, name: str, cache=None) -> Any:
+        return load_document(self, name, cache)
+
+    @property
+    def walked(self) -> bool:
+        """Whether walk() has run for this snapshot"""
+        return self._walk is not None
+
+    def walk(self) -> WalkResult:
+        """Registered file names found anywhere in the project, walked once"""
+        names = registered_names()
+        if self._walk is None or self._walk[0] != names:
+            with profiling.span("walk"):
+                self._walk = (names, walk_tree(self.path, names))
+        return self._walk[1]
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Revision Snapshots
+
+Audits a project as it is at any commit, without a checkout. A
+RefSnapshot answers the same questions as a ProjectSnapshot - which
+paths exist, what a file contains, which registered names appear
+anywhere in the tree - from git objects read in-process by
+git_metadata.GitRepository. Trees are listed once per object id and
+blobs read once per object id, and both are kept for the lifetime of
+the GitRepository, so auditing many revisions of one repository only
+reads the trees and files that differ between them.
+
+Snapshot fingerprints are built from object ids, so check outcomes are
+cached by content (see audit_cache.run_cached) and shared by every
+revision whose inputs are identical. Checks of the working copy itself
+(HEAD, branch, upstream sync, uncommitted changes) do not apply to a
+revision and are not run.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from content_scanner import ScanResult, scanner_for
+from documents import DocumentError, parse_bytes
+from git_metadata import GitError, GitRepository
+from gitignore import GitignoreMatcher
+from project_snapshot import ProjectSnapshot
+from structure_validator import AUDIT_CHECKS
+from tree_walker import (DEFAULT_MAX_DEPTH, DEFAULT_MAX_FILES, PRUNED_DIRS, WalkResult, budget,
+                         registered_names)
+import profiling
+
+# Every check but the working-copy state
+REF_STRUCTURE_CHECKS = tuple(check for check in AUDIT_CHECKS if check != "git_state")
+
+# Tree entry modes
+TREE, REGULAR_FILE, GITLINK = 0o040000, 0o100000, 0o160000
+FILE_TYPE = 0o170000
+
+# (matches as (name, path), files, dirs, pruned, depth cut) of a walked subtree
+WalkSummary = Tuple[Tuple[Tuple[str, str], ...], int, int, int, bool]
+
+
+def find_repository(project_path: Union[str, Path]) -> Tuple[GitRepository, str]:
+    """The repository containing a project, and the project's path inside it"""
+    path = os.path.abspath(str(project_path))
+    current = path
+    while True:
+        repository = GitRepository.discover(current)
+        if repository is not None:
+            prefix = os.path.relpath(path, current)
+            return repository, "" if prefix == "." else prefix.replace(os.sep, "/")
+        parent = os.path.dirname(current)
+        if parent == current:
+            raise GitError(f"Not inside a git repository: {project_path}")
+        current = parent
+
+
+class RevisionReader:
+    """Object access for one repository, shared by the snapshots of many revisions"""
+
+    def __init__(self, repository: GitRepository):
+        self.repository = repository
+        self._blobs: Dict[str, bytes] = {}
+        self._walks: Dict[Tuple, WalkSummary] = {}
+
+    def blob(self, sha: str) -> bytes:
+        """Blob content, read once per object id"""
+        content = self._blobs.get(sha)
+        if content is None:
+            kind, content = self.repository.read_object(sha)
+            if kind != "blob":
+                raise GitError(f"{sha} is a {kind}, not a blob")
+            profiling.count("bytes_read", len(content))
+            self._blobs[sha] = content
+        return content
+
+    def walk_tree(self, matcher: GitignoreMatcher, names: frozenset, relative_dir: str,
+                  tree: str, ignores: Tuple[Optional[str], ...], depth: int) -> WalkSummary:
+        """(matches, files, dirs, pruned, depth cut) below one directory of a tree.
+
+        Summaries are memoised by directory, tree id, the ids of the
+        .gitignore files above it and the remaining depth, which is all they
+        depend on, so a subtree unchanged between revisions is walked once.
+        """
+        entries = self.repository.tree(tree)
+        ignore = entries.get(".gitignore")
+        ignores += (ignore[1] if ignore is not None and ignore[0] & FILE_TYPE == REGULAR_FILE
+                    else None,)
+        key = (relative_dir, tree, ignores, depth, names)
+        summary = self._walks.get(key)
+        if summary is not None:
+            return summary
+        profiling.count("listings")
+
+        matches: List[Tuple[str, str]] = []
+        files = dirs = pruned = 0
+        depth_cut = False
+        for name, (mode, sha) in entries.items():
+            path = f"{relative_dir}/{name}" if relative_dir else name
+            if mode == TREE:
+                if name in PRUNED_DIRS or matcher.match(path, True):
+                    pruned += 1
+                elif depth > 0:
+                    dirs += 1
+                    below = self.walk_tree(matcher, names, path, sha, ignores, depth - 1)
+                    matches.extend(below[0])
+                    files, dirs, pruned = files + below[1], dirs + below[2], pruned + below[3]
+                    depth_cut = depth_cut or below[4]
+                else:
+                    depth_cut = True
+                continue
+            if mode == GITLINK:
+                # Submodule contents are another repository's
+                pruned += 1
+                continue
+            files += 1
+            if name in names and not matcher.match(path, False):
+                matches.append((name, path))
+        summary = self._walks[key] = (tuple(matches), files, dirs, pruned, depth_cut)
+        return summary
+
+    def snapshot(self, project_path: Union[str, Path], prefix: str,
+                 revision: str) -> "RefSnapshot":
+        """Snapshot of the project directory `prefix` at a revision"""
+        repository = self.repository
+        commit = repository.resolve_revision(revision)
+        with profiling.span("ref:tree"):
+            tree: Optional[str] = repository.commit_tree(commit)
+            for part in prefix.split("/") if prefix else ():
+                entry = repository.tree(tree).get(part)
+                tree = entry[1] if entry is not None and entry[0] == TREE else None
+                if tree is None:
+                    break
+        return RefSnapshot(self, project_path, revision, commit, tree, at_root=not prefix)
+
+
+class RefSnapshot(ProjectSnapshot):
+    """A project directory as recorded in one commit"""
+
+    content_addressed = True
+
+    def __init__(self, reader: RevisionReader, project_path: Union[str, Path], revision: str,
+                 commit: str, tree: Optional[str], at_root: bool = True):
+        # Deliberately not calling ProjectSnapshot.__init__: nothing is listed from disk
+        self.path = Path(project_path)
+        self.reader = reader
+        self.revision = revision
+        self.commit = commit
+        self.tree = tree
+        self.at_root = at_root
+        self.root_exists = tree is not None
+        self._entries = {}
+        self._nested: Dict[str, Optional[Tuple[int, str]]] = {}
+        self._text: Dict[str, str] = {}
+        self._bytes: Dict[str, bytes] = {}
+        self._scans: Dict[str, Tuple[Any, ScanResult]] = {}
+        self._documents: Dict[str, Tuple[Any, Optional[Exception]]] = {}
+        self._walk: Optional[Tuple[frozenset, WalkResult]] = None
+
+    def _entry(self, relative_path: str) -> Optional[Tuple[int, str]]:
+        """(mode, object id) of a path in the tree, or None"""
+        name = self._normalize(relative_path)
+        if name not in self._nested:
+            entry = None
+            if self.tree is not None:
+                entry = (TREE, self.tree)
+                for part in name.split("/") if name else ():
+                    if entry[0] != TREE:
+                        entry = None
+                        break
+                    entry = self.reader.repository.tree(entry[1]).get(part)
+                    if entry is None:
+                        break
+            if entry is None and name == ".git" and self.at_root:
+                # The revision is read from this repository, which the root holds
+                entry = (TREE, "")
+            self._nested[name] = entry
+        return self._nested[name]
+
+    def names(self):
+        names = set(self.reader.repository.tree(self.tree)) if self.tree is not None else set()
+        if self.at_root:
+            names.add(".git")
+        return names
+
+    def exists(self, relative_path: str) -> bool:
+        return self._entry(relative_path) is not None
+
+    def is_dir(self, relative_path: str) -> bool:
+        entry = self._entry(relative_path)
+        # A submodule is checked out as a directory
+        return entry is not None and entry[0] in (TREE, GITLINK)
+
+    def is_file(self, relative_path: str) -> bool:
+        entry = self._entry(relative_path)
+        return entry is not None and entry[0] & FILE_TYPE == REGULAR_FILE
+
+    def stat(self, relative_path: str) -> Optional[os.stat_result]:
+        return None
+
+    def fingerprint(self, paths: Iterable[str], content_paths: Iterable[str] = ()) -> str:
+        """Types of the given paths and object ids of the content paths"""
+        parts = [f"{self._normalize(path)}={self._kind(self._normalize(path))}"
+                 for path in paths]
+        for relative_path in content_paths:
+            name = self._normalize(relative_path)
+            entry = self._entry(name) if self.is_file(name) else None
+            parts.append(f"{name}@{entry[1] if entry else '-'}")
+        return "|".join(parts)
+
+    def read_bytes(self, relative_path: str) -> bytes:
+        name = self._normalize(relative_path)
+        if name not in self._bytes:
+            if not self.is_file(name):
+                raise FileNotFoundError(f"{name} at {self.revision}")
+            self._bytes[name] = self.reader.blob(self._entry(name)[1])
+        return self._bytes[name]
+
+    def scan(self, relative_path: str) -> ScanResult:
+        name = self._normalize(relative_path)
+        scanner = scanner_for(name)
+        cached = self._scans.get(name)
+        if cached is None or cached[0] is not scanner:
+            with profiling.span(f"scan:{name}"):
+                cached = self._scans[name] = (scanner, scanner.scan_text(self.read_text(name)))
+        return cached[1]
+
+    def _load_document(self, name: str, cache=None) -> Any:
+        """Parse a document, consulting the parse cache by blob id"""
+        if not self.is_file(name):
+            raise FileNotFoundError(f"{name} at {self.revision}")
+        key = f"git:{self._entry(name)[1]}:{os.path.basename(name)}"
+        entry = cache.get_document(key, "") if cache is not None else None
+        if entry is not None:
+            profiling.count("cache_hits")
+        else:
+            with profiling.span(f"parse:{name}"):
+                try:
+                    entry = {"data": parse_bytes(name, self.read_bytes(name))}
+                except ValueError as e:
+                    entry = {"error": str(e)}
+            if cache is not None:
+                cache.put_document(key, "", entry)
+        if "error" in entry:
+            raise DocumentError(entry["error"])
+        return entry["data"]
+
+    def walk(self) -> WalkResult:
+        """Registered file names anywhere in the tree, pruned like tree_walker"""
+        names = registered_names()
+        if self._walk is None or self._walk[0] != names:
+            with profiling.span("walk"):
+                self._walk = (names, self._walk_tree(names))
+        return self._walk[1]
+
+    def _walk_tree(self, names: frozenset) -> WalkResult:
+        max_depth = budget("START_WALK_MAX_DEPTH", DEFAULT_MAX_DEPTH)
+        max_files = budget("START_WALK_MAX_FILES", DEFAULT_MAX_FILES)
+        result = WalkResult()
+        if self.tree is None:
+            return result
+
+        def read(path: str) -> Optional[str]:
+            return self.read_text(path) if self.is_file(path) else None
+
+        matcher = GitignoreMatcher(self.path, read)
+        summary = self.reader.walk_tree(matcher, names, "", self.tree, (), max_depth)
+        matches, result.files, result.dirs, result.pruned, depth_cut = summary
+        for name, path in matches:
+            result.matches.setdefault(name, []).append(path)
+        if depth_cut:
+            result.truncated = "depth"
+        if result.files >= max_files:
+            # Subtrees are summarised whole, so the budget caps the count afterwards
+            result.files = max_files
+            result.truncated = "files"
+        return result
+
+
+def audit_revision(snapshot: RefSnapshot, validators) -> Dict[str, Any]:
+    """Audit a revision snapshot, like fleet_auditor.audit_one() for a working tree"""
+    from fleet_auditor import is_python_project, meets_standards
+
+    structure_validator, uv_validator = validators
+    result: Dict[str, Any] = {
+        "project_path": str(snapshot.path),
+        "ref": snapshot.revision,
+        "commit": snapshot.commit,
+        "structure": structure_validator.audit_project(
+            snapshot.path, snapshot, REF_STRUCTURE_CHECKS),
+    }
+    if snapshot.root_exists and is_python_project(snapshot):
+        result["uv"] = uv_validator.validate_uv_compliance(snapshot.path, snapshot)
+    result["meets_standards"] = meets_standards(result)
+
+    if structure_validator.cache is not None:
+        structure_validator.cache.commit()
+    return result
+
+
+def audit_revisions(project_path: Union[str, Path], revisions: Iterable[str],
+                    validators) -> List[Dict[str, Any]]:
+    """Audit a project at each revision, sharing one object reader.
+
+    A revision that cannot be read gives a result with an "error" key.
+    """
+    repository, prefix = find_repository(project_path)
+    reader = RevisionReader(repository)
+    results = []
+    for revision in revisions:
+        try:
+            snapshot = reader.snapshot(project_path, prefix, revision)
+        except GitError as e:
+            results.append({"project_path": str(project_path), "ref": revision,
+                            "error": str(e), "meets_standards": False})
+            continue
+        result = audit_revision(snapshot, validators)
+        if not snapshot.root_exists:
+            result["error"] = f"{prefix or '.'} does not exist at {revision}"
+        results.append(result)
+    return results
@@ -0,0 +1,831 @@
+#!/usr/bin/env python3
+"""
+Standards Remediation
+
+Turns audit results into a remediation plan and applies it. Each failed
+check with a known fix contributes edits to its project's files; fixes
+to the same file are folded into one new content, so a plan holds at most
+one write or delete per file. A plan is shown as a unified diff, then
+applied on a thread pool, one project per job. A project's changes apply
+as a unit: every file is checked against its planned content and every
+write is staged in a synced temporary file next to its target before
+anything is renamed over it, and legacy files are deleted only after all
+writes have landed. A file that changed since it was planned skips its
+whole project rather than being overwritten. Afterwards only the checks
+that depend on the touched files are re-run.
+"""
+
+import ast
+import difflib
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from check_results import CheckResults
+from documents import toml_module
+from project_snapshot import ProjectSnapshot
+from uv_validator import GITIGNORE_PROBES
+
+DEFAULT_WORKERS = 16
+
+# Legacy requirement files -> optional-dependencies group (None: dependencies)
+REQUIREMENT_FILES = {
+    "requirements.txt": None,
+    "requirements-dev.txt": "dev",
+    "dev-requirements.txt": "dev",
+}
+
+# setup() keywords carried over to [project]
+SETUP_KEYWORDS = ("name", "version", "description", "install_requires",
+                  "extras_require", "python_requires")
+
+# .gitignore for projects without one, by project type
+DEFAULT_GITIGNORE = {
+    "nodejs": "node_modules/\ndist/\n.env\n.DS_Store\n",
+    "astro": "node_modules/\ndist/\n.astro/\n.env\n.DS_Store\n",
+}
+
+TABLE_HEADER = re.compile(r"^\[[ \t]*([A-Za-z0-9_.\"-]+?)[ \t]*\][ \t]*(?:#.*)?$", re.M)
+
+# Fixes run in this order, so migrations feed the pyproject.toml fixes
+FIX_ORDER = ("requirements", "pyproject", "gitignore", "readme", "agents_md")
+
+
+class ManualFix(Exception):
+    """A failed check that cannot be fixed automatically"""
+
+
+class FileChange:
+    """Planned new content of one file; after=None deletes it"""
+
+    __slots__ = ("path", "before", "after", "fixes")
+
+    def __init__(self, path: str, before: Optional[str]):
+        self.path = path
+        self.before = before
+        self.after = before
+        self.fixes: List[Tuple[str, str, str]] = []
+
+    @property
+    def action(self) -> str:
+        if self.after is None:
+            return "delete"
+        return "create" if self.before is None else "modify"
+
+    def diff(self) -> List[str]:
+        """Unified diff lines from the current to the planned content"""
+        before = self.before.splitlines(keepends=True) if self.before is not None else []
+        after = self.after.splitlines(keepends=True) if self.after is not None else []
+        return [line if line.endswith("\n") else line + "\n"
+                for line in difflib.unified_diff(
+                    before, after,
+                    "/dev/null" if self.before is None else f"a/{self.path}",
+                    "/dev/null" if self.after is None else f"b/{self.path}")]
+
+
+class ProjectPlan:
+    """Planned file changes and manual follow-ups for one project"""
+
+    def __init__(self, result: Dict[str, Any], standards: Dict[str, Any]):
+        self.project_path = result["project_path"]
+        self.snapshot = ProjectSnapshot(self.project_path)
+        self.project_type = result.get("structure", {}).get("project_type", "unknown")
+        self.python = "uv" in result
+        self.standards = standards
+        self.changes: Dict[str, FileChange] = {}
+        self.manual: List[Tuple[str, str, str]] = []
+
+    # -- planned file content ----------------------------------------------
+
+    def read(self, path: str) -> Optional[str]:
+        """A file's content as the plan leaves it, or None if absent"""
+        if path in self.changes:
+            return self.changes[path].after
+        if not self.snapshot.is_file(path):
+            return None
+        return self.snapshot.read_text(path)
+
+    def _change(self, path: str) -> FileChange:
+        if path not in self.changes:
+            before = self.snapshot.read_text(path) if self.snapshot.is_file(path) else None
+            self.changes[path] = FileChange(path, before)
+        return self.changes[path]
+
+    def write(self, path: str, content: str, fix: Tuple[str, str, str]):
+        change = self._change(path)
+        change.after = content
+        change.fixes.append(fix)
+
+    def delete(self, path: str, fix: Tuple[str, str, str]):
+        change = self._change(path)
+        change.after = None
+        change.fixes.append(fix)
+
+    @property
+    def file_changes(self) -> List[FileChange]:
+        """Changes that actually alter a file, in path order"""
+        return [change for path, change in sorted(self.changes.items())
+                if change.after != change.before]
+
+    # -- project metadata --------------------------------------------------
+
+    def metadata(self) -> Dict[str, str]:
+        """Name and description from the planned pyproject.toml or package.json"""
+        data: Dict[str, Any] = {}
+        pyproject = self.read("pyproject.toml")
+        toml = toml_module()
+        if pyproject is not None and toml is not None:
+            try:
+                data = toml.loads(pyproject).get("project", {})
+            except ValueError:
+                pass
+        elif self.snapshot.is_file("package.json"):
+            try:
+                data = json.loads(self.snapshot.read_text("package.json"))
+            except ValueError:
+                pass
+        name = data.get("name") if isinstance(data.get("name"), str) else None
+        name = name or Path(self.project_path).name
+        description = data.get("description") if isinstance(data.get("description"), str) else None
+        return {"name": name, "description": description or f"The {name} project"}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "project_path": self.project_path,
+            "changes": [{"path": change.path, "action": change.action,
+                         "fixes": [{"validator": validator, "rule_id": rule_id, "path": path}
+                                   for validator, rule_id, path in change.fixes]}
+                        for change in self.file_changes],
+            "manual": [{"rule_id": rule_id, "path": path, "hint": hint}
+                       for rule_id, path, hint in self.manual],
+        }
+
+
+# ---------------------------------------------------------------------------
+# Fix registry
+# ---------------------------------------------------------------------------
+
+# rule id -> (fix group, fixer(plan, fix, path, args))
+FIXERS: Dict[str, Tuple[str, Callable]] = {}
+
+
+def fixer(group: str, *rule_ids: str):
+    """Register a fixer for failed checks with the given rule ids"""
+    def register(function: Callable) -> Callable:
+        for rule_id in rule_ids:
+            FIXERS[rule_id] = (group, function)
+        return function
+    return register
+
+
+def _failures(result: Dict[str, Any]) -> Iterable[Tuple[str, str, str, Tuple[Any, ...]]]:
+    """(validator, rule_id, path, args) of every failed check"""
+    for validator in ("structure", "uv"):
+        checks = result.get(validator, {}).get("checks")
+        if checks:
+            for rule_id, passed, _, path, args in CheckResults.from_dict(checks).records():
+                if not passed:
+                    yield validator, rule_id, path, tuple(args)
+
+
+def plan_project(result: Dict[str, Any], standards: Dict[str, Any]) -> ProjectPlan:
+    """Remediation plan for one audit_one() result"""
+    plan = ProjectPlan(result, standards)
+    if "error" in result or "error" in result.get("structure", {}):
+        return plan
+
+    order = {group: index for index, group in enumerate(FIX_ORDER)}
+    pending = []
+    for validator, rule_id, path, args in _failures(result):
+        if rule_id in FIXERS:
+            group, function = FIXERS[rule_id]
+            pending.append((order[group], validator, rule_id, path, args, function))
+        elif rule_id in MANUAL_HINTS:
+            plan.manual.append((rule_id, path, MANUAL_HINTS[rule_id]))
+
+    for _, validator, rule_id, path, args, function in sorted(pending, key=lambda p: p[0]):
+        try:
+            function(plan, (validator, rule_id, path), path, args)
+        except ManualFix as e:
+            plan.manual.append((rule_id, path, str(e)))
+    return plan
+
+
+# Failed checks no file edit can fix
+MANUAL_HINTS = {
+    "uv.installed": "install uv: curl -LsSf https://astral.sh/uv/install.sh | sh",
+    "structure.git.repository": "run: git init",
+    "structure.git.branch": "rename the branch: git branch -m YYYYMMDD-HHMMSS-type-description",
+    "structure.git.sync": "pull or rebase onto the upstream branch",
+    "structure.agents_md.content": "write project-specific AGENTS.md content",
+    "uv.agents_md.forbidden_pattern": "prefix the command with `uv run`",
+    "uv.lock.requires_python": "run: uv lock",
+    "uv.lock.project": "run: uv lock",
+    "uv.lock.stale": "run: uv lock",
+    "uv.lock.missing": "run: uv lock",
+    "uv.lock.duplicate": "run: uv lock",
+    "uv.required_dir": "run: uv venv",
+    "structure.required_dir": "create the directory",
+    "structure.type_dir": "create the directory (.venv/: uv venv)",
+}
+
+
+# ---------------------------------------------------------------------------
+# pyproject.toml text editing (TOML is edited in place to keep formatting)
+# ---------------------------------------------------------------------------
+
+def _toml_string(value: str) -> str:
+    # JSON string escapes are valid TOML basic-string escapes
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _toml_array(values: List[str]) -> str:
+    if not values:
+        return "[]"
+    return "[\n" + "".join(f"    {_toml_string(value)},\n" for value in values) + "]"
+
+
+def _table_span(text: str, table: str) -> Optional[Tuple[int, int]]:
+    """(start, end) of a table's body, or None if it has no header"""
+    headers = list(TABLE_HEADER.finditer(text))
+    for index, header in enumerate(headers):
+        if header.group(1).replace('"', "") == table:
+            end = headers[index + 1].start() if index + 1 < len(headers) else len(text)
+            return header.end(), end
+    return None
+
+
+def _string_end(text: str, index: int) -> int:
+    """Index just past the TOML string starting at text[index]"""
+    char = text[index]
+    quote = char * 3 if text.startswith(char * 3, index) else char
+    position = index + len(quote)
+    while True:
+        close = text.find(quote, position)
+        if close == -1:
+            return len(text)
+        backslashes = len(text[position:close]) - len(text[position:close].rstrip("\\"))
+        # Literal strings have no escapes; a basic string's quote may be escaped
+        if char == "'" or backslashes % 2 == 0:
+            return close + len(quote)
+        position = close + 1
+
+
+def _value_end(text: str, start: int) -> int:
+    """End of the TOML value starting at text[start], across nested arrays"""
+    depth = 0
+    index = start
+    while index < len(text):
+        char = text[index]
+        if char in "\"'":
+            index = _string_end(text, index)
+            continue
+        if char == "#":
+            newline = text.find("\n", index)
+            index = len(text) if newline == -1 else newline
+            continue
+        if char in "[{":
+            depth += 1
+        elif char in "]}":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+        elif char == "\n" and depth == 0:
+            return index
+        index += 1
+    return index
+
+
+def ensure_table(text: str, table: str) -> str:
+    """Append an empty [table] if the document has none"""
+    if _table_span(text, table) is not None:
+        return text
+    if not text.strip():
+        return f"[{table}]\n"
+    return f"{text.rstrip()}\n\n[{table}]\n"
+
+
+def set_key(text: str, table: str, key: str, value: str, replace: bool = False) -> str:
+    """Set `key = value` (value already TOML) in a table, adding the table if needed"""
+    text = ensure_table(text, table)
+    start, end = _table_span(text, table)
+    match = re.compile(rf"^{re.escape(key)}\s*=\s*", re.M).search(text, start, end)
+    if match is not None:
+        if not replace:
+            return text
+        return text[:match.end()] + value + text[_value_end(text, match.end()):]
+    # New keys go right after the last key of the table
+    body = text[start:end].rstrip()
+    insert = start + len(body)
+    return f"{text[:insert]}\n{key} = {value}{text[insert:]}"
+
+
+def _last_value_char(text: str, start: int, end: int) -> int:
+    """Index of the last character of a value between start and end, or -1"""
+    last = -1
+    index = start
+    while index < end:
+        char = text[index]
+        if char in "\"'":
+            index = _string_end(text, index)
+            last = index - 1
+            continue
+        if char == "#":
+            newline = text.find("\n", index, end)
+            index = end if newline == -1 else newline
+            continue
+        if not char.isspace():
+            last = index
+        index += 1
+    return last
+
+
+def append_to_array(text: str, table: str, key: str, values: List[str]) -> str:
+    """Append strings to an existing array, keeping its layout and comments"""
+    start, end = _table_span(text, table)
+    match = re.compile(rf"^{re.escape(key)}[ \t]*=[ \t]*\[", re.M).search(text, start, end)
+    if match is None:
+        raise ManualFix(f"{table}.{key} is not an array literal; edit by hand")
+    close = _value_end(text, match.end() - 1) - 1
+    last = _last_value_char(text, match.end(), close)
+    # New values follow the last element, which needs a separating comma
+    anchor = last if last != -1 else match.end() - 1
+    comma = "" if last == -1 or text[last] == "," else ","
+    if "\n" in text[match.end():close]:
+        line_start = text.rfind("\n", 0, close) + 1
+        indent = re.match(r"[ \t]*", text[line_start:close]).group()
+        # Match the indentation of the existing elements
+        last_line = text.rfind("\n", 0, anchor) + 1
+        item_indent = (re.match(r"[ \t]*", text[last_line:]).group()
+                       if last != -1 and last_line > match.start() else indent + "    ")
+        added = "".join(f"{item_indent}{_toml_string(value)},\n" for value in values)
+        if text[line_start:close].strip():
+            # The closing bracket shares a line with the last element
+            return text[:anchor + 1] + comma + "\n" + added + text[close:]
+        return text[:anchor + 1] + comma + text[anchor + 1:line_start] + added + text[line_start:]
+    separator = "" if last == -1 else (", " if comma else " ")
+    added = ", ".join(_toml_string(value) for value in values)
+    return text[:anchor + 1] + separator + added + text[anchor + 1:]
+
+
+def _requirement_name(requirement: str) -> str:
+    match = re.match(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)", requirement)
+    return re.sub(r"[-_.]+", "-", match.group(1)).lower() if match else requirement
+
+
+def merge_requirements(text: str, group: Optional[str], requirements: List[str]) -> str:
+    """Add requirements to dependencies or an optional-dependencies group"""
+    toml = toml_module()
+    if toml is None:
+        raise ManualFix("no TOML parser available to edit pyproject.toml")
+    try:
+        project = toml.loads(text).get("project", {})
+    except ValueError as e:
+        raise ManualFix(f"pyproject.toml does not parse: {e}")
+
+    if group is None:
+        table, key, existing = "project", "dependencies", project.get("dependencies", [])
+    else:
+        optional = project.get("optional-dependencies", {})
+        if optional and _table_span(text, "project.optional-dependencies") is None:
+            raise ManualFix("optional-dependencies is an inline table; merge by hand")
+        table, key, existing = "project.optional-dependencies", group, optional.get(group, [])
+
+    names = {_requirement_name(requirement) for requirement in existing}
+    added = [requirement for requirement in requirements
+             if _requirement_name(requirement) not in names]
+    present = key in (project if group is None else project.get("optional-dependencies", {}))
+    if not present:
+        return set_key(text, table, key, _toml_array(added))
+    return append_to_array(text, table, key, added) if added else text
+
+
+# ---------------------------------------------------------------------------
+# Fixers
+# ---------------------------------------------------------------------------
+
+def read_requirements(text: str, path: str) -> List[str]:
+    """Requirement lines of a requirements file; options and includes need a person"""
+    requirements = []
+    for line in text.splitlines():
+        line = line.split(" #", 1)[0].strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("-"):
+            raise ManualFix(f"{path} uses pip options ({line.split()[0]}); migrate by hand")
+        requirements.append(line)
+    return requirements
+
+
+@fixer("requirements", "uv.legacy_file", "uv.forbidden_file", "structure.type_forbidden")
+def fix_requirements(plan: ProjectPlan, fix, path: str, args):
+    if path == "setup.py":
+        return fix_setup_py(plan, fix, path, args)
+    if path not in REQUIREMENT_FILES:
+        raise ManualFix(f"migrate {path} to pyproject.toml and remove it")
+
+    text = plan.read(path)
+    if text is None:
+        # Already migrated for another rule reporting the same file
+        if path in plan.changes:
+            plan.delete(path, fix)
+        return
+    requirements = read_requirements(text, path)
+    pyproject = plan.read("pyproject.toml")
+    if pyproject is None:
+        pyproject = new_pyproject(plan)
+    plan.write("pyproject.toml", merge_requirements(pyproject, REQUIREMENT_FILES[path],
+                                                    requirements), fix)
+    plan.delete(path, fix)
+
+
+def _setup_keywords(text: str) -> Dict[str, Any]:
+    """Literal setup() keywords of a setup.py"""
+    try:
+        tree = ast.parse(text)
+    except SyntaxError as e:
+        raise ManualFix(f"setup.py does not parse: {e.msg}")
+    calls = [node for node in ast.walk(tree) if isinstance(node, ast.Call)
+             and getattr(node.func, "id", getattr(node.func, "attr", None)) == "setup"]
+    if len(calls) != 1:
+        raise ManualFix("setup.py has no single setup() call; migrate by hand")
+
+    keywords = {}
+    for keyword in calls[0].keywords:
+        if keyword.arg in SETUP_KEYWORDS:
+            try:
+                keywords[keyword.arg] = ast.literal_eval(keyword.value)
+            except ValueError:
+                raise ManualFix(f"setup.py computes {keyword.arg}; migrate by hand")
+    return keywords
+
+
+def fix_setup_py(plan: ProjectPlan, fix, path: str, args):
+    text = plan.read("setup.py")
+    if text is None:
+        if "setup.py" in plan.changes:
+            plan.delete("setup.py", fix)
+        return
+    keywords = _setup_keywords(text)
+
+    pyproject = plan.read("pyproject.toml")
+    # An existing pyproject.toml wins over setup.py; a new one takes its metadata,
+    # also when a requirements file migrated earlier in this plan created it
+    change = plan.changes.get("pyproject.toml")
+    created = pyproject is None or (change is not None and change.before is None)
+    if pyproject is None:
+        pyproject = new_pyproject(plan, keywords.get("name"))
+    for key, keyword in (("name", "name"), ("version", "version"),
+                         ("description", "description"), ("requires-python", "python_requires")):
+        if isinstance(keywords.get(keyword), str):
+            pyproject = set_key(pyproject, "project", key, _toml_string(keywords[keyword]),
+                                replace=created)
+    pyproject = merge_requirements(pyproject, None, list(keywords.get("install_requires", [])))
+    for group, requirements in keywords.get("extras_require", {}).items():
+        pyproject = merge_requirements(pyproject, group, list(requirements))
+    pyproject = add_build_system(plan, pyproject)
+    plan.write("pyproject.toml", pyproject, fix)
+    plan.delete("setup.py", fix)
+
+
+def new_pyproject(plan: ProjectPlan, name: Optional[str] = None) -> str:
+    name = name or Path(plan.project_path).name
+    return (f"[project]\nname = {_toml_string(name)}\nversion = \"0.1.0\"\n"
+            f"description = {_toml_string(f'The {name} project')}\ndependencies = []\n")
+
+
+def add_build_system(plan: ProjectPlan, text: str) -> str:
+    if _table_span(text, "build-system") is not None:
+        return text
+    build = plan.standards.get("pyproject_toml_requirements", {}).get("build_system", {})
+    text = set_key(text, "build-system", "requires",
+                   json.dumps(build.get("requires", ["setuptools", "wheel"])))
+    return set_key(text, "build-system", "build-backend",
+                   _toml_string(build.get("build_backend", "setuptools.build_meta")))
+
+
+@fixer("pyproject", "uv.pyproject.exists", "uv.pyproject.project_section", "uv.pyproject.field",
+       "uv.pyproject.dependencies", "uv.pyproject.build_system", "uv.required_file")
+def fix_pyproject(plan: ProjectPlan, fix, path: str, args):
+    text = plan.read("pyproject.toml")
+    if text is None:
+        text = new_pyproject(plan)
+    metadata = plan.metadata()
+    rule_id = fix[1]
+    if rule_id == "uv.required_file" and path != "pyproject.toml":
+        raise ManualFix("run: uv lock" if path == "uv.lock" else f"create {path}")
+    if rule_id in ("uv.pyproject.project_section", "uv.pyproject.field"):
+        text = set_key(text, "project", "name", _toml_string(metadata["name"]))
+        text = set_key(text, "project", "version", '"0.1.0"')
+        text = set_key(text, "project", "description", _toml_string(metadata["description"]))
+    if rule_id in ("uv.pyproject.project_section", "uv.pyproject.dependencies"):
+        text = set_key(text, "project", "dependencies", "[]")
+    if rule_id in ("uv.pyproject.exists", "uv.required_file", "uv.pyproject.build_system"):
+        text = add_build_system(plan, text)
+    plan.write("pyproject.toml", text, fix)
+
+
+@fixer("gitignore", "uv.gitignore.exists", "uv.gitignore.entry", "structure.git.gitignore")
+def fix_gitignore(plan: ProjectPlan, fix, path: str, args):
+    text = plan.read(".gitignore")
+    if text is None:
+        if plan.python:
+            text = (Path(__file__).parent.parent / "templates" / "python-project"
+                    / ".gitignore").read_text()
+        else:
+            text = DEFAULT_GITIGNORE.get(plan.project_type, ".env\n.DS_Store\n")
+    entries = [args[0]] if fix[1] == "uv.gitignore.entry" else (
+        list(GITIGNORE_PROBES) if plan.python else [])
+    lines = text.splitlines()
+    # Appended last, so the entries decide even after a negation
+    missing = [entry for entry in entries if entry not in lines or fix[1] == "uv.gitignore.entry"]
+    if missing:
+        text = text + ("" if text.endswith("\n") or not text else "\n") + "".join(
+            f"{entry}\n" for entry in missing)
+    plan.write(".gitignore", text, fix)
+
+
+@fixer("readme")
+def fix_readme(plan: ProjectPlan, fix, path: str, args):
+    if plan.read("README.md") is None:
+        metadata = plan.metadata()
+        plan.write("README.md", f"# {metadata['name']}\n\n{metadata['description']}\n", fix)
+
+
+def _without_wrong_examples(content: str) -> str:
+    """Content without its "# ❌ WRONG" example groups, whose commands
+    uv.agents_md.forbidden_pattern would flag in a project's AGENTS.md"""
+    kept: List[str] = []
+    skipping = False
+    for line in content.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("# ❌"):
+            # The group runs to the next blank line or the end of the code block
+            skipping = True
+            while kept and not kept[-1].strip():
+                kept.pop()
+        elif skipping and (not stripped or stripped.startswith("```")):
+            skipping = False
+        if not skipping:
+            kept.append(line)
+    return "\n".join(kept)
+
+
+def uv_sections(standards: Dict[str, Any], text: str = "") -> str:
+    """Markdown for the UV-first sections of the standards that text lacks"""
+    sections = standards.get("agents_md_uv_sections", {}).get("required_sections", [])
+    return "".join(
+        f"\n## {section['section']}\n\n"
+        + _without_wrong_examples(section["content"].rstrip()) + "\n"
+        for section in sections if f"## {section['section']}" not in text)
+
+
+@fixer("agents_md", "structure.agents_md.exists", "uv.agents_md.exists",
+       "uv.agents_md.uv_section")
+def fix_agents_md(plan: ProjectPlan, fix, path: str, args):
+    text = plan.read("AGENTS.md")
+    if text is None:
+        metadata = plan.metadata()
+        text = (f"# {metadata['name']} - Agent Instructions\n\n"
+                f"## Project Overview\n\n{metadata['description']}\n\n"
+                "## Development Workflow\n\n"
+                "1. Create a feature branch: `YYYYMMDD-HHMMSS-feat-description`\n"
+                "2. Make changes following the project standards\n"
+                "3. Commit with a descriptive message\n"
+                "4. Push and create a pull request\n")
+    if plan.python:
+        text = text + ("" if text.endswith("\n") else "\n") + uv_sections(plan.standards, text)
+    plan.write("AGENTS.md", text, fix)
+
+
+@fixer("agents_md", "structure.required_file")
+def fix_required_file(plan: ProjectPlan, fix, path: str, args):
+    # Required files share one rule id; route by path
+    if path == ".gitignore":
+        fix_gitignore(plan, fix, path, args)
+    elif path == "README.md":
+        fix_readme(plan, fix, path, args)
+    elif path == "AGENTS.md":
+        fix_agents_md(plan, fix, path, args)
+    elif path.rstrip("/") == ".git":
+        raise ManualFix("run: git init")
+    else:
+        raise ManualFix(f"create {path}")
+
+
+# ---------------------------------------------------------------------------
+# Applying
+# ---------------------------------------------------------------------------
+
+def _current(path: Path) -> Tuple[Optional[str], int]:
+    """A file's content (None if absent) and permission bits"""
+    try:
+        with open(path, encoding="utf-8", newline="") as f:
+            content: Optional[str] = f.read()
+        return content, os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        return None, 0o644
+
+
+def _discard(path: Path):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _sync_dir(directory: Path):
+    """Flush a directory's entries, so renames and deletes in it survive a crash"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        # Some filesystems cannot sync directories
+        pass
+    finally:
+        os.close(fd)
+
+
+def _stage(path: Path, content: str, mode: int) -> Path:
+    """Write content to a temporary file next to path, flushed to disk"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    fd = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+    try:
+        with open(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        _discard(temporary)
+        raise
+    return temporary
+
+
+def write_atomic(path: Path, content: Optional[str], expected: Optional[str]) -> str:
+    """Replace or delete a file if it still holds `expected`; returns the outcome"""
+    current, mode = _current(path)
+    if current != expected:
+        return "conflict"
+
+    if content is None:
+        os.unlink(path)
+        _sync_dir(path.parent)
+        return "deleted"
+
+    temporary = _stage(path, content, mode)
+    try:
+        os.replace(temporary, path)
+    except BaseException:
+        _discard(temporary)
+        raise
+    _sync_dir(path.parent)
+    return "written"
+
+
+def apply_project(plan: ProjectPlan) -> Dict[str, str]:
+    """Apply one project's changes as a unit; path -> outcome.
+
+    Every file is checked against its planned content and every new
+    content staged in a temporary file before anything is renamed, and
+    deletes run only once all writes have landed, so a migration never
+    removes a legacy file whose pyproject.toml write failed. When a file
+    conflicts or cannot be staged, nothing is changed: it gets "conflict"
+    or "error: ...", the other files "skipped".
+    """
+    root = Path(plan.project_path)
+    changes = plan.file_changes
+    outcomes: Dict[str, str] = {}
+    staged: List[Tuple[FileChange, Path]] = []
+
+    def skip_rest(cause: str):
+        for change in changes:
+            outcomes.setdefault(change.path, f"skipped: {cause} was not applied")
+
+    try:
+        modes = {}
+        for change in changes:
+            try:
+                current, modes[change.path] = _current(root / change.path)
+            except OSError as e:
+                outcomes[change.path] = f"error: {e}"
+            else:
+                if current != change.before:
+                    outcomes[change.path] = "conflict"
+            if outcomes:
+                skip_rest(change.path)
+                return outcomes
+
+        for change in changes:
+            if change.after is not None:
+                try:
+                    staged.append((change, _stage(root / change.path, change.after,
+                                                  modes[change.path])))
+                except OSError as e:
+                    outcomes[change.path] = f"error: {e}"
+                    skip_rest(change.path)
+                    return outcomes
+
+        while staged:
+            change, temporary = staged[0]
+            try:
+                os.replace(temporary, root / change.path)
+            except OSError as e:
+                outcomes[change.path] = f"error: {e}"
+                skip_rest(change.path)
+                return outcomes
+            staged.pop(0)
+            outcomes[change.path] = "written"
+
+        for change in changes:
+            if change.after is None:
+                try:
+                    os.unlink(root / change.path)
+                    outcomes[change.path] = "deleted"
+                except OSError as e:
+                    outcomes[change.path] = f"error: {e}"
+    finally:
+        for _, temporary in staged:
+            _discard(temporary)
+        for directory in {(root / change.path).parent for change in changes}:
+            _sync_dir(directory)
+    return outcomes
+
+
+def apply_plans(plans: List[ProjectPlan], workers: int = DEFAULT_WORKERS) -> Dict[str, Dict[str, str]]:
+    """Apply each project's plan in parallel; project -> {path: outcome}"""
+    if len(plans) < 2 or workers <= 1:
+        outcomes = list(map(apply_project, plans))
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(apply_project, plans))
+    return {plan.project_path: outcome for plan, outcome in zip(plans, outcomes)}
+
+
+def touched_checks(validator, touched: Iterable[str], checks: Iterable[str],
+                   project_type: Optional[str] = None) -> List[str]:
+    """Cached checks whose dependencies include a touched path"""
+    touched = {path.strip("/") for path in touched}
+    selected = []
+    for check in checks:
+        try:
+            if project_type is None:
+                paths, content_paths = validator.check_dependencies(check)
+            else:
+                paths, content_paths = validator.check_dependencies(check, project_type)
+        except ValueError:
+            # Uncached checks (tree walks, git state, the uv probe) are not re-run
+            continue
+        if touched & {path.strip("/") for path in list(paths) + list(content_paths)}:
+            selected.append(check)
+    return selected
+
+
+def reaudit(plan: ProjectPlan, written: Iterable[str], validators) -> Dict[str, Any]:
+    """Re-run only the checks that depend on the written files.
+
+    Returns the fixes each planned change claimed, split into those that
+    now pass and those that still fail.
+    """
+    from structure_validator import AUDIT_CHECKS
+    from uv_validator import UV_CHECKS
+
+    structure_validator, uv_validator = validators
+    written = list(written)
+    snapshot = ProjectSnapshot(plan.project_path)
+    results = []
+
+    checks = touched_checks(structure_validator, written, AUDIT_CHECKS, plan.project_type)
+    if checks:
+        results.append(("structure", structure_validator.audit_project(
+            plan.project_path, snapshot, checks)))
+    checks = touched_checks(uv_validator, written, UV_CHECKS)
+    if plan.python and checks:
+        results.append(("uv", uv_validator.validate_uv_compliance(
+            plan.project_path, snapshot, checks)))
+
+    # A rule reported on one path several times passes only if all pass
+    statuses: Dict[Tuple[str, str, str], bool] = {}
+    for validator, result in results:
+        if "checks" in result:
+            for rule_id, passed, _, path, _ in CheckResults.from_dict(result["checks"]).records():
+                key = (validator, rule_id, path)
+                statuses[key] = statuses.get(key, True) and passed
+
+    fixed, failing = set(), set()
+    for change in plan.file_changes:
+        if change.path not in written:
+            continue
+        for fix in change.fixes:
+            # A check that no longer runs (e.g. a deleted legacy file) counts as fixed
+            (fixed if statuses.get(fix, True) else failing).add(fix)
+    if structure_validator.cache is not None:
+        structure_validator.cache.commit()
+    return {"checks_rerun": len(statuses), "fixed": sorted(fixed), "failing": sorted(failing)}
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Compiled Rule Engine
+
+Compiles the path rules in standards/project-structure.yaml and
+standards/python-uv-requirements.yaml into an immutable plan once per
+process. Each rule carries its path, the snapshot probe it needs and its
+severity, so evaluating a plan against a project is a tight loop over
+filesystem probes that records structured results.
+"""
+
+from operator import methodcaller
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+from check_results import CheckResults, ERROR, WARNING
+
+
+class PathRule:
+    """A single compiled path requirement"""
+
+    __slots__ = ("rule_id", "path", "probe", "expected", "severity", "args")
+
+    def __init__(self, rule_id: str, path: str, probe: str, expected: bool,
+                 severity: str = ERROR, args: Tuple[Any, ...] = ()):
+        self.rule_id = rule_id
+        self.path = path
+        # Snapshot method call, e.g. snapshot.is_dir(path)
+        self.probe = methodcaller(probe, path)
+        self.expected = expected
+        self.severity = severity
+        self.args = args
+
+    def __repr__(self) -> str:
+        return f"PathRule({self.rule_id!r}, {self.path!r})"
+
+
+def run_rules(rules: Iterable[PathRule], snapshot) -> CheckResults:
+    """Evaluate compiled rules against a project snapshot"""
+    results = CheckResults()
+    add = results.add
+    for rule in rules:
+        add(rule.rule_id, rule.probe(snapshot) == rule.expected,
+            rule.path, rule.args, rule.severity)
+    return results
+
+
+def rule_paths(rules: Iterable[PathRule]) -> List[str]:
+    """Paths probed by a group of rules, for cache dependency tracking"""
+    return [rule.path for rule in rules]
+
+
+def _severity(spec: Dict[str, Any]) -> str:
+    # Generated artifacts (uv.lock, .venv/) are expected but not authored
+    return WARNING if spec.get("generated") else ERROR
+
+
+class StructurePlan:
+    """Compiled form of project-structure.yaml"""
+
+    __slots__ = ("required_files", "project_types")
+
+    def __init__(self, required_files: Tuple[PathRule, ...],
+                 project_types: Mapping[str, Tuple[PathRule, ...]]):
+        self.required_files = required_files
+        self.project_types = project_types
+
+
+def compile_structure_plan(standards: Dict[str, Any]) -> StructurePlan:
+    """Compile universal and per-project-type path rules"""
+    required = []
+    for spec in standards.get("required_files", []):
+        if spec.get("type") == "directory":
+            required.append(PathRule("structure.required_dir", spec["path"], "is_dir", True))
+        else:
+            required.append(PathRule("structure.required_file", spec["path"], "is_file", True))
+
+    project_types = {}
+    for project_type, requirements in standards.get("project_types", {}).items():
+        rules = []
+        for spec in requirements.get("required_files", []):
+            if spec.get("type") == "directory":
+                rules.append(PathRule("structure.type_dir", spec["path"], "is_dir", True,
+                                      args=(project_type,)))
+            else:
+                rules.append(PathRule("structure.type_file", spec["path"], "is_file", True,
+                                      args=(project_type,)))
+
+        for spec in requirements.get("forbidden_files", []):
+            reason = spec.get("reason", "Forbidden for UV projects")
+            rules.append(PathRule("structure.type_forbidden", spec["path"], "exists", False,
+                                  args=(reason,)))
+
+        project_types[project_type] = tuple(rules)
+
+    return StructurePlan(tuple(required), MappingProxyType(project_types))
+
+
+class UVPlan:
+    """Compiled form of the path rules in python-uv-requirements.yaml"""
+
+    __slots__ = ("project_structure", "legacy_files")
+
+    def __init__(self, project_structure: Tuple[PathRule, ...], legacy_files: Tuple[PathRule, ...]):
+        self.project_structure = project_structure
+        self.legacy_files = legacy_files
+
+
+def compile_uv_plan(uv_requirements: Dict[str, Any], legacy_files: Iterable[str]) -> UVPlan:
+    """Compile UV required/forbidden file rules and the legacy file rules"""
+    structure = []
+    for spec in uv_requirements.get("required_files", []):
+        if spec.get("type") == "directory":
+            structure.append(PathRule("uv.required_dir", spec["path"], "is_dir", True,
+                                      _severity(spec)))
+        else:
+            structure.append(PathRule("uv.required_file", spec["path"], "exists", True,
+                                      _severity(spec)))
+
+    for spec in uv_requirements.get("forbidden_files", []):
+        reason = spec.get("reason", "Forbidden file")
+        alternative = spec.get("alternative", "Use UV-compatible approach")
+        structure.append(PathRule("uv.forbidden_file", spec["path"], "exists", False,
+                                  args=(reason, alternative)))
+
+    legacy = tuple(PathRule("uv.legacy_file", path, "exists", False) for path in legacy_files)
+
+    return UVPlan(tuple(structure), legacy)
@@ -8,20 +8,53 @@ standards/project-structure.yaml
 
 import yaml
 import json
+import hashlib
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Union, Callable, Iterable
+
+from project_snapshot import ProjectSnapshot
+from audit_cache import AuditCache, run_cached
+from rule_engine import compile_structure_plan, run_rules, rule_paths
+from check_results import CheckResults, ERROR, WARNING, render_checks
+from audit_output import FORMATS, validator_records, write_json, write_ndjson
+from content_scanner import register_patterns
+from tree_walker import register_names
+from git_metadata import BRANCH_PATTERN, PROTECTED_BRANCHES, READ_ERRORS, GitRepository
+import profiling
+
+ProjectLike = Union[str, Path, ProjectSnapshot]
+
+# Checks run by audit_project(), in report order
+AUDIT_CHECKS = ("required_files", "project_type", "nested_forbidden_files", "agents_md",
+                "git_setup", "git_state")
+
+# AGENTS.md content rules, scanned in the same pass as the UV rules
+AGENTS_MD_HEADERS = ("# ", "## ")  # Title, at least one section header
+AGENTS_MD_PLACEHOLDERS = ("TODO",)
+AGENTS_MD_PLACEHOLDERS_ANY_CASE = ("placeholder",)
+register_patterns("AGENTS.md", AGENTS_MD_HEADERS + AGENTS_MD_PLACEHOLDERS)
+register_patterns("AGENTS.md", AGENTS_MD_PLACEHOLDERS_ANY_CASE, ignore_case=True)
 
 class ProjectValidator:
     """Validates project structure and quality compliance"""
     
-    def __init__(self, standards_dir: Path = None):
+    # Marker files consulted by detect_project_type
+    PROJECT_TYPE_MARKERS = ("astro.config.mjs", "pyproject.toml", "package.json")
+    
+    def __init__(self, standards_dir: Path = None, cache: AuditCache = None):
         if standards_dir is None:
             # Default to standards directory relative to this file
             self.standards_dir = Path(__file__).parent.parent / "standards"
         else:
             self.standards_dir = Path(standards_dir)
             
+        self.cache = cache
         self.standards = self._load_standards()
+        # Path rules are compiled once; audits only evaluate the plan
+        self.plan = compile_structure_plan(self.standards)
+        # Forbidden files are also searched for below the project root
+        register_names(rule.path for rules in self.plan.project_types.values()
+                       for rule in rules if rule.rule_id == "structure.type_forbidden")
     
     def _load_standards(self) -> Dict[str, Any]:
         """Load project structure standards from YAML"""
@@ -29,147 +62,193 @@ class ProjectValidator:
         if not standards_file.exists():
             raise FileNotFoundError(f"Standards file not found: {standards_file}")
             
-        with open(standards_file, 'r') as f:
-            return yaml.safe_load(f)
+        raw = standards_file.read_bytes()
+        self.standards_digest = hashlib.sha256(raw).hexdigest()
+        return yaml.safe_load(raw)
     
-    def detect_project_type(self, project_path: Path) -> str:
+    def check_dependencies(self, check_name: str, project_type: str = None) -> Tuple[List[str], List[str]]:
+        """Files a check depends on, as (paths, content_paths)"""
+        if check_name == "required_files":
+            return rule_paths(self.plan.required_files), []
+        if check_name == "project_type":
+            paths = list(self.PROJECT_TYPE_MARKERS)
+            paths.extend(rule_paths(self.plan.project_types.get(project_type, ())))
+            return paths, []
+        if check_name == "agents_md":
+            return ["AGENTS.md"], ["AGENTS.md"]
+        if check_name == "git_setup":
+            return [".git", ".gitignore"], []
+        raise ValueError(f"Unknown check: {check_name}")
+    
+    def _run_check(self, snapshot: ProjectSnapshot, check_name: str,
+                   check: Callable[[], CheckResults],
+                   project_type: str = None) -> CheckResults:
+        """Run a check through the audit cache, if one is configured"""
+        cache_key = f"structure:{check_name}"
+        if project_type is not None:
+            cache_key += f":{project_type}"
+        with profiling.span(f"structure:{check_name}"):
+            return run_cached(self.cache, snapshot, cache_key,
+                              self.check_dependencies(check_name, project_type),
+                              self.standards_digest, check)
+    
+    def detect_project_type(self, project_path: ProjectLike) -> str:
         """Detect the type of project based on key files"""
-        if (project_path / "astro.config.mjs").exists():
+        project = ProjectSnapshot.of(project_path)
+        if project.exists("astro.config.mjs"):
             return "astro"
-        elif (project_path / "pyproject.toml").exists():
+        elif project.exists("pyproject.toml"):
             return "python"  
-        elif (project_path / "package.json").exists():
+        elif project.exists("package.json"):
             return "nodejs"
         else:
             return "unknown"
     
-    def validate_required_files(self, project_path: Path) -> Tuple[List[str], List[str]]:
-        """Validate required files exist. Returns (passed, failed)"""
-        passed = []
-        failed = []
-        
-        # Check universal required files
-        for file_spec in self.standards.get("required_files", []):
-            file_path = project_path / file_spec["path"]
-            
-            if file_spec.get("type") == "directory":
-                if file_path.is_dir():
-                    passed.append(f"✅ {file_spec['path']} (directory)")
-                else:
-                    failed.append(f"❌ {file_spec['path']} (directory missing)")
-            else:
-                if file_path.exists() and file_path.is_file():
-                    passed.append(f"✅ {file_spec['path']}")
-                else:
-                    failed.append(f"❌ {file_spec['path']}")
-        
-        return passed, failed
+    def validate_required_files(self, project_path: ProjectLike) -> CheckResults:
+        """Validate required files exist"""
+        project = ProjectSnapshot.of(project_path)
+        return run_rules(self.plan.required_files, project)
     
-    def validate_project_type_requirements(self, project_path: Path, project_type: str) -> Tuple[List[str], List[str]]:
+    def validate_project_type_requirements(self, project_path: ProjectLike, project_type: str) -> CheckResults:
         """Validate project-type specific requirements"""
-        passed = []
-        failed = []
+        project = ProjectSnapshot.of(project_path)
         
         if project_type == "unknown":
-            failed.append("❌ Cannot determine project type")
-            return passed, failed
-            
-        type_requirements = self.standards.get("project_types", {}).get(project_type, {})
-        
-        # Check required files for this project type
-        for file_spec in type_requirements.get("required_files", []):
-            file_path = project_path / file_spec["path"]
-            
-            if file_spec.get("type") == "directory":
-                if file_path.is_dir():
-                    passed.append(f"✅ {file_spec['path']} ({project_type} directory)")
-                else:
-                    failed.append(f"❌ {file_spec['path']} ({project_type} directory missing)")
-            else:
-                if file_path.exists() and file_path.is_file():
-                    passed.append(f"✅ {file_spec['path']} ({project_type} file)")
-                else:
-                    failed.append(f"❌ {file_spec['path']} ({project_type} file missing)")
+            results = CheckResults()
+            results.add("structure.project_type", False)
+            return results
         
-        # Check forbidden files for Python projects (UV enforcement)
-        if project_type == "python":
-            forbidden_files = type_requirements.get("forbidden_files", [])
-            for file_spec in forbidden_files:
-                file_path = project_path / file_spec["path"]
-                if file_path.exists():
-                    reason = file_spec.get("reason", "Forbidden for UV projects")
-                    failed.append(f"❌ {file_spec['path']} - {reason}")
-                else:
-                    passed.append(f"✅ No forbidden file: {file_spec['path']}")
+        # Required and forbidden files for this project type
+        return run_rules(self.plan.project_types.get(project_type, ()), project)
+    
+    def validate_nested_forbidden_files(self, project_path: ProjectLike, project_type: str) -> CheckResults:
+        """Check for the project type's forbidden files anywhere below the root"""
+        project = ProjectSnapshot.of(project_path)
+        results = CheckResults()
+        forbidden = [rule for rule in self.plan.project_types.get(project_type, ())
+                     if rule.rule_id == "structure.type_forbidden"]
+        if not forbidden:
+            return results
         
-        return passed, failed
+        walk = project.walk()
+        for rule in forbidden:
+            for path in walk.nested([rule.path]):
+                results.add("structure.type_forbidden", False, path, rule.args)
+        return results
     
-    def validate_agents_md(self, project_path: Path) -> Tuple[List[str], List[str]]:
+    def validate_agents_md(self, project_path: ProjectLike) -> CheckResults:
         """Validate AGENTS.md file content"""
-        passed = []
-        failed = []
-        
-        agents_file = project_path / "AGENTS.md"
+        project = ProjectSnapshot.of(project_path)
+        results = CheckResults()
         
-        if not agents_file.exists():
-            failed.append("❌ AGENTS.md file missing")
-            return passed, failed
+        if not project.exists("AGENTS.md"):
+            results.add("structure.agents_md.exists", False, "AGENTS.md")
+            return results
         
         try:
-            content = agents_file.read_text()
+            scan = project.scan("AGENTS.md")
             
             # Basic content checks
-            required_sections = [
-                "# ",  # Title
-                "## ",  # At least one section header
-            ]
-            
-            for section in required_sections:
-                if section in content:
-                    passed.append(f"✅ AGENTS.md has proper structure")
+            for section in AGENTS_MD_HEADERS:
+                if scan.found(section):
+                    results.add("structure.agents_md.structure", True, "AGENTS.md")
                 else:
-                    failed.append(f"❌ AGENTS.md missing proper structure")
+                    results.add("structure.agents_md.structure", False, "AGENTS.md")
                     break
             
             # Check if not just a template/placeholder
-            if len(content.strip()) < 100:
-                failed.append("❌ AGENTS.md appears to be empty or placeholder")
-            elif "TODO" in content or "PLACEHOLDER" in content.upper():
-                failed.append("❌ AGENTS.md contains TODO/placeholder content")
+            placeholders = sorted(
+                hit for pattern in AGENTS_MD_PLACEHOLDERS + AGENTS_MD_PLACEHOLDERS_ANY_CASE
+                for hit in scan.hits[pattern]
+            )
+            if scan.stripped_length < 100:
+                results.add("structure.agents_md.content", False, "AGENTS.md",
+                            ("appears to be empty or placeholder",))
+            elif placeholders:
+                results.add("structure.agents_md.content", False, "AGENTS.md",
+                            (f"contains TODO/placeholder content (line {placeholders[0].line})",))
             else:
-                passed.append("✅ AGENTS.md has meaningful content")
+                results.add("structure.agents_md.content", True, "AGENTS.md")
                 
         except Exception as e:
-            failed.append(f"❌ Error reading AGENTS.md: {e}")
+            results.add("structure.agents_md.read_error", False, "AGENTS.md", (str(e),))
         
-        return passed, failed
+        return results
     
-    def validate_git_setup(self, project_path: Path) -> Tuple[List[str], List[str]]:
+    def validate_git_setup(self, project_path: ProjectLike) -> CheckResults:
         """Validate git repository setup"""
-        passed = []
-        failed = []
+        project = ProjectSnapshot.of(project_path)
+        results = CheckResults()
         
-        git_dir = project_path / ".git"
-        gitignore_file = project_path / ".gitignore"
+        # Linked worktrees and submodules have a `.git` file pointing at the repository
+        if not (project.is_dir(".git")
+                or project.is_file(".git") and GitRepository.discover(project.path)):
+            results.add("structure.git.repository", False, ".git")
+            return results
+        results.add("structure.git.repository", True, ".git")
         
-        if git_dir.exists() and git_dir.is_dir():
-            passed.append("✅ Git repository initialized")
-        else:
-            failed.append("❌ Not a git repository")
-            return passed, failed
+        results.add("structure.git.gitignore", project.exists(".gitignore"), ".gitignore")
+        return results
+    
+    def validate_git_state(self, project_path: ProjectLike, worktree: bool = True) -> CheckResults:
+        """Validate HEAD, branch naming, upstream sync and tracked changes from .git.
         
-        if gitignore_file.exists():
-            passed.append("✅ .gitignore file present")
-        else:
-            failed.append("❌ .gitignore file missing")
+        With worktree=False the tracked files are not compared with the
+        index, as for a pre-commit hook, where unstaged edits are expected.
+        """
+        project = ProjectSnapshot.of(project_path)
+        results = CheckResults()
+        
+        repository = GitRepository.discover(project.path)
+        if repository is None:
+            # Already reported by validate_git_setup
+            return results
         
-        return passed, failed
+        try:
+            branch, commit = repository.head()
+            if branch is None:
+                results.add("structure.git.head", False, ".git/HEAD", (commit[:12],), WARNING)
+            else:
+                results.add("structure.git.head", True, ".git/HEAD", (branch,), WARNING)
+                results.add("structure.git.branch",
+                            branch in PROTECTED_BRANCHES or bool(BRANCH_PATTERN.match(branch)),
+                            ".git/HEAD", (branch,))
+                
+                # Ahead/behind against the last fetched state of the upstream
+                upstream = repository.upstream(branch)
+                upstream_commit = repository.resolve(upstream) if upstream else None
+                if commit and upstream_commit:
+                    counts = repository.ahead_behind(commit, upstream_commit)
+                    if counts is not None:
+                        name = upstream.replace("refs/remotes/", "", 1)
+                        results.add("structure.git.sync", counts[1] == 0, ".git/HEAD",
+                                    (branch, name) + counts, WARNING)
+            
+            if not worktree:
+                return results
+            modified = repository.modified_files()
+            results.add("structure.git.clean", not modified, "",
+                        (len(modified), ", ".join(modified[:5])), WARNING)
+        except READ_ERRORS as e:
+            results.add("structure.git.read_error", False, ".git", (str(e),), WARNING)
+        return results
     
-    def audit_project(self, project_path: str) -> Dict[str, Any]:
-        """Perform complete project audit"""
+    def audit_project(self, project_path: str, snapshot: ProjectSnapshot = None,
+                      checks: Iterable[str] = AUDIT_CHECKS,
+                      reuse: Dict[str, CheckResults] = None,
+                      outcomes: Dict[str, CheckResults] = None,
+                      on_check: Callable[[str, CheckResults], None] = None) -> Dict[str, Any]:
+        """Perform a project audit, limited to the named checks (default: all).
+        
+        Checks named in reuse take their outcome from it instead of running;
+        every check's outcome is also recorded in outcomes, when given, and
+        passed to on_check(check_name, outcome) as soon as the check finishes.
+        """
         project_path = Path(project_path)
+        if snapshot is None:
+            snapshot = ProjectSnapshot(project_path)
         
-        if not project_path.exists():
+        if not snapshot.root_exists:
             return {
                 "error": f"Project path does not exist: {project_path}",
                 "score": 0,
@@ -177,47 +256,73 @@ class ProjectValidator:
             }
         
         # Detect project type
-        project_type = self.detect_project_type(project_path)
+        project_type = self.detect_project_type(snapshot)
         
-        # Run all validations
-        all_passed = []
-        all_failed = []
+        # Run the requested validations
+        checks = frozenset(checks)
+        results = CheckResults()
+        
+        def run(check_name: str, check: Callable[[], CheckResults]):
+            if check_name not in checks:
+                return
+            outcome = reuse[check_name] if reuse and check_name in reuse else check()
+            if outcomes is not None:
+                outcomes[check_name] = outcome
+            results.extend(outcome)
+            if on_check is not None:
+                on_check(check_name, outcome)
         
         # Required files validation
-        passed, failed = self.validate_required_files(project_path)
-        all_passed.extend(passed)
-        all_failed.extend(failed)
+        run("required_files", lambda: self._run_check(
+            snapshot, "required_files",
+            lambda: self.validate_required_files(snapshot)))
         
         # Project type specific validation
-        passed, failed = self.validate_project_type_requirements(project_path, project_type)
-        all_passed.extend(passed)
-        all_failed.extend(failed)
+        run("project_type", lambda: self._run_check(
+            snapshot, "project_type",
+            lambda: self.validate_project_type_requirements(snapshot, project_type),
+            project_type))
+        
+        # Forbidden files in subdirectories; not cached since they depend on the whole tree
+        def nested_forbidden_files() -> CheckResults:
+            with profiling.span("structure:nested_forbidden_files"):
+                return self.validate_nested_forbidden_files(snapshot, project_type)
+        run("nested_forbidden_files", nested_forbidden_files)
         
         # AGENTS.md validation
-        passed, failed = self.validate_agents_md(project_path)
-        all_passed.extend(passed)
-        all_failed.extend(failed)
+        run("agents_md", lambda: self._run_check(
+            snapshot, "agents_md",
+            lambda: self.validate_agents_md(snapshot)))
         
         # Git setup validation
-        passed, failed = self.validate_git_setup(project_path)
-        all_passed.extend(passed)
-        all_failed.extend(failed)
+        run("git_setup", lambda: self._run_check(
+            snapshot, "git_setup",
+            lambda: self.validate_git_setup(snapshot)))
+        
+        # Git state; not cached since it depends on .git internals and every tracked file
+        def git_state() -> CheckResults:
+            with profiling.span("structure:git_state"):
+                return self.validate_git_state(snapshot)
+        run("git_state", git_state)
         
         # Calculate score
-        total_checks = len(all_passed) + len(all_failed)
-        score = len(all_passed)
+        score, total_checks = results.scored
         percentage = (score / total_checks * 100) if total_checks > 0 else 0
         
-        return {
+        result = {
             "project_path": str(project_path),
             "project_type": project_type,
-            "passed": all_passed,
-            "failed": all_failed,
+            "checks": results.to_dict(),
             "score": score,
             "total": total_checks,
+            "warnings": results.warning_count,
             "percentage": percentage,
             "quality_level": self._get_quality_level(percentage)
         }
+        if snapshot.walked:
+            # Files seen and whether a depth/file budget cut the walk short
+            result["tree_walk"] = snapshot.walk().to_dict()
+        return result
     
     def _get_quality_level(self, percentage: float) -> str:
         """Get quality level based on percentage score"""
@@ -239,15 +344,20 @@ def main():
     
     parser = argparse.ArgumentParser(description="Project Structure Validator")
     parser.add_argument("project_path", help="Path to project to validate")
-    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--format", choices=FORMATS, default="text",
+                        help="Output format: text, a JSON document, or streamed NDJSON records")
+    parser.add_argument("--json", action="store_const", const="json", dest="format",
+                        help="Same as --format json")
     
     args = parser.parse_args()
     
     validator = ProjectValidator()
     result = validator.audit_project(args.project_path)
     
-    if args.json:
-        print(json.dumps(result, indent=2))
+    if args.format == "json":
+        write_json(result)
+    elif args.format == "ndjson":
+        write_ndjson(validator_records("structure", result))
     else:
         if "error" in result:
             print(f"Error: {result['error']}")
@@ -256,17 +366,28 @@ def main():
         print(f"Project: {result['project_path']}")
         print(f"Type: {result['project_type']}")
         print(f"Score: {result['score']}/{result['total']} ({result['percentage']:.1f}%)")
+        if result.get('warnings'):
+            print(f"Warnings: {result['warnings']} (not scored)")
         print(f"Quality: {result['quality_level']}")
         print()
         
-        if result['passed']:
+        passed = render_checks(result['checks'], passed=True)
+        failed = render_checks(result['checks'], passed=False, severity=ERROR)
+        warnings = render_checks(result['checks'], passed=False, severity=WARNING)
+        
+        if passed:
             print("✅ Passed Checks:")
-            for check in result['passed']:
+            for check in passed:
                 print(f"  {check}")
         
-        if result['failed']:
+        if failed:
             print("\n❌ Failed Checks:")  
-            for check in result['failed']:
+            for check in failed:
+                print(f"  {check}")
+        
+        if warnings:
+            print("\n⚠️ Warnings (not scored):")
+            for check in warnings:
                 print(f"  {check}")
         
         if result['percentage'] >= 75:
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Toolchain Probe
+
+Resolves external tools such as `uv` once per process and remembers the
+`--version` answer on disk, keyed on the resolved binary path and its
+mtime. Audits reuse the resulting ToolchainInfo, so the hot path spawns
+no subprocesses unless the binary itself has changed.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Dict, Optional
+
+from audit_cache import default_cache_dir
+import profiling
+
+PROBE_TIMEOUT = 5
+
+# Tool name -> ToolchainInfo, resolved at most once per process
+_process_cache: Dict[str, "ToolchainInfo"] = {}
+
+
+class ToolchainInfo:
+    """Result of probing an external tool"""
+
+    __slots__ = ("name", "path", "mtime_ns", "installed", "version", "message")
+
+    def __init__(self, name: str, path: Optional[str], mtime_ns: Optional[int],
+                 installed: bool, version: str, message: str):
+        self.name = name
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.installed = installed
+        self.version = version
+        self.message = message
+
+    def to_dict(self) -> Dict[str, object]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"ToolchainInfo({self.name!r}, installed={self.installed}, version={self.version!r})"
+
+
+def default_toolchain_cache() -> Path:
+    return default_cache_dir() / "toolchain.json"
+
+
+def _load_disk_cache(cache_file: Path) -> Dict[str, dict]:
+    try:
+        with open(cache_file) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _store_disk_cache(cache_file: Path, data: Dict[str, dict]):
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+def _run_version(name: str, path: str, mtime_ns: int) -> Optional[ToolchainInfo]:
+    profiling.count("spawns")
+    try:
+        result = subprocess.run([path, "--version"], capture_output=True, text=True,
+                                timeout=PROBE_TIMEOUT)
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+
+    if result.returncode == 0:
+        version = result.stdout.strip()
+        return ToolchainInfo(name, path, mtime_ns, True, version,
+                             f"{name.upper()} installed: {version}")
+    return ToolchainInfo(name, path, mtime_ns, False, "", f"{name.upper()} command failed")
+
+
+def probe_tool(name: str, cache_file: Optional[Path] = None) -> ToolchainInfo:
+    """Resolve a tool and its version, using the process and disk caches"""
+    if name in _process_cache:
+        return _process_cache[name]
+
+    with profiling.span(f"toolchain:{name}"):
+        return _probe(name, cache_file)
+
+
+def _probe(name: str, cache_file: Optional[Path]) -> ToolchainInfo:
+    """Uncached part of probe_tool()"""
+    not_found = ToolchainInfo(name, None, None, False, "",
+                              f"{name.upper()} not installed or not in PATH")
+
+    # Locating the binary only stats PATH entries; no process is spawned
+    found = shutil.which(name)
+    if found is None:
+        _process_cache[name] = not_found
+        return not_found
+
+    path = os.path.realpath(found)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        _process_cache[name] = not_found
+        return not_found
+
+    cache_file = cache_file or default_toolchain_cache()
+    disk_cache = _load_disk_cache(cache_file)
+    entry = disk_cache.get(name)
+    if entry and entry.get("path") == path and entry.get("mtime_ns") == mtime_ns:
+        info = ToolchainInfo(**entry)
+    else:
+        info = _run_version(name, path, mtime_ns)
+        if info is None:
+            # Timeouts are not cached; the next process probes again
+            info = not_found
+        else:
+            disk_cache[name] = info.to_dict()
+            _store_disk_cache(cache_file, disk_cache)
+
+    _process_cache[name] = info
+    return info
+
+
+def get_uv_toolchain() -> ToolchainInfo:
+    """ToolchainInfo for `uv`"""
+    return probe_tool("uv")
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Pruned Tree Walker
+
+Finds files by name anywhere in a project in one traversal. Directories
+are listed level by level with os.scandir(), each level fanned out over
+a thread pool, and only d_type information is used, so files are never
+stat-ed. Tool-owned trees (node_modules/, .venv/, caches, ...) and
+anything the project's .gitignore files exclude are pruned before they
+are listed, so the cost follows the tracked files rather than everything
+on disk. Depth and file-count budgets bound the walk on huge trees.
+
+Budgets default to START_WALK_MAX_DEPTH / START_WALK_MAX_FILES from the
+environment, so fleet workers and the daemon inherit them.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from gitignore import GitignoreMatcher
+import profiling
+
+DEFAULT_MAX_DEPTH = 8
+DEFAULT_MAX_FILES = 50_000
+DEFAULT_WORKERS = 8
+
+# Levels with fewer directories than this are listed inline
+PARALLEL_THRESHOLD = 4
+
+# Owned by tools rather than the project; never descended into, whatever
+# .gitignore says. Directories a project may track (build/, vendor/, ...)
+# are left to .gitignore.
+PRUNED_DIRS = frozenset({
+    ".git", ".hg", ".svn", "node_modules", ".venv", "venv", "__pycache__",
+    "site-packages", ".tox", ".nox", ".mypy_cache", ".pytest_cache",
+})
+
+# File names registered by validators; one walk answers all of them
+_registered: Set[str] = set()
+
+
+def register_names(names: Iterable[str]):
+    """Add file names that snapshot walks should look for"""
+    _registered.update(names)
+
+
+def registered_names() -> frozenset:
+    return frozenset(_registered)
+
+
+def budget(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+class WalkResult:
+    """Paths of matching files plus walk statistics"""
+
+    __slots__ = ("matches", "files", "dirs", "pruned", "truncated")
+
+    def __init__(self):
+        self.matches: Dict[str, List[str]] = {}
+        self.files = 0
+        self.dirs = 0
+        self.pruned = 0
+        # None, "depth" or "files" when a budget cut the walk short
+        self.truncated: Optional[str] = None
+
+    def nested(self, names: Iterable[str]) -> List[str]:
+        """Matches for the given names below the project root, sorted"""
+        return sorted(path for name in names for path in self.matches.get(name, ())
+                      if "/" in path)
+
+    def to_dict(self) -> Dict[str, object]:
+        return {"files": self.files, "dirs": self.dirs, "pruned": self.pruned,
+                "truncated": self.truncated}
+
+
+def _list_dir(root: str, relative_dir: str) -> List[Tuple[str, bool]]:
+    try:
+        with os.scandir(os.path.join(root, relative_dir) if relative_dir else root) as entries:
+            listing = []
+            for entry in entries:
+                try:
+                    listing.append((entry.name, entry.is_dir(follow_symlinks=False)))
+                except OSError:
+                    listing.append((entry.name, False))
+            return listing
+    except OSError:
+        return []
+
+
+def walk_tree(root, names: Iterable[str], max_depth: Optional[int] = None,
+              max_files: Optional[int] = None, workers: int = DEFAULT_WORKERS,
+              matcher: Optional[GitignoreMatcher] = None) -> WalkResult:
+    """Find every non-ignored file whose name is in `names`"""
+    root = str(root)
+    names = frozenset(names)
+    if max_depth is None:
+        max_depth = budget("START_WALK_MAX_DEPTH", DEFAULT_MAX_DEPTH)
+    if max_files is None:
+        max_files = budget("START_WALK_MAX_FILES", DEFAULT_MAX_FILES)
+    matcher = matcher or GitignoreMatcher(root)
+
+    result = WalkResult()
+    level = [""]
+    depth = 0
+    pool = None
+    try:
+        while level:
+            # Counted here: pool threads have no open span
+            profiling.count("listings", len(level))
+            if len(level) >= PARALLEL_THRESHOLD:
+                if pool is None:
+                    pool = ThreadPoolExecutor(max_workers=workers)
+                listings = pool.map(lambda relative_dir: _list_dir(root, relative_dir), level)
+            else:
+                listings = (_list_dir(root, relative_dir) for relative_dir in level)
+
+            next_level = []
+            for relative_dir, listing in zip(level, listings):
+                if not any(name == ".gitignore" for name, _ in listing):
+                    # Spares the matcher a failed open() per directory
+                    matcher.mark_absent(relative_dir)
+                for name, is_dir in listing:
+                    path = f"{relative_dir}/{name}" if relative_dir else name
+                    if is_dir:
+                        if name in PRUNED_DIRS or matcher.match(path, True):
+                            result.pruned += 1
+                        elif depth < max_depth:
+                            result.dirs += 1
+                            next_level.append(path)
+                        else:
+                            result.truncated = "depth"
+                        continue
+
+                    result.files += 1
+                    if name in names and not matcher.match(path, False):
+                        result.matches.setdefault(name, []).append(path)
+
+                if result.files >= max_files:
+                    result.truncated = "files"
+                    return result
+
+            level = next_level
+            depth += 1
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+    return result
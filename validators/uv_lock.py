@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+uv.lock Consistency
+
+Checks that a uv.lock still matches its pyproject.toml without running
+`uv lock --check`. The lock is never parsed as a whole: one scan for
+`[[package]]` headers indexes every package by name and version, and only
+the project's own entry is handed to the TOML parser. Its
+`[package.metadata] requires-dist` records the requirements the lock was
+resolved from, which are compared with project.dependencies and
+project.optional-dependencies. Environment markers other than extras are
+not compared, since uv rewrites them when locking.
+"""
+
+import hashlib
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from check_results import CheckResults, WARNING
+from documents import toml_module
+
+# Bumped whenever the verdict produced for the same inputs changes
+LOCK_CHECK_FORMAT = "1"
+
+PACKAGE_HEADER = b"\n[[package]]\n"
+
+# uv writes every entry as [[package]], name, then version (absent for
+# some virtual packages)
+PACKAGE_ENTRY = re.compile(rb'\n\[\[package\]\]\nname = "([^"]+)"\n(?:version = "([^"]+)"\n)?')
+NAME_SEPARATORS = re.compile(r"[-_.]+")
+REQUIREMENT = re.compile(r"^\s*([A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)\s*(?:\[([^\]]*)\])?(.*)$")
+EXTRA_MARKER = re.compile(r"""\bextra\s*==\s*['"]([^'"]+)['"]""")
+
+Requirement = Tuple[Optional[str], str, Tuple[str, ...], str]
+
+
+class LockError(ValueError):
+    """uv.lock could not be read as a lockfile"""
+
+
+def normalize_name(name: str) -> str:
+    """PEP 503 normalised package name, as uv writes it"""
+    return NAME_SEPARATORS.sub("-", name).lower()
+
+
+def normalize_specifier(specifier: str) -> str:
+    """Order- and whitespace-insensitive form of a version specifier"""
+    parts = [part for part in re.sub(r"\s+", "", specifier).strip("()").split(",") if part]
+    return ",".join(sorted(parts))
+
+
+def lock_key(pyproject: bytes, lock: bytes) -> str:
+    """Verdict cache key from both files' content"""
+    digest = hashlib.sha256(pyproject).hexdigest() + ":" + hashlib.sha256(lock).hexdigest()
+    return f"uv.lock:{LOCK_CHECK_FORMAT}:{digest}"
+
+
+def parse_requirement(requirement: str, group: Optional[str] = None) -> Requirement:
+    """(extra group, name, extras, specifier) for a PEP 508 requirement string"""
+    body = requirement.split(";", 1)[0]
+    match = REQUIREMENT.match(body)
+    if match is None:
+        raise LockError(f"Invalid requirement: {requirement!r}")
+    name, extras, rest = match.groups()
+    rest = rest.strip()
+    # Direct references (name @ url) have no version specifier
+    specifier = "" if rest.startswith("@") else normalize_specifier(rest)
+    extras = tuple(sorted(normalize_name(extra) for extra in (extras or "").split(",")
+                          if extra.strip()))
+    return (group and normalize_name(group), normalize_name(name), extras, specifier)
+
+
+def _locked_requirement(entry: Dict[str, Any]) -> Requirement:
+    """The same tuple for a requires-dist entry of uv.lock"""
+    marker = EXTRA_MARKER.search(entry.get("marker", ""))
+    return (marker and normalize_name(marker.group(1)), normalize_name(entry["name"]),
+            tuple(sorted(normalize_name(extra) for extra in entry.get("extras", ()))),
+            normalize_specifier(entry.get("specifier", "")))
+
+
+class LockIndex:
+    """Packages of a uv.lock indexed by name; entries are parsed on demand"""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        # name -> [(version, start, end)] byte ranges of each [[package]] entry
+        self.packages: Dict[str, List[Tuple[str, int, int]]] = {}
+
+        # Every lock starts with its version header, so entries follow a newline
+        entries = []
+        position = data.find(PACKAGE_HEADER)
+        while position != -1:
+            match = PACKAGE_ENTRY.match(data, position)
+            if match is None:
+                raise LockError(f"Package entry without a leading name at byte {position + 1}")
+            entries.append((position + 1, match.group(1).decode(),
+                            (match.group(2) or b"").decode()))
+            position = data.find(PACKAGE_HEADER, match.end())
+        self.header_end = entries[0][0] if entries else len(data)
+
+        for index, (start, name, version) in enumerate(entries):
+            end = entries[index + 1][0] if index + 1 < len(entries) else len(data)
+            self.packages.setdefault(normalize_name(name), []).append((version, start, end))
+
+        self.header = self._parse(data[:self.header_end])
+        if "version" not in self.header:
+            raise LockError("Not a uv lockfile (no version)")
+
+    @staticmethod
+    def _parse(data: bytes) -> Dict[str, Any]:
+        toml = toml_module()
+        if toml is None:
+            raise ImportError("No TOML parser available (install tomli on Python < 3.11)")
+        try:
+            return toml.loads(data.decode())
+        except (UnicodeDecodeError, ValueError) as e:
+            raise LockError(str(e)) from e
+
+    def entries(self, name: str) -> List[Dict[str, Any]]:
+        """Parsed [[package]] entries for a package name"""
+        return [self._parse(self.data[start:end])["package"][0]
+                for _, start, end in self.packages.get(normalize_name(name), ())]
+
+    def project_entry(self, name: str) -> Optional[Dict[str, Any]]:
+        """The entry of the project itself: its editable or virtual source, if several"""
+        entries = self.entries(name)
+        for entry in entries:
+            source = entry.get("source", {})
+            if "editable" in source or "virtual" in source:
+                return entry
+        return entries[0] if entries else None
+
+    def duplicates(self) -> List[str]:
+        """Packages locked more than once.
+
+        Forked resolutions (resolution-markers) may lock several versions
+        of one package; only a repeated version counts there.
+        """
+        forked = "resolution-markers" in self.header
+        duplicates = []
+        for name, versions in self.packages.items():
+            seen = [version for version, _, _ in versions]
+            if len(seen) > 1 and (not forked or len(set(seen)) < len(seen)):
+                duplicates.extend(f"{name}=={version}" for version in sorted(set(seen))
+                                  if not forked or seen.count(version) > 1)
+        return sorted(duplicates)
+
+
+def project_requirements(project: Dict[str, Any]) -> List[Requirement]:
+    """Requirements declared in a pyproject [project] table"""
+    requirements = [parse_requirement(requirement)
+                    for requirement in project.get("dependencies", ())]
+    for group, group_requirements in project.get("optional-dependencies", {}).items():
+        requirements.extend(parse_requirement(requirement, group)
+                            for requirement in group_requirements)
+    return requirements
+
+
+def locked_requirements(entry: Dict[str, Any]) -> Optional[List[Requirement]]:
+    """Requirements the lock was resolved from, or None for locks without metadata"""
+    metadata = entry.get("metadata", {})
+    if "requires-dist" not in metadata:
+        return None
+    return [_locked_requirement(requirement) for requirement in metadata["requires-dist"]]
+
+
+def _locked_names(entry: Dict[str, Any]) -> List[Requirement]:
+    """The project's locked dependencies without specifiers, for old lock formats"""
+    names = [(None, normalize_name(dependency["name"]), (), "")
+             for dependency in entry.get("dependencies", ())]
+    for group, dependencies in entry.get("optional-dependencies", {}).items():
+        names.extend((normalize_name(group), normalize_name(dependency["name"]), (), "")
+                     for dependency in dependencies)
+    return names
+
+
+def _describe(requirement: Requirement) -> str:
+    group, name, extras, specifier = requirement
+    text = name + (f"[{','.join(extras)}]" if extras else "") + specifier
+    return f"{text} ({group})" if group else text
+
+
+def _difference(declared: Iterable[Requirement], locked: Iterable[Requirement]) -> List[str]:
+    """'+x' for declared-only, '-x' for locked-only requirements, as multisets"""
+    remaining = list(locked)
+    added = []
+    for requirement in declared:
+        if requirement in remaining:
+            remaining.remove(requirement)
+        else:
+            added.append(requirement)
+    return sorted([f"+{_describe(requirement)}" for requirement in added] +
+                  [f"-{_describe(requirement)}" for requirement in remaining])
+
+
+def check_lock(pyproject: Dict[str, Any], lock: bytes) -> CheckResults:
+    """Compare a parsed pyproject.toml with raw uv.lock content"""
+    results = CheckResults()
+    try:
+        index = LockIndex(lock)
+    except LockError as e:
+        results.add("uv.lock.parse_error", False, "uv.lock", (str(e),), WARNING)
+        return results
+
+    project = pyproject.get("project", {})
+    name = project.get("name")
+
+    # requires-python is copied into the lock header
+    declared_python = project.get("requires-python")
+    if declared_python is not None:
+        locked_python = index.header.get("requires-python", "")
+        results.add("uv.lock.requires_python",
+                    normalize_specifier(declared_python) == normalize_specifier(locked_python),
+                    "uv.lock", (declared_python, locked_python or "none"), WARNING)
+
+    try:
+        declared = project_requirements(project)
+    except LockError as e:
+        results.add("uv.lock.parse_error", False, "pyproject.toml", (str(e),), WARNING)
+        declared = None
+
+    entry = index.project_entry(name) if name else None
+    if name:
+        results.add("uv.lock.project", entry is not None, "uv.lock", (name,), WARNING)
+
+    if entry is not None and declared is not None:
+        try:
+            locked = locked_requirements(entry)
+            if locked is None:
+                # Only names and extra groups were locked; compare those
+                changes = _difference([(group, name, (), "") for group, name, _, _ in declared],
+                                      _locked_names(entry))
+            else:
+                changes = _difference(declared, locked)
+        except (KeyError, TypeError) as e:
+            results.add("uv.lock.parse_error", False, "uv.lock", (f"malformed entry: {e}",),
+                        WARNING)
+        else:
+            results.add("uv.lock.stale", not changes, "uv.lock",
+                        (len(changes), ", ".join(changes[:5])), WARNING)
+
+    if declared is not None:
+        missing = sorted({requirement[1] for requirement in declared} - index.packages.keys())
+        results.add("uv.lock.missing", not missing, "uv.lock",
+                    (len(missing), ", ".join(missing[:5])), WARNING)
+
+    duplicates = index.duplicates()
+    results.add("uv.lock.duplicate", not duplicates, "uv.lock",
+                (len(duplicates), ", ".join(duplicates[:5])), WARNING)
+    return results
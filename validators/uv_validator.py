@@ -9,22 +9,79 @@ Validates that Python projects strictly follow UV-first requirements:
 - Proper pyproject.toml configuration
 """
 
-import subprocess
+import hashlib
 import yaml
 from pathlib import Path
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional, Union, Callable, Iterable
 import re
 
+from project_snapshot import ProjectSnapshot
+from audit_cache import AuditCache, run_cached
+from rule_engine import compile_uv_plan, run_rules, rule_paths
+from check_results import CheckResults, ERROR, WARNING, render_checks
+from audit_output import FORMATS, validator_records, write_json, write_ndjson
+from toolchain import ToolchainInfo, get_uv_toolchain
+from content_scanner import register_patterns
+from documents import toml_module
+from gitignore import GitignoreMatcher
+from tree_walker import register_names
+from uv_lock import check_lock, lock_key
+import profiling
+
+ProjectLike = Union[str, Path, ProjectSnapshot]
+
+# Marker files that identify a Python project
+PYTHON_PROJECT_FILES = ["pyproject.toml", "setup.py", "requirements.txt", "Pipfile"]
+
+# Legacy Python dependency files that must not exist in UV projects
+LEGACY_FILES = [
+    "requirements.txt",
+    "requirements-dev.txt", 
+    "dev-requirements.txt",
+    "setup.py",
+    "setup.cfg",
+    "Pipfile",
+    "Pipfile.lock",
+    "environment.yml",  # conda
+    "conda.yaml"
+]
+
+# .gitignore entries -> directories that must actually be ignored, at the
+# project root and inside the source tree
+GITIGNORE_PROBES = {
+    ".venv/": (".venv",),
+    "*.egg-info/": ("project.egg-info", "src/project.egg-info"),
+    "__pycache__/": ("__pycache__", "src/__pycache__"),
+}
+GITIGNORE_FILES = [".gitignore", "src/.gitignore"]
+
+# Checks run by validate_uv_compliance(), in report order
+UV_CHECKS = ("uv_installed", "project_structure", "pyproject_toml", "lock_file", "gitignore",
+             "agents_md_uv_section", "legacy_files", "nested_legacy_files")
+
+# AGENTS.md content rules, scanned in the same pass as the structure rules
+UV_INDICATORS = ("UV-ONLY", "uv pip install", "uv run", "MANDATORY", "UV-First")
+FORBIDDEN_PATTERNS = ("pip install", "python -m pip", "python script.py", "pytest", "python -m venv")
+# A forbidden command is allowed when `uv run` appears this close to it
+UV_RUN_WINDOW = (20, 50)
+register_patterns("AGENTS.md", UV_INDICATORS + FORBIDDEN_PATTERNS)
+
+# Legacy files are also searched for below the project root
+register_names(LEGACY_FILES)
+
 class UVValidator:
     """Validates UV-first Python project compliance"""
     
-    def __init__(self, standards_dir: Path = None):
+    def __init__(self, standards_dir: Path = None, cache: AuditCache = None):
         if standards_dir is None:
             self.standards_dir = Path(__file__).parent.parent / "standards"
         else:
             self.standards_dir = Path(standards_dir)
             
+        self.cache = cache
         self.uv_requirements = self._load_uv_requirements()
+        # Path rules are compiled once; audits only evaluate the plan
+        self.plan = compile_uv_plan(self.uv_requirements, LEGACY_FILES)
     
     def _load_uv_requirements(self) -> Dict[str, Any]:
         """Load UV requirements from YAML"""
@@ -32,289 +89,310 @@ class UVValidator:
         if not uv_file.exists():
             raise FileNotFoundError(f"UV requirements file not found: {uv_file}")
             
-        with open(uv_file, 'r') as f:
-            return yaml.safe_load(f)
+        raw = uv_file.read_bytes()
+        self.standards_digest = hashlib.sha256(raw).hexdigest()
+        return yaml.safe_load(raw)
+    
+    def check_dependencies(self, check_name: str) -> Tuple[List[str], List[str]]:
+        """Files a check depends on, as (paths, content_paths)"""
+        if check_name == "project_structure":
+            return rule_paths(self.plan.project_structure), []
+        if check_name == "pyproject_toml":
+            return ["pyproject.toml"], ["pyproject.toml"]
+        if check_name == "lock_file":
+            return [], ["pyproject.toml", "uv.lock"]
+        if check_name == "gitignore":
+            return GITIGNORE_FILES, GITIGNORE_FILES
+        if check_name == "agents_md_uv_section":
+            return ["AGENTS.md"], ["AGENTS.md"]
+        if check_name == "legacy_files":
+            return rule_paths(self.plan.legacy_files), []
+        raise ValueError(f"Unknown check: {check_name}")
+    
+    def _run_check(self, snapshot: ProjectSnapshot, check_name: str,
+                   check: Callable[[], CheckResults]) -> CheckResults:
+        """Run a check through the audit cache, if one is configured"""
+        with profiling.span(f"uv:{check_name}"):
+            return run_cached(self.cache, snapshot, f"uv:{check_name}",
+                              self.check_dependencies(check_name),
+                              self.standards_digest, check)
+    
+    @property
+    def toolchain(self) -> ToolchainInfo:
+        """The resolved `uv` binary, probed once per process"""
+        return get_uv_toolchain()
     
     def check_uv_installed(self) -> Tuple[bool, str]:
         """Check if UV is installed and accessible"""
-        try:
-            result = subprocess.run(['uv', '--version'], 
-                                  capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                version = result.stdout.strip()
-                return True, f"UV installed: {version}"
-            else:
-                return False, "UV command failed"
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False, "UV not installed or not in PATH"
+        toolchain = self.toolchain
+        return toolchain.installed, toolchain.message
     
-    def validate_project_structure(self, project_path: Path) -> Tuple[List[str], List[str]]:
+    def validate_project_structure(self, project_path: ProjectLike) -> CheckResults:
         """Validate UV-compliant project structure"""
-        passed = []
-        failed = []
-        
-        # Check required files
-        required_files = self.uv_requirements.get("required_files", [])
-        for file_spec in required_files:
-            file_path = project_path / file_spec["path"]
-            
-            if file_spec.get("type") == "directory":
-                if file_path.is_dir():
-                    passed.append(f"✅ {file_spec['path']} directory exists")
-                else:
-                    failed.append(f"❌ {file_spec['path']} directory missing")
-            else:
-                if file_path.exists():
-                    passed.append(f"✅ {file_spec['path']} exists")
-                else:
-                    failed.append(f"❌ {file_spec['path']} missing")
-        
-        # Check forbidden files
-        forbidden_files = self.uv_requirements.get("forbidden_files", [])
-        for file_spec in forbidden_files:
-            file_path = project_path / file_spec["path"]
-            
-            if file_path.exists():
-                reason = file_spec.get("reason", "Forbidden file")
-                alternative = file_spec.get("alternative", "Use UV-compatible approach")
-                failed.append(f"❌ {file_spec['path']} found - {reason}")
-                failed.append(f"   → Use instead: {alternative}")
-            else:
-                passed.append(f"✅ No forbidden file: {file_spec['path']}")
+        project = ProjectSnapshot.of(project_path)
         
-        return passed, failed
+        # Required and forbidden files
+        return run_rules(self.plan.project_structure, project)
     
-    def validate_pyproject_toml(self, project_path: Path) -> Tuple[List[str], List[str]]:
+    def validate_pyproject_toml(self, project_path: ProjectLike) -> CheckResults:
         """Validate pyproject.toml for UV compliance"""
-        passed = []
-        failed = []
+        project = ProjectSnapshot.of(project_path)
+        results = CheckResults()
         
-        pyproject_path = project_path / "pyproject.toml"
+        if not project.exists("pyproject.toml"):
+            results.add("uv.pyproject.exists", False, "pyproject.toml")
+            return results
         
-        if not pyproject_path.exists():
-            failed.append("❌ pyproject.toml missing (REQUIRED for UV projects)")
-            return passed, failed
+        if toml_module() is None:
+            results.add("uv.pyproject.parser", False, "pyproject.toml")
+            return results
         
         try:
-            import tomllib
-        except ImportError:
-            try:
-                import tomli as tomllib
-            except ImportError:
-                failed.append("❌ Cannot parse pyproject.toml - install tomllib/tomli")
-                return passed, failed
-        
-        try:
-            with open(pyproject_path, 'rb') as f:
-                pyproject_data = tomllib.load(f)
+            pyproject_data = project.document("pyproject.toml", self.cache)
             
             # Check for project section
             if "project" in pyproject_data:
-                passed.append("✅ [project] section exists")
+                results.add("uv.pyproject.project_section", True, "pyproject.toml")
                 
                 project_section = pyproject_data["project"]
                 required_fields = ["name", "version", "description"]
                 
                 for field in required_fields:
-                    if field in project_section:
-                        passed.append(f"✅ project.{field} defined")
-                    else:
-                        failed.append(f"❌ project.{field} missing")
+                    results.add("uv.pyproject.field", field in project_section,
+                                "pyproject.toml", (field,))
                 
                 # Check dependencies section
-                if "dependencies" in project_section:
-                    passed.append("✅ project.dependencies defined")
-                else:
-                    failed.append("❌ project.dependencies missing (use instead of requirements.txt)")
+                results.add("uv.pyproject.dependencies", "dependencies" in project_section,
+                            "pyproject.toml")
                     
             else:
-                failed.append("❌ [project] section missing in pyproject.toml")
+                results.add("uv.pyproject.project_section", False, "pyproject.toml")
             
             # Check for build system
-            if "build-system" in pyproject_data:
-                passed.append("✅ [build-system] section exists")
-            else:
-                failed.append("❌ [build-system] section missing")
+            results.add("uv.pyproject.build_system", "build-system" in pyproject_data,
+                        "pyproject.toml")
                 
         except Exception as e:
-            failed.append(f"❌ Error parsing pyproject.toml: {e}")
+            results.add("uv.pyproject.parse_error", False, "pyproject.toml", (str(e),))
+        
+        return results
+    
+    def validate_lock_file(self, project_path: ProjectLike) -> CheckResults:
+        """Validate that uv.lock matches pyproject.toml, without running uv"""
+        project = ProjectSnapshot.of(project_path)
+        results = CheckResults()
         
-        return passed, failed
+        # uv.lock is optional; only an existing lock is checked
+        if not project.is_file("uv.lock") or not project.is_file("pyproject.toml"):
+            return results
+        
+        try:
+            lock = project.read_bytes("uv.lock")
+            key = lock_key(project.read_bytes("pyproject.toml"), lock)
+        except OSError as e:
+            results.add("uv.lock.read_error", False, "uv.lock", (str(e),), WARNING)
+            return results
+        
+        # Verdicts are keyed on content, so touched files and checkouts still hit
+        if self.cache is not None:
+            cached = self.cache.get_verdict(key)
+            if cached is not None:
+                profiling.count("cache_hits")
+                return cached
+        
+        try:
+            pyproject_data = project.document("pyproject.toml", self.cache)
+        except (ValueError, ImportError):
+            # Reported by the pyproject.toml check
+            return results
+        
+        with profiling.span("uv:lock_index"):
+            results = check_lock(pyproject_data, lock)
+        if self.cache is not None:
+            self.cache.put_verdict(key, results)
+        return results
     
-    def validate_gitignore(self, project_path: Path) -> Tuple[List[str], List[str]]:
+    def validate_gitignore(self, project_path: ProjectLike) -> CheckResults:
         """Validate .gitignore has UV-specific entries"""
-        passed = []
-        failed = []
+        project = ProjectSnapshot.of(project_path)
+        results = CheckResults()
         
-        gitignore_path = project_path / ".gitignore"
+        if not project.exists(".gitignore"):
+            results.add("uv.gitignore.exists", False, ".gitignore")
+            return results
         
-        if not gitignore_path.exists():
-            failed.append("❌ .gitignore missing")
-            return passed, failed
+        def read(relative_path: str) -> Optional[str]:
+            return project.read_text(relative_path) if project.is_file(relative_path) else None
         
         try:
-            gitignore_content = gitignore_path.read_text()
-            
-            required_entries = [".venv/", "*.egg-info/", "__pycache__/"]
-            
-            for entry in required_entries:
-                if entry in gitignore_content:
-                    passed.append(f"✅ .gitignore contains {entry}")
-                else:
-                    failed.append(f"❌ .gitignore missing {entry}")
+            # Evaluate the rules as git would, including negations and src/.gitignore
+            matcher = GitignoreMatcher(project.path, read)
+            for entry, probes in GITIGNORE_PROBES.items():
+                ignored = all(matcher.is_ignored(probe, is_dir=True) for probe in probes)
+                results.add("uv.gitignore.entry", ignored, ".gitignore", (entry,))
                     
         except Exception as e:
-            failed.append(f"❌ Error reading .gitignore: {e}")
+            results.add("uv.gitignore.read_error", False, ".gitignore", (str(e),))
         
-        return passed, failed
+        return results
     
-    def validate_agents_md_uv_section(self, project_path: Path) -> Tuple[List[str], List[str]]:
+    def validate_agents_md_uv_section(self, project_path: ProjectLike) -> CheckResults:
         """Validate AGENTS.md has UV-first requirements section"""
-        passed = []
-        failed = []
+        project = ProjectSnapshot.of(project_path)
+        results = CheckResults()
         
-        agents_path = project_path / "AGENTS.md"
-        
-        if not agents_path.exists():
-            failed.append("❌ AGENTS.md missing")
-            return passed, failed
+        if not project.exists("AGENTS.md"):
+            results.add("uv.agents_md.exists", False, "AGENTS.md")
+            return results
         
         try:
-            agents_content = agents_path.read_text()
-            
-            uv_indicators = [
-                "UV-ONLY", 
-                "uv pip install",
-                "uv run",
-                "MANDATORY",
-                "UV-First"
-            ]
-            
-            found_indicators = []
-            for indicator in uv_indicators:
-                if indicator in agents_content:
-                    found_indicators.append(indicator)
+            scan = project.scan("AGENTS.md")
             
-            if len(found_indicators) >= 3:
-                passed.append("✅ AGENTS.md contains UV-first requirements")
-            else:
-                failed.append("❌ AGENTS.md missing UV-first requirements section")
-                failed.append(f"   → Found only: {found_indicators}")
-                failed.append("   → Must include UV-ONLY, uv pip install, uv run instructions")
-            
-            # Check for forbidden patterns
-            forbidden_patterns = [
-                "pip install",
-                "python -m pip", 
-                "python script.py",
-                "pytest",
-                "python -m venv"
-            ]
+            found_indicators = [indicator for indicator in UV_INDICATORS if scan.found(indicator)]
+            results.add("uv.agents_md.uv_section", len(found_indicators) >= 3,
+                        "AGENTS.md", (found_indicators,))
             
-            for pattern in forbidden_patterns:
-                if pattern in agents_content and "uv run" not in agents_content[agents_content.find(pattern)-20:agents_content.find(pattern)+50]:
-                    failed.append(f"❌ AGENTS.md contains forbidden pattern: {pattern}")
-                    failed.append("   → Must be prefixed with 'uv run' or replaced with UV equivalent")
+            # Check every occurrence of the forbidden patterns
+            uv_run_offsets = [hit.offset for hit in scan.hits["uv run"]]
+            uv_pip_offsets = {hit.offset + len("uv ") for hit in scan.hits["uv pip install"]}
+            before, after = UV_RUN_WINDOW
+            for pattern in FORBIDDEN_PATTERNS:
+                violations = []
+                for hit in scan.hits[pattern]:
+                    # `uv pip install` is the sanctioned form of `pip install`
+                    if hit.offset in uv_pip_offsets:
+                        continue
+                    if any(hit.offset - before <= offset <= hit.offset + after - len("uv run")
+                           for offset in uv_run_offsets):
+                        continue
+                    violations.append(hit.location())
+                if violations:
+                    results.add("uv.agents_md.forbidden_pattern", False, "AGENTS.md",
+                                (pattern, ", ".join(violations)))
                     
         except Exception as e:
-            failed.append(f"❌ Error reading AGENTS.md: {e}")
+            results.add("uv.agents_md.read_error", False, "AGENTS.md", (str(e),))
         
-        return passed, failed
+        return results
     
-    def check_for_legacy_files(self, project_path: Path) -> Tuple[List[str], List[str]]:
+    def check_for_legacy_files(self, project_path: ProjectLike) -> CheckResults:
         """Check for legacy Python dependency files that should not exist"""
-        passed = []
-        failed = []
-        
-        legacy_files = [
-            "requirements.txt",
-            "requirements-dev.txt", 
-            "dev-requirements.txt",
-            "setup.py",
-            "setup.cfg",
-            "Pipfile",
-            "Pipfile.lock",
-            "environment.yml",  # conda
-            "conda.yaml"
-        ]
-        
-        for legacy_file in legacy_files:
-            file_path = project_path / legacy_file
-            if file_path.exists():
-                failed.append(f"❌ Legacy file found: {legacy_file}")
-                failed.append("   → Remove and migrate to pyproject.toml with UV")
-            else:
-                passed.append(f"✅ No legacy file: {legacy_file}")
-        
-        return passed, failed
+        project = ProjectSnapshot.of(project_path)
+        return run_rules(self.plan.legacy_files, project)
+    
+    def check_nested_legacy_files(self, project_path: ProjectLike) -> CheckResults:
+        """Check for legacy dependency files anywhere below the project root"""
+        project = ProjectSnapshot.of(project_path)
+        results = CheckResults()
+        for path in project.walk().nested(LEGACY_FILES):
+            results.add("uv.legacy_file", False, path)
+        return results
+    
+    def is_python_project(self, project_path: ProjectLike) -> bool:
+        """Check whether a project has any Python project marker file"""
+        project = ProjectSnapshot.of(project_path)
+        return any(project.exists(f) for f in PYTHON_PROJECT_FILES)
     
-    def validate_uv_compliance(self, project_path: str) -> Dict[str, Any]:
-        """Perform complete UV compliance validation"""
+    def validate_uv_compliance(self, project_path: str, snapshot: ProjectSnapshot = None,
+                               checks: Iterable[str] = UV_CHECKS,
+                               require_python: bool = True,
+                               reuse: Dict[str, CheckResults] = None,
+                               outcomes: Dict[str, CheckResults] = None,
+                               on_check: Callable[[str, CheckResults], None] = None) -> Dict[str, Any]:
+        """Perform UV compliance validation, limited to the named checks (default: all).
+
+        require_python=False also validates a workspace root whose Python
+        packages live in subdirectories. Checks named in reuse take their
+        outcome from it instead of running; every check's outcome is also
+        recorded in outcomes, when given, and passed to
+        on_check(check_name, outcome) as soon as the check finishes.
+        """
         project_path = Path(project_path)
+        if snapshot is None:
+            snapshot = ProjectSnapshot(project_path)
         
-        if not project_path.exists():
+        if not snapshot.root_exists:
             return {
                 "error": f"Project path does not exist: {project_path}",
                 "uv_compliant": False
             }
         
         # Check if this is a Python project
-        if not (project_path / "pyproject.toml").exists() and not any([
-            (project_path / f).exists() for f in ["setup.py", "requirements.txt", "Pipfile"]
-        ]):
+        if require_python and not self.is_python_project(snapshot):
             return {
                 "error": "Not a Python project",
                 "uv_compliant": False
             }
         
-        # Run all UV validations
-        all_passed = []
-        all_failed = []
+        # Run the requested UV validations
+        checks = frozenset(checks)
+        results = CheckResults()
+        
+        def run(check_name: str, check: Callable[[], CheckResults]):
+            if check_name not in checks:
+                return
+            outcome = reuse[check_name] if reuse and check_name in reuse else check()
+            if outcomes is not None:
+                outcomes[check_name] = outcome
+            results.extend(outcome)
+            if on_check is not None:
+                on_check(check_name, outcome)
         
         # Check UV installation
-        uv_installed, uv_message = self.check_uv_installed()
-        if uv_installed:
-            all_passed.append(f"✅ {uv_message}")
-        else:
-            all_failed.append(f"❌ {uv_message}")
+        def uv_installed() -> CheckResults:
+            installed = CheckResults()
+            uv_installed, uv_message = self.check_uv_installed()
+            installed.add("uv.installed", uv_installed, "", (uv_message,))
+            return installed
+        run("uv_installed", uv_installed)
         
         # Project structure validation
-        passed, failed = self.validate_project_structure(project_path)
-        all_passed.extend(passed)
-        all_failed.extend(failed)
+        run("project_structure", lambda: self._run_check(
+            snapshot, "project_structure",
+            lambda: self.validate_project_structure(snapshot)))
         
         # pyproject.toml validation
-        passed, failed = self.validate_pyproject_toml(project_path)
-        all_passed.extend(passed)
-        all_failed.extend(failed)
+        run("pyproject_toml", lambda: self._run_check(
+            snapshot, "pyproject_toml",
+            lambda: self.validate_pyproject_toml(snapshot)))
+        
+        # uv.lock consistency with pyproject.toml
+        run("lock_file", lambda: self._run_check(
+            snapshot, "lock_file",
+            lambda: self.validate_lock_file(snapshot)))
         
         # .gitignore validation
-        passed, failed = self.validate_gitignore(project_path)
-        all_passed.extend(passed)
-        all_failed.extend(failed)
+        run("gitignore", lambda: self._run_check(
+            snapshot, "gitignore",
+            lambda: self.validate_gitignore(snapshot)))
         
         # AGENTS.md UV section validation
-        passed, failed = self.validate_agents_md_uv_section(project_path)
-        all_passed.extend(passed)
-        all_failed.extend(failed)
+        run("agents_md_uv_section", lambda: self._run_check(
+            snapshot, "agents_md_uv_section",
+            lambda: self.validate_agents_md_uv_section(snapshot)))
         
         # Legacy files check
-        passed, failed = self.check_for_legacy_files(project_path)
-        all_passed.extend(passed)
-        all_failed.extend(failed)
+        run("legacy_files", lambda: self._run_check(
+            snapshot, "legacy_files",
+            lambda: self.check_for_legacy_files(snapshot)))
+        
+        # Nested legacy files; not cached since they depend on the whole tree
+        def nested_legacy_files() -> CheckResults:
+            with profiling.span("uv:nested_legacy_files"):
+                return self.check_nested_legacy_files(snapshot)
+        run("nested_legacy_files", nested_legacy_files)
         
         # Calculate compliance
-        total_checks = len(all_passed) + len(all_failed)
-        score = len(all_passed)
+        score, total_checks = results.scored
         percentage = (score / total_checks * 100) if total_checks > 0 else 0
         
         return {
             "project_path": str(project_path),
             "uv_compliant": percentage >= 90,
-            "passed": all_passed,
-            "failed": all_failed,
+            "checks": results.to_dict(),
             "score": score,
             "total": total_checks,
+            "warnings": results.warning_count,
             "percentage": percentage,
             "compliance_level": self._get_compliance_level(percentage)
         }
@@ -334,19 +412,23 @@ def main():
     """CLI interface for UV validation"""
     import sys
     import argparse
-    import json
     
     parser = argparse.ArgumentParser(description="UV-First Python Project Validator")
     parser.add_argument("project_path", help="Path to Python project to validate")
-    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--format", choices=FORMATS, default="text",
+                        help="Output format: text, a JSON document, or streamed NDJSON records")
+    parser.add_argument("--json", action="store_const", const="json", dest="format",
+                        help="Same as --format json")
     
     args = parser.parse_args()
     
     validator = UVValidator()
     result = validator.validate_uv_compliance(args.project_path)
     
-    if args.json:
-        print(json.dumps(result, indent=2))
+    if args.format == "json":
+        write_json(result)
+    elif args.format == "ndjson":
+        write_ndjson(validator_records("uv", result))
     else:
         if "error" in result:
             print(f"Error: {result['error']}")
@@ -355,17 +437,28 @@ def main():
         print(f"Project: {result['project_path']}")
         print(f"UV Compliance: {'✅ YES' if result['uv_compliant'] else '❌ NO'}")
         print(f"Score: {result['score']}/{result['total']} ({result['percentage']:.1f}%)")
+        if result.get('warnings'):
+            print(f"Warnings: {result['warnings']} (not scored)")
         print(f"Level: {result['compliance_level']}")
         print()
         
-        if result['passed']:
+        passed = render_checks(result['checks'], passed=True)
+        failed = render_checks(result['checks'], passed=False, severity=ERROR)
+        warnings = render_checks(result['checks'], passed=False, severity=WARNING)
+        
+        if passed:
             print("✅ UV Compliance Checks Passed:")
-            for check in result['passed']:
+            for check in passed:
                 print(f"  {check}")
         
-        if result['failed']:
+        if failed:
             print("\n❌ UV Compliance Issues:")  
-            for check in result['failed']:
+            for check in failed:
+                print(f"  {check}")
+        
+        if warnings:
+            print("\n⚠️ UV Compliance Warnings (not scored):")
+            for check in warnings:
                 print(f"  {check}")
         
         if result['uv_compliant']:
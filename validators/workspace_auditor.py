@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Workspace Auditor
+
+Audits a monorepo as a set of packages. One pruned tree walk finds every
+directory holding a project marker (pyproject.toml, package.json,
+astro.config.mjs), and each package is audited against the rules for its
+own type in the fleet process pool. Repository-wide rules (README,
+AGENTS.md, .git, and the uv rules when any package is Python) are checked
+once at the workspace root. All checks roll up into one workspace score.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from fleet_auditor import audit_fleet, is_python_project, load_validators, meets_standards
+from project_snapshot import ProjectSnapshot
+from tree_walker import WalkResult, walk_tree
+
+WORKSPACE_MARKERS = ("pyproject.toml", "package.json", "astro.config.mjs")
+
+# Repository-wide checks, run once at the workspace root
+ROOT_STRUCTURE_CHECKS = ("required_files", "agents_md", "git_setup", "git_state")
+ROOT_UV_CHECKS = ("uv_installed", "gitignore", "agents_md_uv_section")
+
+# Per-package checks; nested paths are covered by auditing every package
+PACKAGE_STRUCTURE_CHECKS = ("project_type",)
+PACKAGE_UV_CHECKS = ("pyproject_toml", "lock_file", "legacy_files")
+
+
+def discover_packages(root: Path, max_depth: Optional[int] = None) -> Tuple[List[str], WalkResult]:
+    """Package directories relative to root ("." for the root itself), and the walk"""
+    walk = walk_tree(root, WORKSPACE_MARKERS, max_depth=max_depth)
+    packages = {os.path.dirname(path) or "."
+                for paths in walk.matches.values() for path in paths}
+    return sorted(packages), walk
+
+
+def audit_package(project_path: str, validators) -> Dict[str, Any]:
+    """Audit one package against its own type rules (a fleet_auditor task)"""
+    structure_validator, uv_validator = validators
+    snapshot = ProjectSnapshot(project_path)
+    result = {
+        "project_path": str(project_path),
+        "structure": structure_validator.audit_project(
+            project_path, snapshot, PACKAGE_STRUCTURE_CHECKS),
+    }
+    if is_python_project(snapshot):
+        result["uv"] = uv_validator.validate_uv_compliance(
+            project_path, snapshot, PACKAGE_UV_CHECKS)
+    result["meets_standards"] = meets_standards(result)
+
+    if structure_validator.cache is not None:
+        structure_validator.cache.commit()
+    return result
+
+
+def audit_root(root: Path, python: bool, validators) -> Dict[str, Any]:
+    """Check the repository-wide rules at the workspace root"""
+    structure_validator, uv_validator = validators
+    snapshot = ProjectSnapshot(root)
+    result = {
+        "project_path": str(root),
+        "structure": structure_validator.audit_project(root, snapshot, ROOT_STRUCTURE_CHECKS),
+    }
+    if python:
+        result["uv"] = uv_validator.validate_uv_compliance(
+            root, snapshot, ROOT_UV_CHECKS, require_python=False)
+    result["meets_standards"] = meets_standards(result)
+
+    if structure_validator.cache is not None:
+        structure_validator.cache.commit()
+    return result
+
+
+def rollup(results: List[Dict[str, Any]]) -> Tuple[int, int]:
+    """Passed and total checks across audit results"""
+    score = total = 0
+    for result in results:
+        for validator in ("structure", "uv"):
+            if validator in result and "error" not in result[validator]:
+                score += result[validator]["score"]
+                total += result[validator]["total"]
+    return score, total
+
+
+def audit_workspace(root: Path, workers: Optional[int] = None,
+                    standards_dir: Optional[Path] = None,
+                    cache_path: Optional[Path] = None,
+                    profile: bool = False,
+                    max_depth: Optional[int] = None) -> Dict[str, Any]:
+    """Audit the workspace root and every package under it.
+
+    Package results keep their worker's span statistics under "profile"
+    when profile=True, as with fleet_auditor.audit_fleet().
+    """
+    root = Path(root).resolve()
+    packages, walk = discover_packages(root, max_depth)
+    paths = {str(root / package) if package != "." else str(root): package
+             for package in packages}
+
+    package_results = []
+    for result in audit_fleet(list(paths), workers, standards_dir, cache_path,
+                              profile, task=audit_package):
+        result["package"] = paths[result["project_path"]]
+        package_results.append(result)
+    package_results.sort(key=lambda result: result["package"])
+
+    validators = load_validators(standards_dir, cache_path)
+    python = any("uv" in result for result in package_results)
+    root_result = audit_root(root, python, validators)
+
+    score, total = rollup([root_result] + package_results)
+    percentage = (score / total * 100) if total > 0 else 0
+    return {
+        "workspace_path": str(root),
+        "root": root_result,
+        "packages": package_results,
+        "score": score,
+        "total": total,
+        "percentage": percentage,
+        "quality_level": validators[0]._get_quality_level(percentage),
+        "meets_standards": all(result["meets_standards"]
+                               for result in [root_result] + package_results),
+        "tree_walk": walk.to_dict(),
+    }
+
+
+def main():
+    """CLI interface for workspace auditing"""
+    import sys
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Workspace (monorepo) Auditor")
+    parser.add_argument("root", help="Workspace root directory")
+    parser.add_argument("--workers", "-j", type=int, help="Number of worker processes")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the audit cache")
+
+    args = parser.parse_args()
+
+    cache_path = None
+    if not args.no_cache:
+        from audit_cache import default_cache_path
+        cache_path = default_cache_path()
+
+    result = audit_workspace(Path(args.root), args.workers, cache_path=cache_path)
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        for package in [result["root"]] + result["packages"]:
+            status = "✅" if package["meets_standards"] else "❌"
+            print(f"{status} {package.get('package', '(workspace root)')}")
+        print(f"Workspace score: {result['score']}/{result['total']} "
+              f"({result['percentage']:.1f}%)")
+
+    sys.exit(0 if result["meets_standards"] else 1)
+
+
+if __name__ == "__main__":
+    main()